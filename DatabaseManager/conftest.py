@@ -1,3 +1,4 @@
+import random
 from datetime import datetime
 from tkinter import TclError
 
@@ -98,6 +99,48 @@ def test_file_entry_data() -> dict[str, str]:
     return fields
 
 
+@pytest.fixture(scope="module")
+def typo_address_corpus() -> list[str]:
+    """Fixture to get a corpus of addresses, about a third of them with
+    up to three typos each. The same corpus is generated every time.
+
+    Returns:
+        list[str]: The addresses.
+    """
+    rng = random.Random(0)
+    streets = [
+        "Main St",
+        "Orange Ave",
+        "Pelican Cir",
+        "Lakewood Ranch Blvd",
+        "Cortez Rd W",
+        "Manatee Ave E",
+        "Bee Ridge Rd",
+        "Emerald Harbor Dr",
+        "Whitakers Landing Dr",
+        "Pine Valley Pl",
+        "Gulf Of Mexico Dr",
+        "N Tamiami Trl",
+    ]
+    letters = "abcdefghijklmnopqrstuvwxyz"
+
+    addresses = []
+    for _ in range(3000):
+        address = list(f"{rng.randint(1, 9999)} {rng.choice(streets)}")
+        if rng.random() < 0.35:
+            for _ in range(rng.randint(1, 3)):
+                position = rng.randrange(len(address))
+                edit = rng.choice(["insert", "delete", "replace"])
+                if edit == "insert":
+                    address.insert(position, rng.choice(letters))
+                elif edit == "delete":
+                    del address[position]
+                else:
+                    address[position] = rng.choice(letters)
+        addresses.append("".join(address))
+    return addresses
+
+
 @pytest.fixture(scope="module")
 def main_app() -> Generator[MainApp, None, None]:
     """Fixture to get the main app.
@@ -1,3 +1,4 @@
+import atexit
 import logging
 import os
 from pathlib import Path
@@ -7,6 +8,8 @@ from src.county_data_collectors.county_mapper import DATA_COLLECTOR_MAP
 
 from DatabaseManager.models.access_database import AccessDB
 from DatabaseManager.models.encryption_manager import EncryptionManager
+from DatabaseManager.models.parcel_locations import ParcelLocationCache
+from DatabaseManager.models.query_monitor import QueryMonitor
 from DatabaseManager.models.settings_manager import SettingsManager
 
 # --- Titles and Labels ---
@@ -19,6 +22,7 @@ DATA_DIRECTORY = ROOT / "data"
 SERVER_DIRECTORY = Path("//server")
 SERVER_ACCESS_DIRECTORY = SERVER_DIRECTORY / "access"
 LOG_FILE_PATH = ROOT / "gui.log"
+SLOW_QUERY_LOG_PATH = ROOT / "slow_queries.log"
 ENV_PATH = DATA_DIRECTORY / ".env"
 
 
@@ -122,7 +126,33 @@ ACCESS_DATABASE_PATH = (
     SERVER_ACCESS_DIRECTORY / "Database Backup" / "MainDB_be.accdb"
 )
 ACCESS_DATABASE_PATH = fix_server_directory_path(ACCESS_DATABASE_PATH)
-ACCESS_DATABASE = AccessDB(ACCESS_DATABASE_PATH)
+
+# Statements slower than the threshold, in milliseconds, are written to
+# the slow query log. A summary of every statement is logged on exit.
+SLOW_QUERY_THRESHOLD_MS = float(
+    os.getenv("SLOW_QUERY_THRESHOLD_MS") or QueryMonitor.DEFAULT_SLOW_QUERY_MS
+)
+QUERY_MONITOR = QueryMonitor(SLOW_QUERY_LOG_PATH, SLOW_QUERY_THRESHOLD_MS)
+atexit.register(QUERY_MONITOR.log_summary)
+
+ACCESS_DATABASE = AccessDB(ACCESS_DATABASE_PATH, DATA_DIRECTORY, QUERY_MONITOR)
+
+# Job numbers are leased to each workstation from a ledger in this
+# directory, so no two workstations generate the same job number.
+JOB_NUMBER_LEASE_DIRECTORY = SERVER_ACCESS_DIRECTORY / "job_number_leases"
+JOB_NUMBER_LEASE_DIRECTORY = fix_server_directory_path(
+    JOB_NUMBER_LEASE_DIRECTORY
+)
+
+# --- Parcel Locations ---
+# County parcel files with parcel centroids, named after their county,
+# are imported into the parcel location cache when they change.
+PARCEL_FILE_DIRECTORY = DATA_DIRECTORY / "parcel_files"
+ensure_directory_exists(PARCEL_FILE_DIRECTORY)
+PARCEL_LOCATIONS_PATH = DATA_DIRECTORY / "parcel_locations.db"
+PARCEL_LOCATIONS = ParcelLocationCache(
+    PARCEL_LOCATIONS_PATH, PARCEL_FILE_DIRECTORY
+)
 
 # --- Quotes Directory ---
 QUOTES_DIRECTORY = SERVER_ACCESS_DIRECTORY / "quotes"
@@ -1,10 +1,39 @@
+import datetime
 import logging
+import time
 import urllib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import text
+from sqlalchemy.sql.elements import TextClause
+
+from DatabaseManager.models.address_normalizer import standardize_addresses
+from DatabaseManager.models.fuzzy_scorer import FuzzyScorer
+from DatabaseManager.models.job_data_snapshot import JobDataSnapshot
+from DatabaseManager.models.job_search_index import JobSearchIndex
+from DatabaseManager.models.parcel_id_index import ParcelIdIndex
+from DatabaseManager.models.query_monitor import QueryMonitor
+from DatabaseManager.models.street_index import StreetNumberIndex
+
+# Measuring the job data's memory reads every value, so the report has
+# its own logger, which stays off while the app logs at DEBUG. Set its
+# level to DEBUG to turn the report on.
+MEMORY_LOGGER = logging.getLogger("DatabaseManager.job_data_memory")
+MEMORY_LOGGER.setLevel(logging.INFO)
 
 
 class Table:
@@ -43,9 +72,10 @@ class Table:
         "Additional Information": "",
     }
 
-    def __init__(self, name: str, columns: dict):
+    def __init__(self, name: str, columns: dict, key: str = "Job Number"):
         self.name = name
         self.columns = columns
+        self.key = key
 
     def set_data(self, column: str, data: str):
         self.columns[column] = data
@@ -68,20 +98,77 @@ class Table:
         values = ", ".join(
             [f":{column.replace(' ','')}" for column in self.columns_with_data]
         )
-        print(values)
         return values
 
+    @property
+    def sql_parameters(self) -> dict:
+        return {
+            column.replace(" ", ""): self.columns[column]
+            for column in self.columns_with_data
+        }
+
+
+class JobIndex(NamedTuple):
+    """The job data, along with the search indexes built from it. They
+    are kept together so that they are always replaced together, and a
+    search never mixes old and new job data."""
+
+    job_data: pd.DataFrame
+    search_index: JobSearchIndex
+    street_index: StreetNumberIndex
+    parcel_index: ParcelIdIndex
+
 
 class AccessDB:
     """Class to interact with the access database."""
 
     DRIVER = "{Microsoft Access Driver (*.mdb, *.accdb)}"
 
-    def __init__(self, db_path: str):
+    # Derived search columns, computed once whenever the job data is
+    # loaded so that searches do not have to normalize every row.
+    UPPER_ADDRESS_COLUMN = "Upper Property Address"
+    NORMALIZED_ADDRESS_COLUMN = "Normalized Property Address"
+    UPPER_SUBDIVISION_COLUMN = "Upper Subdivision"
+    ADDRESS_SEARCH_KEY_COLUMN = "Address Search Key"
+    SUBDIVISION_SEARCH_KEY_COLUMN = "Subdivision Search Key"
+
+    # The table each job row was read from. Only the Existing Jobs rows
+    # are pulled again by a refresh.
+    SOURCE_TABLE_COLUMN = "Source Table"
+    EXISTING_JOBS_TABLE = "Existing Jobs"
+
+    # The job data is kept for the whole session, so its columns are
+    # stored compactly. Columns with few distinct values are stored as
+    # categoricals, and every other column as Arrow-backed strings.
+    CATEGORICAL_COLUMNS = (
+        "Subdivision",
+        "Lot",
+        "Block",
+        UPPER_SUBDIVISION_COLUMN,
+        SUBDIVISION_SEARCH_KEY_COLUMN,
+        SOURCE_TABLE_COLUMN,
+    )
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+
+    # Number of rows sent in each executemany call by the bulk queries.
+    BULK_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        db_path: str,
+        cache_directory: Optional[Path] = None,
+        query_monitor: Optional[QueryMonitor] = None,
+    ):
         """Initializes the AccessDB class.
 
         Args:
             db_path (str): The path to the access database.
+            cache_directory (Optional[Path], optional): The directory
+                to keep the local job data snapshot in. No snapshot is
+                kept if None. Defaults to None.
+            query_monitor (Optional[QueryMonitor], optional): The
+                monitor to time every statement with. Statements are not
+                timed if None. Defaults to None.
         """
         connection_string = (
             r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};"
@@ -96,17 +183,44 @@ class AccessDB:
         self.engine = create_engine(connection_uri)
         logging.debug(f"Engine created: {self.engine}")
 
+        # Attached before anything runs, so the job data load is timed.
+        self.query_monitor = query_monitor
+        if query_monitor is not None:
+            query_monitor.attach(self.engine)
+
         self.session = sessionmaker(bind=self.engine)()
         logging.debug(f"Session created: {self.session}")
 
-        self.all_job_data = self.get_all_job_data()
-        logging.debug(f"All job data: {self.all_job_data}")
+        self.job_data_snapshot = None
+        if cache_directory is not None:
+            self.job_data_snapshot = JobDataSnapshot(cache_directory, db_path)
+
+        # The job data is loaded on a worker thread, so that the app can
+        # start without waiting for it. It is only waited for when it
+        # is first used.
+        self.job_data_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="JobDataLoader"
+        )
+        self.job_data_future = self.start_loading_job_data()
 
         self.query_types = {
             "INSERT": self.insert_query,
             "UPDATE": self.update_query,
         }
 
+        # Statement templates, keyed by the query type, table name and
+        # columns with data. Repeated writes of the same shape reuse the
+        # same SQL, with only the bound values changing.
+        self.statement_builders = {
+            "INSERT": self.build_insert_statement,
+            "UPDATE": self.build_update_statement,
+        }
+        self.statement_cache = {}
+
+        # Queries run inside a unit of work are committed together when
+        # the outermost unit of work ends.
+        self.unit_of_work_depth = 0
+
     def get_all_job_data(self) -> pd.DataFrame:
         """Queries the database for the existing job data, and returns
         a DataFrame with the data merged from each table.
@@ -117,6 +231,350 @@ class AccessDB:
         df = self.normalize_dataframes()
         return df
 
+    def start_loading_job_data(self) -> Future:
+        """Starts loading the existing job data on the worker thread.
+
+        Returns:
+            Future: The job data load, which resolves to the loaded job
+                data.
+        """
+        logging.info("Started loading the job data.")
+        return self.job_data_executor.submit(self.load_all_job_data)
+
+    def is_job_data_loaded(self) -> bool:
+        """Checks if the job data has finished loading, successfully or
+        not, so that using it will not block.
+
+        Returns:
+            bool: True if the job data load is done. False otherwise.
+        """
+        return self.job_data_future.done()
+
+    def wait_for_job_data(self) -> None:
+        """Blocks until the job data has loaded. Raises the load's
+        exception if it failed."""
+        self.job_data_future.result()
+
+    @property
+    def job_index(self) -> JobIndex:
+        """The job data and its search indexes. Blocks until the job
+        data has loaded. Searches should read this once, and use the
+        same job index throughout."""
+        self.wait_for_job_data()
+        return self._job_index
+
+    @property
+    def all_job_data(self) -> pd.DataFrame:
+        """The existing job data, with the derived search columns.
+        Blocks until the job data has loaded."""
+        return self.job_index.job_data
+
+    @property
+    def search_index(self) -> JobSearchIndex:
+        """The fuzzy search index over the job data. Blocks until the
+        job data has loaded."""
+        return self.job_index.search_index
+
+    @property
+    def street_index(self) -> StreetNumberIndex:
+        """The house number index over the job data. Blocks until the
+        job data has loaded."""
+        return self.job_index.street_index
+
+    def load_all_job_data(self) -> pd.DataFrame:
+        """Loads the existing job data from the database. The derived
+        search columns and the search indexes are rebuilt along with it,
+        so they always match the job data they were computed from.
+
+        Returns:
+            pd.DataFrame: The loaded job data.
+        """
+        try:
+            all_job_data = self.load_job_data_snapshot()
+            if all_job_data is None:
+                # Compacted as it is read.
+                source_key = self.get_job_data_source_key()
+                all_job_data = self.get_all_job_data()
+                self.save_job_data_snapshot(all_job_data, source_key)
+            else:
+                all_job_data = self.compact_job_data(all_job_data)
+        except Exception as e:
+            logging.error(f"Error loading the job data: {e}")
+            raise
+
+        self._job_index = self.build_job_index(all_job_data)
+        logging.info(f"Loaded {len(all_job_data)} job rows.")
+        logging.debug(f"All job data: {all_job_data}")
+        return all_job_data
+
+    def build_job_index(self, all_job_data: pd.DataFrame) -> JobIndex:
+        """Builds the search indexes over the job data.
+
+        Args:
+            all_job_data (pd.DataFrame): The job data, with the derived
+                search columns.
+
+        Returns:
+            JobIndex: The job data and its search indexes.
+        """
+        search_columns = [
+            self.ADDRESS_SEARCH_KEY_COLUMN,
+            self.SUBDIVISION_SEARCH_KEY_COLUMN,
+        ]
+        return JobIndex(
+            all_job_data,
+            JobSearchIndex(all_job_data, search_columns),
+            StreetNumberIndex(
+                all_job_data[self.UPPER_ADDRESS_COLUMN],
+                all_job_data[self.ADDRESS_SEARCH_KEY_COLUMN],
+            ),
+            ParcelIdIndex(all_job_data["Parcel ID"]),
+        )
+
+    def refresh(self, job_numbers: Iterable[str] = ()) -> Future:
+        """Starts pulling the job rows added since the job data was
+        loaded, and the given job rows, into the job data. Runs on the
+        worker thread after any load or refresh already started. If the
+        job data failed to load, it is loaded again in full instead.
+
+        Args:
+            job_numbers (Iterable[str], optional): Job numbers to pull
+                again even if they are older than the newest loaded job,
+                such as jobs that were just updated. Defaults to ().
+
+        Returns:
+            Future: The refresh, which resolves to the refreshed job
+                data.
+        """
+        if self.is_job_data_loaded() and self.job_data_future.exception():
+            self.job_data_future = self.start_loading_job_data()
+            return self.job_data_future
+
+        logging.info("Started refreshing the job data.")
+        return self.job_data_executor.submit(
+            self.refresh_job_data, tuple(job_numbers)
+        )
+
+    def refresh_job_data(self, job_numbers: tuple[str, ...]) -> pd.DataFrame:
+        """Pulls the Existing Jobs rows with a job number above the
+        newest loaded job number, and the rows with the given job
+        numbers. Those rows replace the loaded Existing Jobs rows with
+        the same job number in place, and the rest are appended, so only
+        the changed rows are converted and indexed. Rows from the other
+        tables are never replaced. The job index is swapped in one step.
+
+        Args:
+            job_numbers (tuple[str, ...]): Job numbers to pull again.
+
+        Returns:
+            pd.DataFrame: The refreshed job data.
+        """
+        job_index = self.job_index
+        job_data = job_index.job_data
+        condition, params = self.get_refresh_condition(job_data, job_numbers)
+        try:
+            changed_rows = self.read_existing_jobs(condition, params)
+        except Exception as e:
+            logging.error(f"Error refreshing the job data: {e}")
+            raise
+
+        if changed_rows.empty:
+            logging.info("No new or changed job rows to refresh.")
+            return job_data
+
+        changed_rows = self.add_search_columns(changed_rows.fillna(""))
+        changed_rows[self.SOURCE_TABLE_COLUMN] = self.EXISTING_JOBS_TABLE
+        changed_rows = changed_rows[job_data.columns].reset_index(drop=True)
+
+        replaced = (
+            job_data[self.SOURCE_TABLE_COLUMN] == self.EXISTING_JOBS_TABLE
+        ) & job_data["Job Number"].isin(changed_rows["Job Number"])
+        replaced_positions = np.flatnonzero(replaced)
+        replaced_job_numbers = job_data["Job Number"].iloc[replaced_positions]
+
+        if (
+            replaced_job_numbers.is_unique
+            and changed_rows["Job Number"].is_unique
+        ):
+            position_of = dict(
+                zip(replaced_job_numbers.astype(str), replaced_positions)
+            )
+            positions = np.array(
+                [
+                    position_of.get(job_number, -1)
+                    for job_number in changed_rows["Job Number"].astype(str)
+                ],
+                dtype=np.intp,
+            )
+            added = positions < 0
+            positions[added] = np.arange(
+                len(job_data), len(job_data) + added.sum()
+            )
+            job_data = self.update_job_rows(job_data, changed_rows, positions)
+            self._job_index = self.update_job_index(
+                job_index, job_data, positions
+            )
+        else:
+            # Rows cannot be matched up one to one, so the job data is
+            # rebuilt from the kept and pulled rows instead.
+            job_data = self.compact_job_data(
+                pd.concat(
+                    [job_data[~replaced], changed_rows],
+                    axis=0,
+                    ignore_index=True,
+                )
+            )
+            self._job_index = self.build_job_index(job_data)
+
+        logging.info(
+            f"Refreshed {len(changed_rows)} job rows, replacing"
+            f" {len(replaced_positions)}."
+        )
+        return job_data
+
+    def update_job_rows(
+        self, job_data: pd.DataFrame, rows: pd.DataFrame, positions: np.ndarray
+    ) -> pd.DataFrame:
+        """Gets a copy of the job data with the rows written at the
+        positions. Positions past the end are appended, in order. Only
+        the new rows are converted to the compact dtypes, and new values
+        in categorical columns are added to their categories.
+
+        Args:
+            job_data (pd.DataFrame): The compacted job data.
+            rows (pd.DataFrame): The new rows, with the same columns.
+            positions (np.ndarray): The position of each new row.
+
+        Returns:
+            pd.DataFrame: The updated job data.
+        """
+        replacing = positions < len(job_data)
+        columns = {}
+        for column in job_data.columns:
+            values = job_data[column]
+            new_values = rows[column].astype(str)
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                new_categories = pd.Index(new_values.unique()).difference(
+                    values.cat.categories
+                )
+                values = values.cat.add_categories(new_categories)
+            new_values = new_values.astype(values.dtype)
+
+            values = pd.concat(
+                [values, new_values[~replacing]], ignore_index=True
+            )
+            values.iloc[positions[replacing]] = new_values[replacing].array
+            columns[column] = values
+        return pd.DataFrame(columns)
+
+    def update_job_index(
+        self,
+        job_index: JobIndex,
+        job_data: pd.DataFrame,
+        positions: np.ndarray,
+    ) -> JobIndex:
+        """Updates the search indexes for job data that changed only at
+        the positions. The old job index is left unchanged, so searches
+        running on it are not affected.
+
+        Args:
+            job_index (JobIndex): The job index of the old job data.
+            job_data (pd.DataFrame): The updated job data.
+            positions (np.ndarray): The positions of the replaced and
+                appended rows.
+
+        Returns:
+            JobIndex: The job data and its updated search indexes.
+        """
+        changed_rows = job_data.iloc[positions]
+        return JobIndex(
+            job_data,
+            job_index.search_index.updated(job_data, positions),
+            job_index.street_index.updated(
+                changed_rows[self.UPPER_ADDRESS_COLUMN],
+                changed_rows[self.ADDRESS_SEARCH_KEY_COLUMN],
+                positions,
+            ),
+            job_index.parcel_index.updated(
+                changed_rows["Parcel ID"], positions
+            ),
+        )
+
+    def get_refresh_condition(
+        self, job_data: pd.DataFrame, job_numbers: tuple[str, ...]
+    ) -> tuple[str, dict]:
+        """Gets the condition for the Existing Jobs rows to refresh.
+        The watermark is the newest job number loaded from before next
+        year, so placeholder job numbers far in the future do not hide
+        the new jobs.
+
+        Args:
+            job_data (pd.DataFrame): The loaded job data.
+            job_numbers (tuple[str, ...]): Job numbers to pull again.
+
+        Returns:
+            tuple[str, dict]: The WHERE condition, and its parameters.
+        """
+        next_year = (datetime.date.today().year + 1) % 100
+        ceiling = f"{next_year:02d}000000"
+
+        loaded_job_numbers = job_data["Job Number"].astype(str)
+        below_ceiling = loaded_job_numbers[loaded_job_numbers < ceiling]
+        watermark = below_ceiling.max() if len(below_ceiling) else ""
+
+        condition = "([Job Number] > :watermark AND [Job Number] < :ceiling)"
+        params = {"watermark": watermark, "ceiling": ceiling}
+        if job_numbers:
+            placeholders = ", ".join(
+                f":job_number{position}"
+                for position in range(len(job_numbers))
+            )
+            condition += f" OR [Job Number] IN ({placeholders})"
+            params.update(
+                {
+                    f"job_number{position}": job_number
+                    for position, job_number in enumerate(job_numbers)
+                }
+            )
+        logging.debug(f"Refresh condition: {condition}, {params}")
+        return condition, params
+
+    def get_job_data_source_key(self) -> Optional[dict]:
+        """Gets the key of the backend file for the job data snapshot.
+
+        Returns:
+            Optional[dict]: The key, or None if no snapshot is kept or
+                the backend file cannot be reached.
+        """
+        if self.job_data_snapshot is None:
+            return None
+        return self.job_data_snapshot.get_source_key()
+
+    def load_job_data_snapshot(self) -> Optional[pd.DataFrame]:
+        """Loads the local snapshot of the job data, if the backend file
+        has not changed since it was taken.
+
+        Returns:
+            Optional[pd.DataFrame]: The job data, or None if there is no
+                up to date snapshot.
+        """
+        if self.job_data_snapshot is None:
+            return None
+        return self.job_data_snapshot.load(self.get_job_data_source_key())
+
+    def save_job_data_snapshot(
+        self, all_job_data: pd.DataFrame, source_key: Optional[dict]
+    ) -> None:
+        """Saves a local snapshot of the job data.
+
+        Args:
+            all_job_data (pd.DataFrame): The job data.
+            source_key (Optional[dict]): The key of the backend file,
+                taken before the job data was read from it.
+        """
+        if self.job_data_snapshot is not None:
+            self.job_data_snapshot.save(all_job_data, source_key)
+
     def normalize_dataframes(self) -> pd.DataFrame:
         """Normalizes the column names in the DataFrames for easier
         data manipulation.
@@ -124,30 +582,185 @@ class AccessDB:
         Returns:
             pd.DataFrame: The DataFrame with the normalized columns.
         """
-        existing_jobs_query = """SELECT [Address Number], [Street Name],\
- [Job Number], [subdivision], [Lot], [block] FROM [Existing Jobs]"""
-        hebb_hanskin_query = """SELECT [Street Number], [Street Name],\
+        # Each read is dominated by network I/O, so the tables are read
+        # at the same time, each on its own pooled connection. Each
+        # table is normalized on its thread as soon as it is read.
+        readers = {
+            self.EXISTING_JOBS_TABLE: self.read_existing_jobs,
+            "Hebb & Hanskin": self.read_hebb_hanskin_jobs,
+            "McKinzie": self.read_mckinzie_jobs,
+        }
+        with ThreadPoolExecutor(
+            max_workers=len(readers), thread_name_prefix="JobTableReader"
+        ) as executor:
+            futures = {
+                table_name: executor.submit(self.read_job_table, reader)
+                for table_name, reader in readers.items()
+            }
+            dfs = [
+                future.result().assign(
+                    **{self.SOURCE_TABLE_COLUMN: table_name}
+                )
+                for table_name, future in futures.items()
+            ]
+
+        df = pd.concat(dfs, axis=0, ignore_index=True).fillna("")
+        self.add_search_columns(df)
+        return self.compact_job_data(df)
+
+    def compact_job_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Converts the job data columns to their compact dtypes.
+        Columns that already have their compact dtype are kept as is.
+
+        Args:
+            df (pd.DataFrame): The merged job data, with the search
+                columns added.
+
+        Returns:
+            pd.DataFrame: The job data with compact dtypes.
+        """
+        report_memory = MEMORY_LOGGER.isEnabledFor(logging.DEBUG)
+        if report_memory:
+            MEMORY_LOGGER.debug(
+                f"Job data uses {self.get_memory_usage(df):.1f} MB before"
+                " compacting."
+            )
+        dtypes = {
+            column: (
+                "category"
+                if column in self.CATEGORICAL_COLUMNS
+                else self.STRING_DTYPE
+            )
+            for column in df.columns
+        }
+        df = df.astype(
+            {
+                column: str
+                for column, dtype in dtypes.items()
+                if df[column].dtype == object
+            }
+        ).astype(dtypes)
+        if report_memory:
+            MEMORY_LOGGER.debug(
+                f"Job data uses {self.get_memory_usage(df):.1f} MB after"
+                " compacting."
+            )
+        return df
+
+    @staticmethod
+    def get_memory_usage(df: pd.DataFrame) -> float:
+        """Gets the memory used by the DataFrame, including the values
+        its columns point to.
+
+        Args:
+            df (pd.DataFrame): The DataFrame.
+
+        Returns:
+            float: The memory usage in megabytes.
+        """
+        return df.memory_usage(deep=True).sum() / 1_000_000
+
+    def read_job_table(
+        self, reader: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Reads a job table with its reader, and logs how long it took.
+
+        Args:
+            reader (Callable[[], pd.DataFrame]): The table's reader.
+
+        Returns:
+            pd.DataFrame: The normalized rows of the table.
+        """
+        start_time = time.perf_counter()
+        df = reader()
+        elapsed_time = time.perf_counter() - start_time
+        logging.info(
+            f"{reader.__name__} read {len(df)} rows in {elapsed_time:.2f}s."
+        )
+        return df
+
+    def read_existing_jobs(
+        self, condition: str = "", params: Optional[dict] = None
+    ) -> pd.DataFrame:
+        """Reads the Existing Jobs table, with its columns normalized.
+
+        Args:
+            condition (str, optional): A WHERE condition to filter the
+                rows by. Defaults to "", which reads every row.
+            params (Optional[dict], optional): The parameters bound in
+                the condition. Defaults to None.
+
+        Returns:
+            pd.DataFrame: The normalized Existing Jobs rows.
+        """
+        query = """SELECT [Address Number], [Street Name],\
+ [Job Number], [Parcel ID], [subdivision], [Lot], [block] FROM\
+ [Existing Jobs]"""
+        if condition:
+            query += f" WHERE {condition}"
+
+        df = pd.read_sql(text(query), self.engine, params=params)
+        self.record_fetched_rows(len(df))
+        df["Subdivision"] = df["subdivision"]
+        df["Block"] = df["block"]
+        df.drop(columns=["subdivision", "block"], inplace=True)
+
+        return self.combine_address_columns(
+            df, "Property Address", "Address Number", "Street Name"
+        )
+
+    def read_hebb_hanskin_jobs(self) -> pd.DataFrame:
+        """Reads the Hebb & Hanskin table, with its columns normalized.
+
+        Returns:
+            pd.DataFrame: The normalized Hebb & Hanskin rows.
+        """
+        query = """SELECT [Street Number], [Street Name],\
  [Job Number], [Subdivision], [Lot], [Block] FROM [Hebb & Hanskin]"""
-        mckinzie_query = """SELECT [Property Address], [Subdivision],
+        df = pd.read_sql(query, self.engine)
+        self.record_fetched_rows(len(df))
+        return self.combine_address_columns(
+            df, "Property Address", "Street Number", "Street Name"
+        )
+
+    def read_mckinzie_jobs(self) -> pd.DataFrame:
+        """Reads the McKinzie table. Its columns are already normalized.
+
+        Returns:
+            pd.DataFrame: The McKinzie rows.
+        """
+        query = """SELECT [Property Address], [Subdivision],
  [Lot], [Block] FROM [McKinzie]"""
+        df = pd.read_sql(query, self.engine)
+        self.record_fetched_rows(len(df))
+        return df
 
-        df1 = pd.read_sql(existing_jobs_query, self.engine)
-        df2 = pd.read_sql(hebb_hanskin_query, self.engine)
-        df3 = pd.read_sql(mckinzie_query, self.engine)
+    def add_search_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adds the derived search columns to the job data. The
+        addresses are uppercased and standardized once here, instead of
+        on every search.
 
-        df1["Subdivision"] = df1["subdivision"]
-        df1["Block"] = df1["block"]
+        Args:
+            df (pd.DataFrame): The merged job data.
 
-        df1.drop(columns=["subdivision", "block"], inplace=True)
+        Returns:
+            pd.DataFrame: The job data with the search columns added.
+        """
+        df[self.UPPER_ADDRESS_COLUMN] = df["Property Address"].str.upper()
+        df[self.NORMALIZED_ADDRESS_COLUMN] = standardize_addresses(
+            df[self.UPPER_ADDRESS_COLUMN]
+        )
+        df[self.UPPER_SUBDIVISION_COLUMN] = df["Subdivision"].str.upper()
 
-        self.combine_address_columns(
-            df1, "Property Address", "Address Number", "Street Name"
+        # The search keys are the exact strings the fuzzy scorer
+        # compares against, so no per-row processing happens per search.
+        df[self.ADDRESS_SEARCH_KEY_COLUMN] = FuzzyScorer.process_choices(
+            df[self.NORMALIZED_ADDRESS_COLUMN]
         )
-        self.combine_address_columns(
-            df2, "Property Address", "Street Number", "Street Name"
+        df[self.SUBDIVISION_SEARCH_KEY_COLUMN] = FuzzyScorer.process_choices(
+            df[self.UPPER_SUBDIVISION_COLUMN]
         )
-
-        df = pd.concat([df1, df2, df3], axis=0, ignore_index=True).fillna("")
+        logging.debug(f"Added search columns to {len(df)} job rows.")
         return df
 
     def combine_address_columns(
@@ -191,80 +804,330 @@ class AccessDB:
         Returns:
             bool: True if query was successful. False otherwise.
         """
+        return self.run_counted_query(table, query_type, commit) is not None
+
+    def run_counted_query(
+        self,
+        table: Table,
+        query_type: str,
+        commit: bool = False,
+    ) -> Optional[int]:
+        """Runs a query on the active database engine, and counts the
+        rows it wrote.
+
+        Args:
+            table (Table): The Table object to retrieve the table name
+                and column data from.
+            query_type (str): The type of query to run with the data.
+            commit (bool): Whether or not to commit the query to the
+                database after execution. Defaults to False
+
+        Returns:
+            Optional[int]: The number of rows inserted or updated. None
+                if the query failed.
+        """
         invalid_query_type = query_type not in self.query_types.keys()
         invalid_commit_statement = not isinstance(commit, bool)
         invalid_table = not isinstance(table, Table)
 
         if invalid_query_type or invalid_commit_statement or invalid_table:
-            return False
+            return None
 
         try:
-            self.query_types[query_type](table)
-            if commit:
+            row_count = self.query_types[query_type](table)
+            if self.unit_of_work_depth:
+                logging.info(f"Queued {table.name} with {table.columns}")
+            elif commit:
                 self.session.commit()
                 logging.info(f"Committed {table.name} with {table.columns}")
             else:
                 logging.info(f"Dry run of {table.name} with {table.columns}")
-            return True
+            return row_count
 
         except Exception as e:
             logging.error(
                 f"Error running query {query_type}. {table.name},\
  {table.columns}, {e}"
             )
-            return False
+            # The unit of work rolls back every query run inside it.
+            if self.unit_of_work_depth:
+                raise
+            return None
+
+    @contextmanager
+    def unit_of_work(self, commit: bool = True) -> Iterator[None]:
+        """Runs every query inside the block in one transaction. The
+        queries are committed once, when the block ends, and if any of
+        them fails they are all rolled back and the error is raised.
+        A unit of work inside another one joins the outer one.
+
+        Args:
+            commit (bool, optional): Whether or not to commit the
+                queries to the database when the block ends. If False,
+                the queries are rolled back when the block ends, so a
+                dry run leaves nothing pending in the session. Defaults
+                to True.
+
+        Yields:
+            None: Nothing. The queries are run on this AccessDB.
+        """
+        if self.unit_of_work_depth:
+            yield
+            return
+
+        start_time = time.perf_counter()
+        self.unit_of_work_depth += 1
+        try:
+            yield
+            if commit:
+                self.session.commit()
+            else:
+                self.session.rollback()
+        except Exception as e:
+            self.session.rollback()
+            elapsed_time = time.perf_counter() - start_time
+            logging.error(
+                f"Rolled back unit of work after {elapsed_time:.2f}s. {e}"
+            )
+            raise
+        finally:
+            self.unit_of_work_depth -= 1
+
+        elapsed_time = time.perf_counter() - start_time
+        action = "Committed" if commit else "Dry run of"
+        logging.info(f"{action} unit of work in {elapsed_time:.2f}s.")
+
+    def bulk_insert(
+        self,
+        table_name: str,
+        rows: Union[Iterable[dict], pd.DataFrame],
+        batch_size: int = BULK_BATCH_SIZE,
+        commit: bool = True,
+    ) -> list[bool]:
+        """Inserts many rows into a table in one transaction.
+
+        Args:
+            table_name (str): The name of the table.
+            rows (Union[Iterable[dict], pd.DataFrame]): The rows, keyed
+                by column name. Empty values are left out of each row.
+            batch_size (int, optional): The number of rows sent in each
+                batch. Defaults to BULK_BATCH_SIZE.
+            commit (bool, optional): Whether or not to commit the rows
+                to the database. Defaults to True.
+
+        Returns:
+            list[bool]: Whether each row was written, in input order.
+        """
+        return self.run_bulk_query(
+            table_name, rows, "INSERT", batch_size, commit
+        )
+
+    def bulk_update(
+        self,
+        table_name: str,
+        rows: Union[Iterable[dict], pd.DataFrame],
+        batch_size: int = BULK_BATCH_SIZE,
+        commit: bool = True,
+    ) -> list[bool]:
+        """Updates many rows of a table, by their Job Number, in one
+        transaction.
+
+        Args:
+            table_name (str): The name of the table.
+            rows (Union[Iterable[dict], pd.DataFrame]): The rows, keyed
+                by column name. Each row needs a Job Number. Empty
+                values are left unchanged.
+            batch_size (int, optional): The number of rows sent in each
+                batch. Defaults to BULK_BATCH_SIZE.
+            commit (bool, optional): Whether or not to commit the rows
+                to the database. Defaults to True.
+
+        Returns:
+            list[bool]: Whether each row was written, in input order.
+        """
+        return self.run_bulk_query(
+            table_name, rows, "UPDATE", batch_size, commit
+        )
+
+    def run_bulk_query(
+        self,
+        table_name: str,
+        rows: Union[Iterable[dict], pd.DataFrame],
+        query_type: str,
+        batch_size: int,
+        commit: bool,
+    ) -> list[bool]:
+        """Runs a query for many rows in one transaction. Rows with the
+        same columns share a statement, and are sent with executemany in
+        batches. Rows without a Job Number are skipped. If any batch
+        fails, the whole transaction is rolled back.
+
+        Args:
+            table_name (str): The name of the table.
+            rows (Union[Iterable[dict], pd.DataFrame]): The rows, keyed
+                by column name.
+            query_type (str): The type of query to run with the rows.
+            batch_size (int): The number of rows sent in each batch.
+            commit (bool): Whether or not to commit the rows to the
+                database.
+
+        Returns:
+            list[bool]: Whether each row was written, in input order.
+        """
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.fillna("").to_dict("records")
+        tables = [Table(table_name, dict(row)) for row in rows]
+        results = [self.is_valid(table) for table in tables]
+
+        row_groups = {}
+        for position, table in enumerate(tables):
+            if results[position]:
+                columns = tuple(table.columns_with_data)
+                row_groups.setdefault(columns, []).append(position)
 
-    def insert_query(self, table: Table) -> None:
+        start_time = time.perf_counter()
+        try:
+            for positions in row_groups.values():
+                statement = self.get_statement(
+                    query_type, tables[positions[0]]
+                )
+                for start in range(0, len(positions), batch_size):
+                    batch = positions[start : start + batch_size]
+                    parameters = [
+                        tables[position].sql_parameters for position in batch
+                    ]
+                    self.session.execute(statement, parameters)
+            if commit and not self.unit_of_work_depth:
+                self.session.commit()
+        except Exception as e:
+            if self.unit_of_work_depth:
+                raise
+            self.session.rollback()
+            logging.error(
+                f"Error running bulk {query_type} on {table_name}, rolled"
+                f" back {len(tables)} rows. {e}"
+            )
+            return [False] * len(tables)
+
+        elapsed_time = time.perf_counter() - start_time
+        action = "Committed" if commit else "Dry run of"
+        logging.info(
+            f"{action} bulk {query_type} of {sum(results)} of"
+            f" {len(tables)} rows on {table_name} in {len(row_groups)}"
+            f" statements, {elapsed_time:.2f}s."
+        )
+        return results
+
+    def insert_query(self, table: Table) -> int:
         """Runs an insert query on the active database connection.
 
         Args:
             table (Table): The Table object to retrieve the table name
                 and column data from.
+
+        Returns:
+            int: The number of rows inserted.
         """
         logging.debug(
             f"Running insert query on {table.name} with {table.columns}"
         )
         if not self.is_valid(table):
-            return
-
-        query = f"INSERT INTO [{table.name}] ({table.sql_formatted_columns})\
- VALUES ({table.sql_formatted_values})"
-        logging.debug(f"Query: {query}")
+            return 0
 
-        values = {
-            column.replace(" ", ""): table.columns[column]
-            for column in table.columns_with_data
-        }
+        statement = self.get_statement("INSERT", table)
+        values = table.sql_parameters
         logging.debug(f"Values: {values}")
 
-        self.session.execute(text(query), values)
+        result = self.session.execute(statement, values)
         logging.info(f"Inserted {table.name} with {table.columns}")
+        return result.rowcount
 
-    def update_query(self, table: Table) -> None:
+    def update_query(self, table: Table) -> int:
         """Runs an update query on the active database connection.
 
         Args:
             table (Table): The Table object to retrieve the table name
                 and column data from.
+
+        Returns:
+            int: The number of rows updated.
         """
         logging.debug(
             f"Running update query on {table.name} with {table.columns}"
         )
         if not self.is_valid(table):
-            return
+            return 0
+
+        statement = self.get_statement("UPDATE", table)
+        values = table.sql_parameters
+        logging.debug(f"Values: {values}")
+
+        result = self.session.execute(statement, values)
+        logging.info(f"Updated {table.name} with {table.columns}")
+        return result.rowcount
+
+    def get_statement(self, query_type: str, table: Table) -> TextClause:
+        """Gets the statement template for the query type and the
+        table's columns with data. Each template is only built once.
+
+        Args:
+            query_type (str): The type of query, either "INSERT" or
+                "UPDATE".
+            table (Table): The Table object to retrieve the table name
+                and columns with data from.
+
+        Returns:
+            TextClause: The statement, with a named parameter for each
+                column with data.
+        """
+        key = (
+            query_type,
+            table.name,
+            table.key,
+            tuple(table.columns_with_data),
+        )
+        statement = self.statement_cache.get(key)
+        if statement is None:
+            query = self.statement_builders[query_type](table)
+            logging.debug(f"Query: {query}")
+            statement = text(query)
+            self.statement_cache[key] = statement
+        return statement
+
+    def build_insert_statement(self, table: Table) -> str:
+        """Builds an insert query with a named parameter for each of the
+        table's columns with data.
+
+        Args:
+            table (Table): The Table object to retrieve the table name
+                and columns with data from.
 
+        Returns:
+            str: The insert query.
+        """
+        return f"INSERT INTO [{table.name}] ({table.sql_formatted_columns})\
+ VALUES ({table.sql_formatted_values})"
+
+    def build_update_statement(self, table: Table) -> str:
+        """Builds an update query keyed on the table's key column, with
+        a named parameter for each of the table's columns with data.
+
+        Args:
+            table (Table): The Table object to retrieve the table name
+                and columns with data from.
+
+        Returns:
+            str: The update query.
+        """
         set_statement = ", ".join(
             [
-                f"[{column}] = '{table.columns[column]}'"
+                f"[{column}] = :{column.replace(' ', '')}"
                 for column in table.columns_with_data
             ]
         )
-
-        query = f"UPDATE [{table.name}] SET {set_statement} WHERE [Job Number]\
- = '{table.columns['Job Number']}'"
-
-        self.session.execute(text(query))
-        logging.info(f"Updated {table.name} with {table.columns}")
+        key_parameter = table.key.replace(" ", "")
+        return f"UPDATE [{table.name}] SET {set_statement} WHERE\
+ [{table.key}] = :{key_parameter}"
 
     def is_valid(self, table: Table) -> bool:
         """Checks if the table is valid.
@@ -279,10 +1142,77 @@ class AccessDB:
             return False
         if not table.columns_with_data:
             return False
-        if not table.columns.get("Job Number"):
+        if not table.columns.get(table.key):
             return False
         return True
 
+    def upsert(
+        self,
+        table: Table,
+        key: str = "Job Number",
+        known_keys: Optional[set] = None,
+        commit: bool = False,
+    ) -> Optional[str]:
+        """Updates the table's row with the same key, or inserts the row
+        if there is none. Whether the row exists is checked with a
+        single-key query. The known keys can be out of date, so they
+        only let a key they have be updated without the check, and the
+        check is still made if that update finds no row.
+
+        Args:
+            table (Table): The Table object to retrieve the table name
+                and column data from.
+            key (str, optional): The key column. Defaults to
+                "Job Number".
+            known_keys (Optional[set], optional): The keys in the
+                table, as last cached by the caller. Defaults to None,
+                which always queries the table.
+            commit (bool, optional): Whether or not to commit the query
+                to the database after execution. Defaults to False.
+
+        Returns:
+            Optional[str]: The type of query that was run, either
+                "INSERT" or "UPDATE". None if the query failed or wrote
+                no row.
+        """
+        table = Table(table.name, table.columns, key)
+        if not self.is_valid(table):
+            return None
+
+        key_value = table.columns[key]
+        if known_keys is not None and key_value in known_keys:
+            row_count = self.run_counted_query(table, "UPDATE", commit)
+            if row_count is None:
+                return None
+            if row_count:
+                return "UPDATE"
+            logging.info(f"{key_value} is no longer in {table.name}.")
+
+        row_exists = self.key_exists(table.name, key, key_value)
+        query_type = "UPDATE" if row_exists else "INSERT"
+        if not self.run_counted_query(table, query_type, commit):
+            return None
+        return query_type
+
+    def key_exists(self, table_name: str, key: str, value: str) -> bool:
+        """Checks if the table has a row with the key.
+
+        Args:
+            table_name (str): The name of the table.
+            key (str): The key column.
+            value (str): The key to look for.
+
+        Returns:
+            bool: True if the table has a row with the key. False
+                otherwise.
+        """
+        query = f"SELECT TOP 1 [{key}] FROM [{table_name}] WHERE\
+ [{key}] = :value"
+        result = self.session.execute(text(query), {"value": value})
+        row_exists = result.first() is not None
+        self.record_fetched_rows(int(row_exists))
+        return row_exists
+
     def execute_generic_query(self, query: str) -> list:
         """Executes a generic query on the database.
 
@@ -292,7 +1222,19 @@ class AccessDB:
         Returns:
             list: The results of the query.
         """
-        return self.session.execute(text(query)).fetchall()
+        rows = self.session.execute(text(query)).fetchall()
+        self.record_fetched_rows(len(rows))
+        return rows
+
+    def record_fetched_rows(self, rows: int) -> None:
+        """Reports the rows fetched by the last SELECT statement to the
+        query monitor, since the driver does not report them.
+
+        Args:
+            rows (int): The number of rows fetched.
+        """
+        if self.query_monitor is not None:
+            self.query_monitor.record_fetched_rows(rows)
 
 
 if __name__ == "__main__":
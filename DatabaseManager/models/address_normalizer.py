@@ -0,0 +1,251 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# The replacements are applied in order, each one to the result of the
+# previous ones. The fast paths below must give the same results.
+STREET_WORD_REPLACEMENTS = {
+    " ST ": " ",
+    " RD ": " ",
+    " DR ": " ",
+    " AVE ": " ",
+    " BLVD ": " ",
+    " LN ": " ",
+    " CT ": " ",
+    " PL ": " ",
+    " CIR ": " ",
+    " TRL ": " ",
+    " PKWY ": " ",
+    " HWY ": " ",
+    "N.": "NORTH",
+    "S.": "SOUTH",
+    "E.": "EAST",
+    "W.": "WEST",
+    " N ": "NORTH ",
+    " S ": "SOUTH ",
+    " E ": "EAST ",
+    " W ": "WEST ",
+    "ST.": "STREET",
+    "RD.": "ROAD",
+    "DR.": "DRIVE",
+    "AVE.": "AVENUE",
+    "BLVD.": "BOULEVARD",
+    "LN.": "LANE",
+    "CT.": "COURT",
+    "PL.": "PLACE",
+    "CIR.": "CIRCLE",
+    "TRL.": "TRAIL",
+    "PKWY.": "PARKWAY",
+    "HWY.": "HIGHWAY",
+    "EXPY.": "EXPRESSWAY",
+}
+
+UNIT_WORD_REPLACEMENTS = {
+    "APT.": "APARTMENT",
+    "UNIT": "APARTMENT",
+    "LOT": "",
+    "BLOCK": "",
+    "SECTION": "",
+    "TOWNSHIP": "",
+    "RANGE": "",
+    "SUBDIVISION": "",
+}
+
+# Applied in order while the address ends with the key. Every
+# occurrence of the key is replaced, not just the ending.
+ENDING_REPLACEMENTS = {
+    " ST": " STREET",
+    " RD": " ROAD",
+    " DR": " DRIVE",
+    " AVE": " AVENUE",
+    " BLVD": " BOULEVARD",
+    " LN": " LANE",
+    " CT": " COURT",
+    " PL": " PLACE",
+    " CIR": " CIRCLE",
+    " TRL": " TRAIL",
+    " PKWY": " PARKWAY",
+    " HWY": " HIGHWAY",
+    " E": " EAST",
+    " W": " WEST",
+    " N": " NORTH",
+    " S": " SOUTH",
+    " STREET": "",
+    " ROAD": "",
+    " DRIVE": "",
+    " AVENUE": "",
+    " BOULEVARD": "",
+    " LANE": "",
+    " COURT": "",
+    " PLACE": "",
+    " CIRCLE": "",
+    " TRAIL": "",
+    " PARKWAY": "",
+}
+
+# Replacements that need a word with a space on each side, and
+# replacements that need a period.
+SPACED_WORD_REPLACEMENTS = {
+    key: value
+    for key, value in STREET_WORD_REPLACEMENTS.items()
+    if key.startswith(" ")
+}
+ABBREVIATION_REPLACEMENTS = {
+    key: value
+    for key, value in STREET_WORD_REPLACEMENTS.items()
+    if "." in key
+}
+SPACED_WORDS = frozenset(key.strip() for key in SPACED_WORD_REPLACEMENTS)
+
+# Keys are the last words that start the ending replacements, and
+# values are the position of their replacement in the order.
+ENDING_WORD_POSITIONS = {
+    key.strip(): position
+    for position, key in enumerate(ENDING_REPLACEMENTS)
+}
+
+PARENTHESES_PATTERN = re.compile(r"\([^)]*(?:\)|$)")
+SPACES_PATTERN = re.compile(r" {2,}")
+PUNCTUATION_TABLE = str.maketrans("", "", ".,:;'")
+
+
+def replace_in_order(address: str, replacements: dict[str, str]) -> str:
+    """Applies the replacements one after another.
+
+    Args:
+        address (str): The address.
+        replacements (dict[str, str]): The replacements, in order.
+
+    Returns:
+        str: The address with the replacements applied.
+    """
+    for key, value in replacements.items():
+        address = address.replace(key, value)
+    return address
+
+
+def replace_street_words(address: str) -> str:
+    """Replaces the street suffixes, directionals and abbreviations.
+    Only the replacements that can apply to the address are run, which
+    gives the same result as running all of them in order.
+
+    Args:
+        address (str): The uppercased address.
+
+    Returns:
+        str: The address with the street words replaced.
+    """
+    # The spaced replacements only match words between two other words,
+    # and none of the replacements add a period.
+    has_spaced_words = not SPACED_WORDS.isdisjoint(address.split(" ")[1:-1])
+    has_abbreviations = "." in address
+
+    if has_spaced_words and has_abbreviations:
+        return replace_in_order(address, STREET_WORD_REPLACEMENTS)
+    if has_spaced_words:
+        return replace_in_order(address, SPACED_WORD_REPLACEMENTS)
+    if has_abbreviations:
+        return replace_in_order(address, ABBREVIATION_REPLACEMENTS)
+    return address
+
+
+def replace_street_ending(address: str) -> str:
+    """Expands or removes the street suffix at the end of the address.
+
+    Args:
+        address (str): The uppercased address.
+
+    Returns:
+        str: The address with the street ending replaced.
+    """
+    # Only one key can match the last word. Once it is replaced, the
+    # new last word can only match a key later in the order.
+    last_position = -1
+    while True:
+        _, space, last_word = address.rpartition(" ")
+        position = ENDING_WORD_POSITIONS.get(last_word, -1)
+        if not space or position <= last_position:
+            return address
+        key = " " + last_word
+        address = address.replace(key, ENDING_REPLACEMENTS[key])
+        last_position = position
+
+
+def remove_house_number(address: str) -> str:
+    """Removes the house number from the start of the address.
+
+    Args:
+        address (str): The address.
+
+    Returns:
+        str: The address without its house number.
+    """
+    house_number, space, street = address.partition(" ")
+    if space and house_number.isdigit():
+        return street
+    return address
+
+
+def remove_parentheses(address: str) -> str:
+    """Replaces every parenthesized part of the address with a space.
+    An unclosed parenthesis runs to the end of the address.
+
+    Args:
+        address (str): The address.
+
+    Returns:
+        str: The address without parenthesized parts.
+    """
+    if "(" not in address:
+        return address
+    return PARENTHESES_PATTERN.sub(" ", address)
+
+
+def standardize_address(address: str) -> str:
+    """Standardizes an address so that it can be fuzzy matched against
+    other addresses. The house number, street suffixes, directionals
+    and punctuation are normalized or removed.
+
+    Args:
+        address (str): The address to standardize.
+
+    Returns:
+        str: The standardized address.
+    """
+    if not address:
+        return ""
+
+    address = remove_house_number(address)
+    address = remove_parentheses(address.replace("None", "").strip())
+    if "  " in address:
+        address = SPACES_PATTERN.sub(" ", address)
+    address = address.upper()
+
+    address = replace_street_words(address)
+    address = address.replace("#", "")
+    address = replace_in_order(address, UNIT_WORD_REPLACEMENTS)
+    address = address.replace("-", "").replace("  ", " ")
+    address = address.translate(PUNCTUATION_TABLE)
+
+    return replace_street_ending(address).strip()
+
+
+def standardize_addresses(addresses: pd.Series) -> pd.Series:
+    """Standardizes a whole column of addresses. Each distinct address
+    is only standardized once, and the results are mapped back to the
+    column.
+
+    Args:
+        addresses (pd.Series): The addresses to standardize.
+
+    Returns:
+        pd.Series: The standardized addresses, with the same index.
+    """
+    codes, uniques = pd.factorize(addresses.fillna(""))
+    standardized = np.array(
+        [standardize_address(address) for address in uniques], dtype=object
+    )
+    return pd.Series(
+        standardized[codes], index=addresses.index, name=addresses.name
+    )
@@ -1,11 +1,26 @@
 import logging
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional
 
+import numpy as np
+import pandas as pd
 import pyperclip
 import ttkbootstrap as ttk
-from thefuzz import fuzz
 
-from DatabaseManager.constants import ACCESS_DATABASE
+from DatabaseManager.constants import (
+    ACCESS_DATABASE,
+    PARCEL_DATA_COUNTIES,
+    PARCEL_LOCATIONS,
+)
+from DatabaseManager.models.access_database import AccessDB, JobIndex
+from DatabaseManager.models.fuzzy_scorer import (
+    FuzzyScorer,
+    PropertyAddressScorer,
+    SubdivisionNameScorer,
+)
+from DatabaseManager.views.virtual_treeview import VirtualTreeview
 
 
 class CloseJobSearchModel:
@@ -13,6 +28,13 @@ class CloseJobSearchModel:
         1: "{num_results} results found.",
         2: "Keyword and Search cleared.",
         3: "{num_selections} rows copied to clipboard.",
+        4: "Please enter a house number and street name.",
+        5: "Please enter a whole number for the Search Range.",
+        6: "Please enter a Parcel ID and a County.",
+        7: "Location unavailable for Parcel ID {parcel_id}.",
+        8: "Loading job index…",
+        9: "Job index unavailable. See the log for details.",
+        10: "Please enter a Search Range of at most {max_range}.",
     }
 
     GUI_TO_PARCEL_KEY_MAP = {
@@ -21,6 +43,41 @@ class CloseJobSearchModel:
         "Plat": "SUBDIVISION",
     }
 
+    # Keys are the search types, and values are the fuzzy scorer and
+    # the job data column it scores against.
+    SEARCH_SCORERS = {
+        "Property Address": (
+            PropertyAddressScorer(),
+            AccessDB.ADDRESS_SEARCH_KEY_COLUMN,
+        ),
+        "Subdivision Name": (
+            SubdivisionNameScorer(),
+            AccessDB.SUBDIVISION_SEARCH_KEY_COLUMN,
+        ),
+    }
+
+    NEARBY_ADDRESS_SEARCH_TYPE = "Nearby Address"
+    NEARBY_PARCEL_SEARCH_TYPE = "Nearby Parcel"
+
+    # The Search Range is in house numbers for nearby addresses, and in
+    # feet for nearby parcels.
+    DEFAULT_HOUSE_NUMBER_RANGE = 100
+    DEFAULT_SEARCH_RADIUS_FEET = 500
+
+    # A parcel search measures every parcel in the grid cells the radius
+    # covers, so the radius is capped at a mile.
+    MAX_SEARCH_RADIUS_FEET = 5280
+
+    # Keystrokes are debounced by this delay before a live search
+    # starts, and finished background searches are polled for at the
+    # poll interval.
+    SEARCH_DELAY_MS = 150
+    SEARCH_POLL_MS = 20
+
+    # The job data loads in the background at startup, and is polled
+    # for at this interval until it is ready.
+    JOB_DATA_POLL_MS = 250
+
     def __init__(self, view: ttk.Frame):
         self.inputs = view.inputs
         self.info_label = view.info_label
@@ -28,78 +85,286 @@ class CloseJobSearchModel:
         self.tree = None
         self.tree_scrollbar = None
 
+        # Searches run one at a time on a worker thread. Every search
+        # gets a new generation, and results from older generations
+        # are discarded when they finish.
+        self.search_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="CloseJobSearch"
+        )
+        self.search_future = None
+        self.search_generation = 0
+        self.pending_search_id = None
+        self.last_search_inputs = None
+
+        # The changed county parcel files are imported on the worker
+        # thread before any search runs, so Nearby Parcel searches
+        # always see them.
+        self.search_executor.submit(
+            PARCEL_LOCATIONS.import_parcel_files, PARCEL_DATA_COUNTIES
+        )
+
         self.inputs["Search Keyword"].bind("<Return>", self.search_on_enter)
+        self.inputs["Search Keyword"].bind(
+            "<KeyRelease>", self.search_on_keystroke
+        )
 
-    def get_search_results(self) -> list[dict]:
-        """Gets the search results from the database.
+        if not ACCESS_DATABASE.is_job_data_loaded():
+            self.update_info_label(8)
+            self.view_frame.after(
+                self.JOB_DATA_POLL_MS, self.finish_loading_job_data
+            )
+
+    def get_search_inputs(self) -> tuple[str, str, str, str]:
+        """Gets the current search inputs.
 
         Returns:
-            list[dict]: The search results from the database.
+            tuple[str, str, str, str]: The search type, search keyword,
+                search range and county.
         """
-        search_keyword = self.inputs["Search Keyword"].get().strip()
+        fields = ("Search Type", "Search Keyword", "Search Range", "County")
+        return tuple(self.inputs[field].get().strip() for field in fields)
+
+    def prepare_search(
+        self,
+    ) -> Optional[Callable[[JobIndex], Optional[np.ndarray]]]:
+        """Validates the search inputs and prepares the search for
+        them. The inputs are read here, on the main thread, so that the
+        prepared search can safely run on a worker thread.
+
+        Returns:
+            Optional[Callable[[JobIndex], Optional[np.ndarray]]]: The
+                search, which returns the positions of the matching rows
+                in the job data of the job index. None if the inputs are
+                invalid.
+        """
+        search_type, search_keyword, _, county = self.get_search_inputs()
         if not search_keyword:
             self.update_info_label(1, num_results=0)
-            return []
+            return None
 
-        jobs_df = ACCESS_DATABASE.all_job_data
-        search_type = self.inputs["Search Type"].get().strip()
+        if search_type == self.NEARBY_ADDRESS_SEARCH_TYPE:
+            house_number = search_keyword.split(" ")[0]
+            street_key = PropertyAddressScorer().process_keyword(
+                search_keyword
+            )
+            if not house_number.isdigit() or not street_key:
+                self.update_info_label(4)
+                return None
+
+            house_number_range = self.get_search_range(
+                self.DEFAULT_HOUSE_NUMBER_RANGE
+            )
+            if house_number_range is None:
+                return None
+            return partial(
+                self.search_nearby_addresses,
+                street_key,
+                int(house_number),
+                house_number_range,
+            )
 
-        if search_type == "Property Address":
-            choices = jobs_df["Property Address"]
-        else:
-            choices = jobs_df["Subdivision"]
-
-        # Get the choices that have a fuzzy score of 75 or higher
-        fuzzy_scores = [
-            choice
-            for choice in choices
-            if self.weighted_fuzzy_score(
-                search_keyword.upper(), choice.upper(), search_type
+        if search_type == self.NEARBY_PARCEL_SEARCH_TYPE:
+            if not county:
+                self.update_info_label(6)
+                return None
+
+            search_radius = self.get_search_range(
+                self.DEFAULT_SEARCH_RADIUS_FEET, self.MAX_SEARCH_RADIUS_FEET
+            )
+            if search_radius is None:
+                return None
+            return partial(
+                self.search_nearby_parcels,
+                search_keyword,
+                county,
+                search_radius,
             )
-            >= 75
-        ]
 
-        # Get the corresponding rows in the DataFrame
-        if search_type == "Property Address":
-            matched_rows = jobs_df[
-                jobs_df["Property Address"].isin(fuzzy_scores)
-            ]
-        else:
-            matched_rows = jobs_df[jobs_df["Subdivision"].isin(fuzzy_scores)]
+        # Anything other than an address search is a subdivision search.
+        scorer, column = self.SEARCH_SCORERS.get(
+            search_type, self.SEARCH_SCORERS["Subdivision Name"]
+        )
+
+        # Get the rows that have a fuzzy score of 75 or higher
+        return partial(self.search_job_index, scorer, column, search_keyword)
+
+    def run_search(
+        self, search: Callable[[JobIndex], Optional[np.ndarray]]
+    ) -> Optional[pd.DataFrame]:
+        """Runs a prepared search. Does not touch any widgets, so that
+        it can run on a worker thread. The job index is read once, so
+        a refresh during the search cannot mix old and new job data.
+
+        Args:
+            search (Callable[[JobIndex], Optional[np.ndarray]]): The
+                prepared search.
+
+        Returns:
+            Optional[pd.DataFrame]: The matching rows, or None if the
+                search could not be run.
+        """
+        job_index = ACCESS_DATABASE.job_index
+        matched_indices = search(job_index)
+        if matched_indices is None:
+            return None
 
         # Remove duplicates
-        matched_rows = matched_rows.drop_duplicates()
+        return job_index.job_data.iloc[
+            matched_indices
+        ].drop_duplicates()
+
+    def find_matching_rows(self) -> pd.DataFrame:
+        """Searches the job data for the search inputs, and updates the
+        info label with the outcome.
+
+        Returns:
+            pd.DataFrame: The matching rows. Empty if the inputs are
+                invalid or nothing matched.
+        """
+        search = self.prepare_search()
+        if search is None:
+            return pd.DataFrame()
+
+        search_keyword = self.inputs["Search Keyword"].get().strip()
+        if not ACCESS_DATABASE.is_job_data_loaded():
+            self.update_info_label(8)
+            self.info_label.update_idletasks()
+
+        try:
+            matched_rows = self.run_search(search)
+        except Exception as e:
+            logging.error(f"Error searching for {search_keyword}: {e}")
+            self.update_info_label(9)
+            return pd.DataFrame()
+
+        if matched_rows is None:
+            self.update_info_label(7, parcel_id=search_keyword)
+            return pd.DataFrame()
         self.update_info_label(1, num_results=len(matched_rows))
+        return matched_rows
+
+    def get_search_results(self) -> list[dict]:
+        """Gets the search results from the database.
 
+        Returns:
+            list[dict]: The search results from the database.
+        """
         # Convert the DataFrame to a list of dictionaries
-        return matched_rows.to_dict("records")
+        return self.find_matching_rows().to_dict("records")
+
+    def search_job_index(
+        self,
+        scorer: FuzzyScorer,
+        column: str,
+        search_keyword: str,
+        job_index: JobIndex,
+    ) -> np.ndarray:
+        """Searches the job index for the keyword.
+
+        Args:
+            scorer (FuzzyScorer): The scorer for the search type.
+            column (str): The processed search key column to search.
+            search_keyword (str): The search keyword.
+            job_index (JobIndex): The job data and its search indexes.
+
+        Returns:
+            np.ndarray: The positions of the matching rows in the job
+                data.
+        """
+        return job_index.search_index.search(
+            scorer, column, search_keyword
+        )
+
+    def search_nearby_addresses(
+        self,
+        street_key: str,
+        house_number: int,
+        house_number_range: int,
+        job_index: JobIndex,
+    ) -> np.ndarray:
+        """Searches for jobs on the same street, within the range of
+        the house number.
+
+        Args:
+            street_key (str): The processed, standardized street name.
+            house_number (int): The house number to search around.
+            house_number_range (int): How far above and below the house
+                number to search.
+            job_index (JobIndex): The job data and its search indexes.
+
+        Returns:
+            np.ndarray: The positions of the matching rows in the job
+                data, ordered by house number.
+        """
+        logging.info(
+            f"Searching for jobs within {house_number_range} of"
+            f" {house_number} on {street_key}."
+        )
+        return job_index.street_index.search(
+            street_key, house_number, house_number_range
+        )
 
-    def weighted_fuzzy_score(
+    def search_nearby_parcels(
         self,
-        search_key: str,
-        target_key: str,
-        search_type: str,
-    ) -> int:
-        """Calculates the weighted fuzzy score for the search key and
-        target key.
+        parcel_id: str,
+        county: str,
+        search_radius: int,
+        job_index: JobIndex,
+    ) -> Optional[np.ndarray]:
+        """Searches for jobs on parcels within the search radius, in
+        feet, of the parcel's centroid. Only parcels in the county are
+        measured, since the job data has no county to tell parcels with
+        the same Parcel ID in other counties apart.
 
         Args:
-            search_key (str): The search key.
-            target_key (str): The target key.
-            search_type (str): The search type. Either "Property Address" or
-                "Subdivision".
+            parcel_id (str): The parcel ID to search around.
+            county (str): The county the parcel is in.
+            search_radius (int): The search radius in feet.
+            job_index (JobIndex): The job data and its search indexes.
 
         Returns:
-            int: The weighted fuzzy score.
+            Optional[np.ndarray]: The positions of the matching rows in
+                the job data, nearest first. None if the parcel is not in
+                the county's parcel file.
         """
+        location = PARCEL_LOCATIONS.get_location(county, parcel_id)
+        if location is None:
+            return None
 
-        if search_type == "Subdivision Name":
-            return fuzz.token_sort_ratio(search_key, target_key)
+        logging.info(
+            f"Searching for jobs within {search_radius} feet of {parcel_id}."
+        )
+        # The nearby parcels are already nearest first, and their rows
+        # come back in the same order.
+        parcel_distances = PARCEL_LOCATIONS.nearby_parcels(
+            county, *location, search_radius
+        )
+        return job_index.parcel_index.search(parcel_distances.index)
 
-        standardized_address = self.standardize_address(search_key)
-        standardized_target = self.standardize_address(target_key)
+    def get_search_range(
+        self, default: int, max_range: Optional[int] = None
+    ) -> Optional[int]:
+        """Gets the Search Range entered by the user.
 
-        return fuzz.token_sort_ratio(standardized_address, standardized_target)
+        Args:
+            default (int): The range to use if none was entered.
+            max_range (Optional[int], optional): The largest range
+                allowed. Defaults to None, which allows any range.
+
+        Returns:
+            Optional[int]: The search range, or None if it is not a
+                whole number, or is above the largest range.
+        """
+        search_range = self.inputs["Search Range"].get().strip()
+        if not search_range:
+            return default
+        if not search_range.isdigit():
+            self.update_info_label(5)
+            return None
+        if max_range is not None and int(search_range) > max_range:
+            self.update_info_label(10, max_range=max_range)
+            return None
+        return int(search_range)
 
     def copy_selected_rows(self) -> None:
         """Copies the selected rows from the treeview widget to the
@@ -122,15 +387,27 @@ class CloseJobSearchModel:
         pyperclip.copy(text_to_copy)
 
     def create_search_treeview(self) -> None:
-        """Creates a ttk.Treeview widget for displaying the search
-        results.
+        """Starts a search for the inputs on the worker thread, even if
+        they have not changed since the last search. The treeview of
+        results is created once the search finishes, so the window
+        stays responsive while it waits for the job data or the
+        county's website.
+        """
+        self.start_background_search(force=True)
+
+    def populate_search_treeview(self, matched_rows: pd.DataFrame) -> None:
+        """Replaces the existing treeview with a new one backed by the
+        matched rows. Only the rows around the view are inserted into
+        the treeview, however many rows matched.
+
+        Args:
+            matched_rows (pd.DataFrame): The search results.
         """
-        matched_rows = self.get_search_results()
-        if not matched_rows:
-            return
         self.destroy_existing_treeview()
 
-        tree = ttk.Treeview(self.view_frame, height=15, selectmode="extended")
+        tree = VirtualTreeview(
+            self.view_frame, height=15, selectmode="extended"
+        )
         tree["columns"] = (
             "Job Number",
             "Property Address",
@@ -155,47 +432,29 @@ class CloseJobSearchModel:
                 command=lambda h=heading: self.sort_treeview(tree, h, False),
             )
 
-        for index, row in enumerate(matched_rows):
-            for key, _ in row.items():
-                while "  " in row[key]:
-                    row[key] = row[key].replace("  ", " ")
-                row[key] = row[key].strip()
-                row[key] = row[key].upper().replace("NONE", "")
-
-            tree.insert(
-                parent="",
-                index="end",
-                iid=index,
-                text="",
-                values=(
-                    row["Job Number"],
-                    row["Property Address"],
-                    row["Subdivision"],
-                    row["Lot"],
-                    row["Block"],
-                ),
-            )
-
+        tree.set_data(matched_rows)
         tree.pack(side="left", fill="both", expand=True)
 
         scrollbar = ttk.Scrollbar(self.view_frame, orient="vertical")
         scrollbar.pack(side="right", fill="y")
-        tree.config(yscrollcommand=scrollbar.set)
-        scrollbar.config(command=tree.yview)
+        tree.set_scrollbar(scrollbar)
 
         self.tree_scrollbar = scrollbar
         self.tree = tree
         self.update_view_geometry()
 
     def clear_inputs(self) -> None:
-        """Clears all the input fields. Ignore the search type field."""
+        """Clears all the input fields. Ignore the search type and
+        county fields."""
         input_objects = list(self.inputs.values())
-        search_type_object = self.inputs["Search Type"]
-        input_objects.remove(search_type_object)
+        input_objects.remove(self.inputs["Search Type"])
+        input_objects.remove(self.inputs["County"])
 
         for input_field in input_objects:
             input_field.delete(0, "end")
 
+        self.cancel_pending_search()
+        self.last_search_inputs = None
         self.destroy_existing_treeview()
         self.update_info_label(2)
         input_objects[0].focus()
@@ -232,32 +491,154 @@ class CloseJobSearchModel:
         self.info_label.config(text=text)
 
     def search_on_enter(self, event) -> None:
-        """Called when the user presses the enter key. Calls the search
-        for keyword method.
+        """Called when the user presses the enter key. Starts a
+        background search right away.
 
         Args:
             event: The event object.
         """
         if event.widget == self.inputs["Search Keyword"]:
-            self.create_search_treeview()
+            self.start_background_search(force=True)
+
+    def search_on_keystroke(self, event) -> None:
+        """Called when the user types in the search keyword field.
+        Restarts the debounce timer, so that the search only starts
+        once the user pauses typing.
+
+        Args:
+            event: The event object.
+        """
+        if event.keysym == "Return":
+            return
+
+        # Parcel searches may have to query the county's website, so
+        # they only run when the user asks for them.
+        search_type = self.inputs["Search Type"].get().strip()
+        if search_type == self.NEARBY_PARCEL_SEARCH_TYPE:
+            return
+
+        self.cancel_pending_search()
+        self.pending_search_id = self.view_frame.after(
+            self.SEARCH_DELAY_MS, self.start_background_search
+        )
+
+    def cancel_pending_search(self) -> None:
+        """Cancels the debounced search, if one is waiting to start, and
+        makes any running background search stale."""
+        if self.pending_search_id:
+            self.view_frame.after_cancel(self.pending_search_id)
+            self.pending_search_id = None
+        self.search_generation += 1
+
+    def start_background_search(self, force: bool = False) -> None:
+        """Starts a search on the worker thread. Any search that has not
+        started yet is cancelled, and any running search becomes stale.
+
+        Args:
+            force (bool, optional): Whether to search even if the inputs
+                have not changed since the last search. Defaults to
+                False.
+        """
+        self.pending_search_id = None
+        search_inputs = self.get_search_inputs()
+        if search_inputs == self.last_search_inputs and not force:
+            return
+        self.last_search_inputs = search_inputs
+
+        self.cancel_pending_search()
+        if self.search_future:
+            self.search_future.cancel()
+
+        search = self.prepare_search()
+        if search is None:
+            self.destroy_existing_treeview()
+            return
+
+        self.search_future = self.search_executor.submit(
+            self.run_search, search
+        )
+        if not ACCESS_DATABASE.is_job_data_loaded():
+            self.update_info_label(8)
+        self.view_frame.after(
+            self.SEARCH_POLL_MS,
+            self.finish_background_search,
+            self.search_future,
+            self.search_generation,
+            search_inputs[1],
+        )
+
+    def finish_background_search(
+        self, future: Future, generation: int, search_keyword: str
+    ) -> None:
+        """Shows the results of a background search once it is done.
+        Runs on the main thread through after(). Results from stale
+        searches are discarded.
+
+        Args:
+            future (Future): The background search.
+            generation (int): The generation of the search.
+            search_keyword (str): The keyword that was searched for.
+        """
+        if generation != self.search_generation or future.cancelled():
+            return
+        if not future.done():
+            self.view_frame.after(
+                self.SEARCH_POLL_MS,
+                self.finish_background_search,
+                future,
+                generation,
+                search_keyword,
+            )
+            return
+
+        try:
+            matched_rows = future.result()
+        except Exception as e:
+            logging.error(f"Error searching for {search_keyword}: {e}")
+            self.update_info_label(9)
+            self.destroy_existing_treeview()
+            return
+
+        if matched_rows is None:
+            self.update_info_label(7, parcel_id=search_keyword)
+            self.destroy_existing_treeview()
+            return
+
+        self.update_info_label(1, num_results=len(matched_rows))
+        if matched_rows.empty:
+            self.destroy_existing_treeview()
+            return
+        self.populate_search_treeview(matched_rows)
+
+    def finish_loading_job_data(self) -> None:
+        """Clears the loading status once the job data has loaded, or
+        shows that it is unavailable. Runs on the main thread through
+        after()."""
+        if not ACCESS_DATABASE.is_job_data_loaded():
+            self.view_frame.after(
+                self.JOB_DATA_POLL_MS, self.finish_loading_job_data
+            )
+            return
+
+        if ACCESS_DATABASE.job_data_future.exception():
+            self.update_info_label(9)
+        elif self.info_label.cget("text") == self.INFO_LABEL_CODES[8]:
+            self.info_label.config(text="")
 
     def sort_treeview(
-        self, tree: ttk.Treeview, col: str, reverse: bool
+        self, tree: VirtualTreeview, col: str, reverse: bool
     ) -> None:
         """Sorts the treeview contents when the user clicks on a column
         heading.
 
         Args:
-            tree (ttk.Treeview): The treeview widget.
+            tree (VirtualTreeview): The treeview widget.
             col (str): The column to sort.
             reverse (bool): Whether to sort in reverse order.
         """
-        items = [(tree.set(key, col), key) for key in tree.get_children("")]
-        items.sort(reverse=reverse)
-
-        # Rearrange items in sorted positions
-        for index, (_, key) in enumerate(items):
-            tree.move(key, "", index)
+        # The backing data is sorted, and only the rows in view are
+        # inserted again.
+        tree.sort_by(col, reverse)
 
         # Reverse sort next time
         tree.heading(
@@ -272,126 +653,4 @@ class CloseJobSearchModel:
         """
         if not self.tree:
             return
-        selection_index = self.tree.selection()
-        if not selection_index:
-            return
-
-        rows = [self.tree.item(row, "values") for row in selection_index]
-        return rows
-
-    def standardize_address(self, address: str) -> str:
-        if not address:
-            return ""
-
-        split_address = address.split(" ")
-        if len(split_address) > 1:
-            if split_address[0].isdigit():
-                address = " ".join(split_address[1:])
-
-        address = address.replace("None", "").strip()
-
-        while "(" in address:
-            starting_point = address.index("(")
-            if ")" in address:
-                ending_point = address.index(")")
-            else:
-                ending_point = len(address) - 1
-            address = (
-                address[:starting_point] + " " + address[ending_point + 1 :]
-            )
-
-        while "  " in address:
-            address = address.replace("  ", " ")
-
-        string_format_abbr = {
-            " ST ": " ",
-            " RD ": " ",
-            " DR ": " ",
-            " AVE ": " ",
-            " BLVD ": " ",
-            " LN ": " ",
-            " CT ": " ",
-            " PL ": " ",
-            " CIR ": " ",
-            " TRL ": " ",
-            " PKWY ": " ",
-            " HWY ": " ",
-            "N.": "NORTH",
-            "S.": "SOUTH",
-            "E.": "EAST",
-            "W.": "WEST",
-            " N ": "NORTH ",
-            " S ": "SOUTH ",
-            " E ": "EAST ",
-            " W ": "WEST ",
-            "ST.": "STREET",
-            "RD.": "ROAD",
-            "DR.": "DRIVE",
-            "AVE.": "AVENUE",
-            "BLVD.": "BOULEVARD",
-            "LN.": "LANE",
-            "CT.": "COURT",
-            "PL.": "PLACE",
-            "CIR.": "CIRCLE",
-            "TRL.": "TRAIL",
-            "PKWY.": "PARKWAY",
-            "HWY.": "HIGHWAY",
-            "EXPY.": "EXPRESSWAY",
-            "#": "",
-            "APT.": "APARTMENT",
-            "UNIT": "APARTMENT",
-            "LOT": "",
-            "BLOCK": "",
-            "SECTION": "",
-            "TOWNSHIP": "",
-            "RANGE": "",
-            "SUBDIVISION": "",
-            "-": "",
-            "  ": " ",
-            ".": "",
-            ",": "",
-            ":": "",
-            ";": "",
-            "'": "",
-        }
-
-        address = address.upper()
-
-        for key, value in string_format_abbr.items():
-            address = address.replace(key, value)
-
-        ending_replacements = {
-            " ST": " STREET",
-            " RD": " ROAD",
-            " DR": " DRIVE",
-            " AVE": " AVENUE",
-            " BLVD": " BOULEVARD",
-            " LN": " LANE",
-            " CT": " COURT",
-            " PL": " PLACE",
-            " CIR": " CIRCLE",
-            " TRL": " TRAIL",
-            " PKWY": " PARKWAY",
-            " HWY": " HIGHWAY",
-            " E": " EAST",
-            " W": " WEST",
-            " N": " NORTH",
-            " S": " SOUTH",
-            " STREET": "",
-            " ROAD": "",
-            " DRIVE": "",
-            " AVENUE": "",
-            " BOULEVARD": "",
-            " LANE": "",
-            " COURT": "",
-            " PLACE": "",
-            " CIRCLE": "",
-            " TRAIL": "",
-            " PARKWAY": "",
-        }
-
-        for key, value in ending_replacements.items():
-            if address.endswith(key):
-                address = address.replace(key, value)
-
-        return address.strip()
+        return self.tree.get_selected_values()
@@ -1,11 +1,21 @@
+import atexit
 from datetime import datetime
 import logging
+from typing import Optional
 
 import ttkbootstrap as ttk
 
-from DatabaseManager.constants import ACCESS_DATABASE, PARCEL_DATA_COUNTIES
+from DatabaseManager.constants import (
+    ACCESS_DATABASE,
+    JOB_NUMBER_LEASE_DIRECTORY,
+    PARCEL_DATA_COUNTIES,
+)
 from DatabaseManager.models.access_database import Table
 from DatabaseManager.models.data_collection import DataCollector
+from DatabaseManager.models.job_number_reservation import (
+    JobNumberReservation,
+    JobNumberReservationError,
+)
 from DatabaseManager.models.job_number_storage import JobNumberStorage
 from sqlalchemy import text
 
@@ -41,6 +51,32 @@ class DatabaseHelper:
         """
         ACCESS_DATABASE.run_query(table, "INSERT", commit)
 
+    def upsert_table(
+        self,
+        table: Table,
+        commit: bool = True,
+        known_job_numbers: Optional[set[str]] = None,
+    ) -> Optional[str]:
+        """Updates the given table's row with the same job number, or
+        inserts the row if there is none.
+
+        Args:
+            table (Table): The table to write the data to.
+            commit (bool, optional): Whether or not to commit the
+                changes to the database. Defaults to True.
+            known_job_numbers (Optional[set[str]], optional): The
+                cached job numbers of the table, which only let a cached
+                job number be updated without querying the table first.
+                Defaults to None, which queries the table.
+
+        Returns:
+            Optional[str]: The type of query that was run, either
+                "INSERT" or "UPDATE". None if the query failed.
+        """
+        return ACCESS_DATABASE.upsert(
+            table, known_keys=known_job_numbers, commit=commit
+        )
+
     def gather_existing_job_contacts(self, job_number: str) -> tuple:
         """Gathers the existing job contacts from the access database.
 
@@ -55,7 +91,9 @@ class DatabaseHelper:
     [Existing Jobs] WHERE [Job Number] = '{job_number}'"
                 )
             )
-            return existing_job_contacts.fetchall()
+            existing_job_contacts = existing_job_contacts.fetchall()
+            ACCESS_DATABASE.record_fetched_rows(len(existing_job_contacts))
+            return existing_job_contacts
         except Exception as e:
             logging.error(f"Error gathering existing job contacts: {e}")
             return []
@@ -81,6 +119,7 @@ class FileEntryModel:
         16: "Please enter a valid Job Number.",
         17: "Unable to retrieve data for job number {job_number}.",
         18: "Existing job contacts retrieved for job number {job_number}.",
+        19: "Error: Unable to reserve a new job number. Please try again.",
     }
 
     GUI_TO_PARCEL_KEY_MAP = {
@@ -94,6 +133,10 @@ class FileEntryModel:
         self.info_label = info_label
         self.database_helper = DatabaseHelper()
         self.job_number_storage = JobNumberStorage(ACCESS_DATABASE)
+        self.job_number_reservation = JobNumberReservation(
+            JOB_NUMBER_LEASE_DIRECTORY, self.job_number_storage
+        )
+        atexit.register(self.job_number_reservation.release)
 
     def gather_job_data(self) -> dict:
         """Gathers the job data from the user inputs and the parcel data
@@ -182,18 +225,22 @@ class FileEntryModel:
 
         return existing_job_table, active_job_table
 
-    def handle_existing_active_job(
+    def upsert_job(
         self,
         job_number: str,
         existing_job_table: Table,
         active_job_table: Table,
         commit: bool = True,
     ) -> None:
-        """Handles the case where the job number already exists in the
-        database and is active.
+        """Writes the job to the Existing Jobs and Active Jobs tables in
+        one unit of work. Each row is updated if it exists, and inserted
+        otherwise, so a new job is created, an inactive job is
+        activated, and an active job is updated. Whether a row exists is
+        checked in the table inside the unit of work, and the cached job
+        numbers are only used if they are already loaded.
 
         Args:
-            job_number (str): The job number to be updated.
+            job_number (str): The job number to be written.
             existing_job_table (Table): The existing job table.
             active_job_table (Table): The active job table.
             commit (bool, optional): Whether or not to commit the
@@ -201,70 +248,60 @@ class FileEntryModel:
         """
         self.update_info_label(10, job_number=job_number)
         try:
-            logging.info(f"Updating job number {job_number}...")
-            self.database_helper.update_table(existing_job_table, commit)
-            self.database_helper.update_table(active_job_table, commit)
-            self.update_info_label(11, job_number=job_number)
-            logging.info(f"Job Number {job_number} updated.")
+            logging.info(f"Writing job number {job_number}...")
+            with ACCESS_DATABASE.unit_of_work(commit):
+                existing_job_query = self.upsert_job_row(
+                    existing_job_table, commit
+                )
+                active_job_query = self.upsert_job_row(
+                    active_job_table, commit
+                )
         except Exception as e:
             logging.error(e)
             self.update_info_label(13, job_number=job_number)
+            return
 
-    def handle_existing_inactive_job(
-        self,
-        job_number: str,
-        existing_job_table: Table,
-        active_job_table: Table,
-        commit: bool = True,
-    ) -> None:
-        """Handles the case where the job number already exists in the
-        database but is not active.
+        # The job is now in both tables.
+        if commit:
+            self.job_number_storage.add_job_number(job_number)
 
-        Args:
-            job_number (str): The job number to be updated.
-            existing_job_table (Table): The existing job table.
-            active_job_table (Table): The active job table.
-            commit (bool, optional): Whether or not to commit the
-                changes to the database. Defaults to True.
-        """
-        self.update_info_label(10, job_number=job_number)
-        try:
-            logging.info(f"Activating job number {job_number}...")
-            self.database_helper.update_table(existing_job_table, commit)
-            self.database_helper.insert_into_table(active_job_table, commit)
+        if existing_job_query == "INSERT":
+            self.update_info_label(15, job_number=job_number)
+            logging.info(f"Job Number {job_number} created.")
+        elif active_job_query == "INSERT":
             self.update_info_label(14, job_number=job_number)
             logging.info(f"Job Number {job_number} activated.")
-        except Exception as e:
-            logging.error(e)
-            self.update_info_label(13, job_number=job_number)
+        else:
+            self.update_info_label(11, job_number=job_number)
+            logging.info(f"Job Number {job_number} updated.")
 
-    def handle_new_job(
-        self,
-        job_number: str,
-        existing_job_table: Table,
-        active_job_table: Table,
-        commit: bool = True,
-    ) -> None:
-        """Handles the case where the job number does not exist in the
-        database.
+    def upsert_job_row(self, table: Table, commit: bool = True) -> str:
+        """Writes the job's row to the table. Meant to be called inside
+        a unit of work, which a failed write rolls back.
 
         Args:
-            job_number (str): The job number to be updated.
-            existing_job_table (Table): The existing job table.
-            active_job_table (Table): The active job table.
+            table (Table): The table to write the row to.
             commit (bool, optional): Whether or not to commit the
                 changes to the database. Defaults to True.
+
+        Raises:
+            RuntimeError: If the row was not written.
+
+        Returns:
+            str: The type of query that was run, either "INSERT" or
+                "UPDATE".
         """
-        self.update_info_label(12, job_number=job_number)
-        try:
-            logging.info(f"Creating new job number {job_number}...")
-            self.database_helper.insert_into_table(existing_job_table, commit)
-            self.database_helper.insert_into_table(active_job_table, commit)
-            self.update_info_label(15, job_number=job_number)
-            logging.info(f"Job Number {job_number} created.")
-        except Exception as e:
-            logging.error(e)
-            self.update_info_label(13, job_number=job_number)
+        query_type = self.database_helper.upsert_table(
+            table,
+            commit,
+            self.job_number_storage.get_cached_job_numbers(table.name),
+        )
+        if query_type is None:
+            raise RuntimeError(
+                f"Unable to write job number {table.columns['Job Number']}"
+                f" to {table.name}."
+            )
+        return query_type
 
     def submit_job_data(self, commit: bool = True) -> None:
         """Submits the job data to the access database. If the job
@@ -285,36 +322,27 @@ class FileEntryModel:
         job_number = job_data["Job Number"]
 
         existing_job_table, active_job_table = self.configure_tables(job_data)
+        self.upsert_job(
+            job_number, existing_job_table, active_job_table, commit
+        )
 
-        job_exists = job_number in self.job_number_storage.existing_job_numbers
-        job_is_active = job_number in self.job_number_storage.active_job_numbers
-
-        if job_exists and job_is_active:
-            logging.info("Updating active job.")
-            self.handle_existing_active_job(
-                job_number, existing_job_table, active_job_table, commit
-            )
-        elif job_exists and not job_is_active:
-            logging.info("Inserting existing job into active jobs.")
-            self.handle_existing_inactive_job(
-                job_number, existing_job_table, active_job_table, commit
-            )
-        elif not job_exists:
-            logging.info("Creating new job.")
-            self.handle_new_job(
-                job_number, existing_job_table, active_job_table, commit
-            )
-        else:
-            logging.info("Error submitting job data.")
-            self.update_info_label(12, job_number=job_number)
+        # Pull the submitted job into the job index, so that it can be
+        # searched for right away.
+        if commit:
+            ACCESS_DATABASE.refresh([job_number])
 
     def generate_fn(self) -> None:
         """Generates a new job number for the user. The job number is
         generated by taking the current year and adding a number to the
-        end of it. The number is the next unused job number in the
-        database."""
+        end of it. The number is leased to this workstation, so other
+        workstations are not given the same number."""
         logging.info("Generating new job number...")
-        unused_job_number = self.job_number_storage.unused_job_number
+        try:
+            unused_job_number = self.job_number_reservation.next_job_number()
+        except JobNumberReservationError as e:
+            logging.error(f"Error generating new job number: {e}")
+            self.update_info_label(19)
+            return
 
         self.inputs["Job Number"].delete(0, "end")
         self.inputs["Job Number"].insert(0, unused_job_number)
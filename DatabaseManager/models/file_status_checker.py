@@ -1,12 +1,17 @@
 import logging
+import re
+from pathlib import Path
 from tkinter import Event
 from typing import List, Tuple
 from datetime import datetime
 
+import pandas as pd
 import ttkbootstrap as ttk
 
 from DatabaseManager.constants import ACCESS_DATABASE
 from DatabaseManager.models.access_database import AccessDB
+from DatabaseManager.views.batch_file_status import BatchFileStatus
+from sqlalchemy import text
 
 
 class FileStatusCheckerModel:
@@ -21,12 +26,56 @@ class FileStatusCheckerModel:
         8: "Unable to find file number or parcel ID.",
     }
 
+    # The Existing Jobs, Active Jobs and Signature Status records of a
+    # job in one round trip. The matching job numbers are gathered from
+    # all three tables first, so a job missing from any of them is still
+    # found. Parcel IDs are only looked up in Existing Jobs, as before.
+    # Access requires nested joins to be wrapped in parentheses. The job
+    # number of each joined table is selected so missing records can be
+    # told apart from empty ones, followed by the matched job number and
+    # the Active Jobs parcel ID.
+    JOB_DATA_QUERY = """SELECT e.[Job Number], e.[Parcel ID],
+ e.[Address Number], e.[Street Name], e.Lot, e.Block, e.Subdivision,
+ a.[Job Number], a.[Order Date], a.[Fieldwork Status], a.[Inhouse Status],
+ a.[County], a.[Requested Services],
+ s.[Job Number], s.[Signed], s.[Type of Survey], s.[Signature Date], s.[Notes],
+ j.[Job Number], a.[Parcel ID]
+ FROM (((SELECT [Job Number] FROM [Existing Jobs] WHERE {condition}
+ UNION SELECT [Job Number] FROM [Active Jobs] WHERE {job_number_condition}
+ UNION SELECT [Job Number] FROM [Signature Status]
+ WHERE {job_number_condition}) AS j
+ LEFT JOIN [Existing Jobs] AS e ON j.[Job Number] = e.[Job Number])
+ LEFT JOIN [Active Jobs] AS a ON j.[Job Number] = a.[Job Number])
+ LEFT JOIN [Signature Status] AS s ON j.[Job Number] = s.[Job Number]"""
+
+    # A parcel ID lookup matches no job numbers in Active Jobs or
+    # Signature Status.
+    NO_JOB_NUMBER_CONDITION = "1 = 0"
+
+    # Number of job numbers or parcel IDs looked up per batch query.
+    BATCH_CHUNK_SIZE = 100
+
+    BATCH_COLUMNS = (
+        "Entered",
+        "Found",
+        "File Number",
+        "Parcel ID",
+        "Property Address",
+        "Active",
+        "Order Date",
+        "Fieldwork Status",
+        "Inhouse Status",
+        "Signed",
+        "Signature Date",
+    )
+
     def __init__(self, view: ttk.Frame):
         self.inputs = view.inputs
         self.programmable_inputs = view.programmable_inputs
         self.info_label = view.info_label
         self.inputs["File Number"].bind("<Return>", self.on_enter)
         self.inputs["Parcel ID"].bind("<Return>", self.on_enter)
+        self.batch_window = None
 
     def lookup_file(self) -> None:
         """Looks up the file number in the database and populates the
@@ -118,11 +167,7 @@ class FileStatusCheckerModel:
         }
 
         for date in dates_to_format:
-            data_map[date] = (
-                data_map[date].strftime("%m/%d/%Y")
-                if data_map[date] and isinstance(data_map[date], datetime)
-                else ""
-            )
+            data_map[date] = self.format_date(data_map[date])
         logging.info(f"Determined data map: {data_map}.")
 
         for label, entry_data in data_map.items():
@@ -155,8 +200,10 @@ class FileStatusCheckerModel:
     def get_job_data(
         self, access_db: AccessDB, file_number: str, parcel_id: str
     ) -> Tuple[List[Tuple], List[Tuple], List[Tuple]]:
-        """Gets the job data from the database. If the job is not found,
-        an empty list will be returned.
+        """Gets the job data from the database, with one query joining
+        the job's records. The job is looked up by parcel ID if the file
+        number is not a full job number. A job is found if any of its
+        tables has it, and the records it is missing are empty lists.
 
         Args:
             access_db (AccessDB): The AccessDB object.
@@ -168,54 +215,184 @@ class FileStatusCheckerModel:
                 lists containing the job data.
         """
 
-        if not file_number or len(file_number) != 8:
-            file_number = access_db.execute_generic_query(
-                f"SELECT \
-[Job Number] FROM [Existing Jobs] WHERE [Parcel ID] = '{parcel_id}'"
-            )
-            if file_number:
-                file_number = file_number[0][0]
-
-        search_query = f"[Job Number] = '{file_number}'"
-
-        existing_jobs_query = f"""SELECT [Job Number], [Parcel ID], \
-[Address Number], [Street Name], Lot, block, subdivision FROM [Existing Jobs] \
-WHERE {search_query}"""
-        active_jobs_query = f"""SELECT [Order Date], [Fieldwork Status],\
- [Inhouse Status], [County], [Requested Services]\
- FROM [Active Jobs] WHERE {search_query}"""
-        signature_status_query = f"""SELECT [Signed], [Type of Survey],\
- [Signature Date], [Notes] FROM [Signature Status] WHERE {search_query}"""
+        if file_number and len(file_number) == 8:
+            condition = "[Job Number] = :file_number"
+            job_number_condition = condition
+        else:
+            condition = "[Parcel ID] = :parcel_id"
+            job_number_condition = self.NO_JOB_NUMBER_CONDITION
+        query = self.JOB_DATA_QUERY.format(
+            condition=condition, job_number_condition=job_number_condition
+        )
+        params = {"file_number": file_number, "parcel_id": parcel_id}
 
-        logging.info("Running query for active job data..")
+        logging.info("Running query for job data..")
         try:
-            active_job_data = access_db.execute_generic_query(active_jobs_query)
-            logging.info("Successfully ran query for active job data.")
+            rows = access_db.session.execute(text(query), params).fetchall()
+            access_db.record_fetched_rows(len(rows))
+            logging.info("Successfully ran query for job data.")
         except Exception as e:
-            logging.error(f"Failed to run query for active job data: {e}")
-            active_job_data = []
+            logging.error(f"Failed to run query for job data: {e}")
+            rows = []
+
+        # A parcel ID can match several jobs. Only the first job is
+        # shown, as when the job number was looked up by parcel ID.
+        if rows:
+            rows = [row for row in rows if row[18] == rows[0][18]]
+
+        # The joins repeat each record once per matching row in the
+        # other tables, so the duplicates are dropped in order.
+        existing_job_data = list(
+            dict.fromkeys(tuple(row[:7]) for row in rows if row[0])
+        )
+        active_job_data = list(
+            dict.fromkeys(tuple(row[8:13]) for row in rows if row[7])
+        )
+        signature_status_data = list(
+            dict.fromkeys(tuple(row[14:18]) for row in rows if row[13])
+        )
 
-        logging.info("Running query for existing job data..")
-        try:
-            existing_job_data = access_db.execute_generic_query(
-                existing_jobs_query
-            )
-            logging.info("Successfully ran query for existing job data.")
-        except Exception as e:
-            logging.error(f"Failed to run query for existing job data: {e}")
-            existing_job_data = []
+        return active_job_data, existing_job_data, signature_status_data
 
-        logging.info("Running query for signature status data..")
-        try:
-            signature_status_data = access_db.execute_generic_query(
-                signature_status_query
+    def parse_batch_entries(self, entries_text: str) -> List[str]:
+        """Splits pasted text, or the contents of a CSV file, into job
+        numbers and parcel IDs. Entries can be separated by new lines,
+        commas, tabs or semicolons. Duplicates are dropped.
+
+        Args:
+            entries_text (str): The text to split.
+
+        Returns:
+            List[str]: The entries, in the order they were entered.
+        """
+        entries = (
+            entry.strip().strip('"').strip()
+            for entry in re.split(r"[\r\n\t,;]+", entries_text)
+        )
+        return list(dict.fromkeys(entry for entry in entries if entry))
+
+    def read_batch_file(self, path: Path) -> List[str]:
+        """Reads the job numbers and parcel IDs from a CSV or text file.
+
+        Args:
+            path (Path): The path to the file.
+
+        Returns:
+            List[str]: The entries, in the order they are in the file.
+        """
+        with open(path, encoding="utf-8-sig") as file:
+            return self.parse_batch_entries(file.read())
+
+    def get_batch_job_data(
+        self, access_db: AccessDB, entries: List[str]
+    ) -> pd.DataFrame:
+        """Gets the status of many jobs at once. The entries are looked
+        up as both job numbers and parcel IDs, BATCH_CHUNK_SIZE entries
+        per query, rather than one query per entry.
+
+        Args:
+            access_db (AccessDB): The AccessDB object.
+            entries (List[str]): The job numbers and parcel IDs.
+
+        Returns:
+            pd.DataFrame: One row per job found for each entry, and one
+                row for each entry that was not found, with the
+                BATCH_COLUMNS.
+        """
+        rows = []
+        for start in range(0, len(entries), self.BATCH_CHUNK_SIZE):
+            chunk = entries[start : start + self.BATCH_CHUNK_SIZE]
+            params = {f"entry{i}": entry for i, entry in enumerate(chunk)}
+            placeholders = ", ".join(f":{name}" for name in params)
+            job_number_condition = f"[Job Number] IN ({placeholders})"
+            condition = (
+                f"{job_number_condition} OR [Parcel ID] IN ({placeholders})"
             )
-            logging.info("Successfully ran query for signature status data.")
-        except Exception as e:
-            logging.error(f"Failed to run query for signature status data: {e}")
-            signature_status_data = []
+            query = self.JOB_DATA_QUERY.format(
+                condition=condition, job_number_condition=job_number_condition
+            )
+            chunk_rows = access_db.session.execute(text(query), params).all()
+            access_db.record_fetched_rows(len(chunk_rows))
+            rows.extend(chunk_rows)
+        logging.info(
+            f"Found {len(rows)} rows for {len(entries)} batch entries."
+        )
 
-        return active_job_data, existing_job_data, signature_status_data
+        # The joins repeat a job once per matching row in the other
+        # tables, so only its first row is kept. Access compares
+        # without case, so the matches are found without case too.
+        jobs = {}
+        for row in rows:
+            jobs.setdefault(str(row[18]).upper(), row)
+        parcel_jobs = {}
+        for row in jobs.values():
+            if row[1]:
+                parcel_jobs.setdefault(str(row[1]).upper(), []).append(row)
+
+        records = []
+        for entry in entries:
+            key = entry.upper()
+            matches = [jobs[key]] if key in jobs else parcel_jobs.get(key)
+            if not matches:
+                records.append({"Entered": entry, "Found": "No"})
+                continue
+            for row in matches:
+                address_number = row[2] if row[2] else ""
+                street_name = row[3] if row[3] else ""
+                address = f"{address_number} {street_name}".strip()
+                records.append(
+                    {
+                        "Entered": entry,
+                        "Found": "Yes",
+                        "File Number": row[18],
+                        "Parcel ID": row[1] or row[19],
+                        "Property Address": address,
+                        "Active": "Yes" if row[7] else "No",
+                        "Order Date": self.format_date(row[8]),
+                        "Fieldwork Status": self.format_date(row[9]),
+                        "Inhouse Status": self.format_date(row[10]),
+                        "Signed": row[14],
+                        "Signature Date": self.format_date(row[16]),
+                    }
+                )
+        return pd.DataFrame(
+            records, columns=list(self.BATCH_COLUMNS)
+        ).fillna("")
+
+    def export_batch_report(self, report: pd.DataFrame, path: Path) -> None:
+        """Writes the batch report to a CSV file.
+
+        Args:
+            report (pd.DataFrame): The batch report.
+            path (Path): The path to the CSV file.
+        """
+        report.to_csv(path, index=False)
+        logging.info(f"Exported {len(report)} batch rows to {path}.")
+
+    def create_batch_window(self) -> None:
+        """Creates the batch window. This window will allow you to look
+        up the status of a list of job numbers or parcel IDs at once."""
+        if self.batch_window is None:
+            self.batch_window = BatchFileStatus(self)
+
+    def reset_batch_window(self) -> None:
+        """Resets the batch window."""
+        self.batch_window = None
+
+    @staticmethod
+    def format_date(value: object) -> str:
+        """Formats a date from the database for display.
+
+        Args:
+            value (object): The value from the database.
+
+        Returns:
+            str: The date as MM/DD/YYYY, or an empty string if the
+                value is not a date.
+        """
+        if value and isinstance(value, datetime):
+            return value.strftime("%m/%d/%Y")
+        return ""
 
     def clear_inputs(self) -> None:
         """Clears all the input fields."""
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+from DatabaseManager.models.address_normalizer import standardize_address
+
+# thefuzz drops these characters before scoring (force_ascii=True), so
+# they are dropped here as well to keep the scores identical.
+ASCII_TRANSLATION_TABLE = {character: None for character in range(128, 256)}
+
+
+class FuzzyScorer:
+    """Scores a search keyword against a whole column of candidates in
+    a single multi-threaded rapidfuzz call. The candidates are expected
+    to already be processed with process_choices, which is done once
+    when the job data is loaded."""
+
+    SCORE_CUTOFF = 75
+
+    @property
+    def raw_score_cutoff(self) -> float:
+        """The lowest raw score that rounds to the score cutoff. Scores
+        are rounded half to even, so this is a little generous."""
+        return self.SCORE_CUTOFF - 0.5
+
+    def prepare_keyword(self, keyword: str) -> str:
+        """Prepares the search keyword before it is processed. Meant to
+        be overridden by the specific scorers.
+
+        Args:
+            keyword (str): The search keyword.
+
+        Returns:
+            str: The prepared search keyword.
+        """
+        return keyword
+
+    def process_keyword(self, keyword: str) -> str:
+        """Prepares and processes the search keyword, so that it can be
+        compared against the processed candidates.
+
+        Args:
+            keyword (str): The search keyword.
+
+        Returns:
+            str: The processed search keyword.
+        """
+        return self.process(self.prepare_keyword(keyword))
+
+    @staticmethod
+    def process(value: str) -> str:
+        """Processes a single value the same way thefuzz does before
+        scoring: non-ascii characters are dropped, the value is
+        lowercased and all non-alphanumeric characters are replaced
+        with whitespace.
+
+        Args:
+            value (str): The value to process.
+
+        Returns:
+            str: The processed value.
+        """
+        return default_process(value.translate(ASCII_TRANSLATION_TABLE))
+
+    @staticmethod
+    def process_choices(choices: pd.Series) -> pd.Series:
+        """Processes a whole column of candidates for scoring.
+
+        Args:
+            choices (pd.Series): The candidate values.
+
+        Returns:
+            pd.Series: The processed candidate values.
+        """
+        translated = choices.astype(str).str.translate(ASCII_TRANSLATION_TABLE)
+        return pd.Series(
+            [default_process(value) for value in translated],
+            index=choices.index,
+            dtype=object,
+        )
+
+    def score(
+        self, keyword: str, choices: pd.Series
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Scores the keyword against every processed candidate with
+        the token sort ratio.
+
+        thefuzz rounds each score to the nearest integer before it is
+        compared to the cutoff, so the raw scores are rounded the same
+        way (half to even) and anything that rounds below the cutoff is
+        discarded.
+
+        Args:
+            keyword (str): The search keyword.
+            choices (pd.Series): The processed candidate values.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The positions of the matching
+                candidates and their integer scores.
+        """
+        query = self.process_keyword(keyword)
+        scores = process.cdist(
+            [query],
+            choices,
+            scorer=fuzz.token_sort_ratio,
+            processor=None,
+            score_cutoff=self.raw_score_cutoff,
+            dtype=np.float64,
+            workers=-1,
+        )[0]
+        scores = np.rint(scores)
+        indices = np.flatnonzero(scores >= self.SCORE_CUTOFF)
+        return indices, scores[indices].astype(np.int64)
+
+
+class PropertyAddressScorer(FuzzyScorer):
+    """Scores a property address keyword against the processed,
+    standardized addresses."""
+
+    def prepare_keyword(self, keyword: str) -> str:
+        return standardize_address(keyword.upper())
+
+
+class SubdivisionNameScorer(FuzzyScorer):
+    """Scores a subdivision name keyword against the processed
+    subdivision names."""
+
+    def prepare_keyword(self, keyword: str) -> str:
+        return keyword.upper()
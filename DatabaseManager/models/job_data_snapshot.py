@@ -0,0 +1,114 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+
+class JobDataSnapshot:
+    """Local Feather snapshot of the merged job data, along with its
+    derived search columns. The snapshot is keyed on the size and
+    modification time of the backend database file, so it is only used
+    while the backend file is unchanged."""
+
+    # Bump whenever the columns of the merged job data, or their
+    # dtypes, change, so that older snapshots are not loaded.
+    VERSION = 3
+
+    SNAPSHOT_FILE_NAME = "job_data.feather"
+    KEY_FILE_NAME = "job_data.json"
+
+    def __init__(self, cache_directory: Path, source_path: str):
+        """Initializes the JobDataSnapshot class.
+
+        Args:
+            cache_directory (Path): The directory to keep the snapshot
+                in.
+            source_path (str): The path to the backend database file.
+        """
+        self.snapshot_path = Path(cache_directory) / self.SNAPSHOT_FILE_NAME
+        self.key_path = Path(cache_directory) / self.KEY_FILE_NAME
+        self.source_path = source_path
+
+    def get_source_key(self) -> Optional[dict]:
+        """Gets the key of the backend database file in its current
+        state.
+
+        Returns:
+            Optional[dict]: The snapshot version, and the size and
+                modification time of the backend file. None if the
+                backend file cannot be reached.
+        """
+        try:
+            stat = os.stat(self.source_path)
+        except OSError as e:
+            logging.warning(f"Unable to stat {self.source_path}: {e}")
+            return None
+        return {
+            "version": self.VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def load(self, source_key: Optional[dict]) -> Optional[pd.DataFrame]:
+        """Loads the snapshot, if it was taken of the backend file in
+        the state given by the key.
+
+        Args:
+            source_key (Optional[dict]): The key of the backend file,
+                from get_source_key.
+
+        Returns:
+            Optional[pd.DataFrame]: The job data, or None if there is
+                no up to date snapshot.
+        """
+        if source_key is None or not self.snapshot_path.exists():
+            return None
+
+        try:
+            with open(self.key_path) as file:
+                snapshot_key = json.load(file)
+            if snapshot_key != source_key:
+                logging.info("Job data snapshot is out of date.")
+                return None
+            job_data = pd.read_feather(self.snapshot_path, memory_map=True)
+        except Exception as e:
+            logging.warning(f"Unable to load the job data snapshot: {e}")
+            return None
+
+        logging.info(f"Loaded {len(job_data)} job rows from the snapshot.")
+        return job_data
+
+    def save(self, job_data: pd.DataFrame, source_key: Optional[dict]) -> bool:
+        """Saves a snapshot of the job data. The snapshot is written to
+        a temporary file first, and the old key is removed before it
+        replaces the old snapshot, so a failed save never leaves a
+        snapshot that looks up to date.
+
+        Args:
+            job_data (pd.DataFrame): The merged job data.
+            source_key (Optional[dict]): The key of the backend file,
+                taken before the job data was read from it.
+
+        Returns:
+            bool: True if the snapshot was saved. False otherwise.
+        """
+        if source_key is None:
+            return False
+
+        temporary_path = self.snapshot_path.with_suffix(".tmp")
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            job_data.reset_index(drop=True).to_feather(temporary_path)
+            self.key_path.unlink(missing_ok=True)
+            os.replace(temporary_path, self.snapshot_path)
+            with open(self.key_path, "w") as file:
+                json.dump(source_key, file)
+        except Exception as e:
+            logging.warning(f"Unable to save the job data snapshot: {e}")
+            return False
+
+        logging.info(f"Saved {len(job_data)} job rows to the snapshot.")
+        return True
@@ -0,0 +1,400 @@
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from DatabaseManager.models.job_number_storage import JobNumberStorage
+
+
+class JobNumberReservationError(Exception):
+    """Raised when a job number cannot be reserved for the workstation."""
+
+
+class JobNumberReservation:
+    """Hands out job numbers that no other workstation has been handed.
+    Each workstation leases a block of job numbers at a time from a
+    ledger file in a shared directory, so numbers are only reserved
+    over the share when a block runs out. The ledger is only changed
+    while holding a lock file, which is created atomically with
+    O_EXCL. Leases expire, and expired numbers that were never used are
+    handed out again, unless another workstation has used a higher
+    number since, so reused numbers keep increasing. A workstation keeps
+    the numbers leased to it until they expire, even once higher numbers
+    have been used."""
+
+    LEDGER_FILE_NAME = "job_number_leases.json"
+    LOCK_FILE_NAME = "job_number_leases.lock"
+
+    # Number of job numbers leased at a time, and how long they stay
+    # leased to the workstation.
+    BLOCK_SIZE = 5
+    LEASE_SECONDS = 8 * 60 * 60
+
+    # How long to wait for the lock, how often to retry it, and how old
+    # a lock file must be before it is treated as left behind by a
+    # crashed workstation and removed.
+    LOCK_TIMEOUT_SECONDS = 10
+    LOCK_RETRY_SECONDS = 0.1
+    STALE_LOCK_SECONDS = 60
+
+    # Errors from an unreachable share, a held lock, or a malformed
+    # ledger.
+    LEDGER_ERRORS = (OSError, TimeoutError, ValueError, KeyError, TypeError)
+
+    def __init__(
+        self, lease_directory: Path, job_number_storage: JobNumberStorage
+    ):
+        """Initializes the JobNumberReservation class.
+
+        Args:
+            lease_directory (Path): The shared directory to keep the
+                ledger and lock files in.
+            job_number_storage (JobNumberStorage): The job number
+                storage, used to skip the job numbers that are already
+                in the database.
+        """
+        self.ledger_path = Path(lease_directory) / self.LEDGER_FILE_NAME
+        self.lock_path = Path(lease_directory) / self.LOCK_FILE_NAME
+        self.job_number_storage = job_number_storage
+        self.workstation = socket.gethostname()
+        self.block = []
+        self.block_expires = 0.0
+
+    def next_job_number(self) -> str:
+        """Gets the lowest job number leased to this workstation that is
+        not below the next unused job number. The same number is
+        returned until it is used. A new block is leased when the block
+        runs out or expires. No number is computed locally when the
+        ledger cannot be reached, since another workstation could be
+        given the same number.
+
+        Raises:
+            JobNumberReservationError: If no job number could be leased.
+
+        Returns:
+            str: The job number.
+        """
+        job_number = self.get_leased_job_number()
+        if job_number is not None:
+            return job_number
+
+        try:
+            with self.locked():
+                self.lease_block()
+        except self.LEDGER_ERRORS as e:
+            logging.error(f"Unable to reserve job numbers: {e}")
+            raise JobNumberReservationError(
+                f"Unable to reserve job numbers: {e}"
+            ) from e
+
+        # The block was just leased, so it is used even if the lease is
+        # too short to outlast this call.
+        job_number = self.get_unused_block_job_number()
+        if job_number is None:
+            raise JobNumberReservationError(
+                "No unused job number was leased."
+            )
+        return job_number
+
+    def get_leased_job_number(self) -> Optional[str]:
+        """Gets the lowest unused job number in the current block.
+
+        Returns:
+            Optional[str]: The job number, or None if the block is used up
+                or expired.
+        """
+        if time.time() >= self.block_expires:
+            return None
+        return self.get_unused_block_job_number()
+
+    def get_unused_block_job_number(self) -> Optional[str]:
+        """Gets the lowest job number in the current block that is not
+        in the database, whether or not the lease has expired.
+
+        Returns:
+            Optional[str]: The job number, or None if the block is used
+                up.
+        """
+        prefix = self.job_number_storage.get_job_number_prefix()
+        existing_job_numbers = self.job_number_storage.existing_job_numbers
+        for job_number in self.block:
+            if (
+                job_number.startswith(prefix)
+                and job_number not in existing_job_numbers
+            ):
+                return job_number
+        return None
+
+    def lease_block(self) -> None:
+        """Leases a new block of job numbers to this workstation. This
+        workstation's own unexpired leases are kept, then expired
+        numbers that were never used are reused, and then new numbers
+        are taken above the highest number ever leased. Only expired
+        numbers from the next unused job number up are reused. Must be
+        called while holding the lock."""
+        ledger = self.read_ledger()
+        now = time.time()
+        prefix = self.job_number_storage.get_job_number_prefix()
+        unused_job_number = self.job_number_storage.unused_job_number
+        existing_job_numbers = self.job_number_storage.existing_job_numbers
+
+        # Used numbers, numbers from past months, and expired numbers
+        # below the highest used job number, are not needed.
+        leases = {
+            job_number: lease
+            for job_number, lease in ledger["leases"].items()
+            if job_number.startswith(prefix)
+            and job_number not in existing_job_numbers
+            and (lease["expires"] > now or job_number >= unused_job_number)
+        }
+        own_job_numbers = [
+            job_number
+            for job_number, lease in leases.items()
+            if lease["workstation"] == self.workstation
+            and lease["expires"] > now
+        ]
+        expired_job_numbers = [
+            job_number
+            for job_number, lease in leases.items()
+            if lease["expires"] <= now
+        ]
+        block = sorted(own_job_numbers + expired_job_numbers)
+        block = block[: max(self.BLOCK_SIZE, len(own_job_numbers))]
+
+        next_job_number = unused_job_number
+        highest = ledger["highest"]
+        if highest.startswith(prefix[:2]):
+            next_job_number = max(
+                next_job_number, self.increment(highest, prefix)
+            )
+        while len(block) < self.BLOCK_SIZE:
+            if (
+                next_job_number not in leases
+                and next_job_number not in existing_job_numbers
+            ):
+                block.append(next_job_number)
+            next_job_number = self.increment(next_job_number, prefix)
+
+        expires = now + self.LEASE_SECONDS
+        for job_number in block:
+            leases[job_number] = {
+                "workstation": self.workstation,
+                "expires": expires,
+            }
+        ledger["leases"] = leases
+        ledger["highest"] = max([highest, *block])
+        self.write_ledger(ledger)
+
+        self.block = sorted(block)
+        self.block_expires = expires
+        logging.info(
+            f"Leased job numbers {', '.join(self.block)} to"
+            f" {self.workstation}."
+        )
+
+    def release(self) -> None:
+        """Returns the unused job numbers leased to this workstation, so
+        other workstations can use them right away. Meant to be called
+        when the app closes."""
+        if not self.block:
+            return
+
+        try:
+            with self.locked():
+                ledger = self.read_ledger()
+                existing_job_numbers = (
+                    self.job_number_storage.existing_job_numbers
+                )
+                for job_number in self.block:
+                    lease = ledger["leases"].get(job_number)
+                    if (
+                        lease
+                        and lease["workstation"] == self.workstation
+                        and job_number not in existing_job_numbers
+                    ):
+                        lease["expires"] = 0
+                self.write_ledger(ledger)
+        except self.LEDGER_ERRORS as e:
+            logging.warning(f"Unable to release job numbers: {e}")
+            return
+
+        logging.info(f"Released job numbers {', '.join(self.block)}.")
+        self.block = []
+        self.block_expires = 0.0
+
+    @staticmethod
+    def increment(job_number: str, prefix: str) -> str:
+        """Gets the job number after the given one, in the month of the
+        prefix. Job numbers keep counting up from month to month.
+
+        Args:
+            job_number (str): The job number.
+            prefix (str): The current job number prefix.
+
+        Returns:
+            str: The next job number.
+        """
+        return prefix + str(int(job_number[4:8]) + 1).zfill(4)
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Holds the lock file for the duration of the block. The lock
+        file holds the workstation, a token unique to this hold, and
+        when it was taken, so only the holder removes it when done.
+
+        Raises:
+            TimeoutError: If the lock cannot be acquired in time.
+
+        Yields:
+            None: Nothing. The ledger can be changed inside the block.
+        """
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + self.LOCK_TIMEOUT_SECONDS
+        owner = f"{self.workstation} {uuid.uuid4().hex} {time.time()}"
+        while True:
+            try:
+                lock_file = os.open(
+                    self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY
+                )
+                break
+            except FileExistsError:
+                if self.remove_stale_lock():
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{self.lock_path} is held.")
+                time.sleep(self.LOCK_RETRY_SECONDS)
+
+        try:
+            os.write(lock_file, owner.encode())
+        finally:
+            os.close(lock_file)
+
+        try:
+            yield
+        finally:
+            # The lock may have been taken over as stale by now.
+            if self.read_lock() == owner:
+                self.lock_path.unlink(missing_ok=True)
+
+    def remove_stale_lock(self) -> bool:
+        """Removes the lock file if it was taken longer ago than a
+        workstation could hold it for. The lock file is first renamed to
+        a name unique to this call, which only one workstation can do,
+        and then read. If the lock was released and taken again in the
+        meantime, the lock that was moved is put back.
+
+        Returns:
+            bool: True if the lock file is gone, False if it is held.
+        """
+        owner = self.read_lock()
+        if owner is None:
+            return True
+        if self.get_lock_age(owner) <= self.STALE_LOCK_SECONDS:
+            return False
+
+        taken_path = self.lock_path.with_name(
+            f"{self.LOCK_FILE_NAME}.{uuid.uuid4().hex}"
+        )
+        try:
+            os.rename(self.lock_path, taken_path)
+        except FileNotFoundError:
+            # Another workstation removed it first.
+            return True
+
+        try:
+            taken_owner = taken_path.read_text()
+            if taken_owner != owner:
+                self.restore_lock(taken_path)
+                return False
+        except OSError:
+            self.restore_lock(taken_path)
+            return False
+
+        logging.warning(f"Removing stale lock file {self.lock_path}: {owner}.")
+        taken_path.unlink(missing_ok=True)
+        return True
+
+    def restore_lock(self, taken_path: Path) -> None:
+        """Puts back a lock file that was moved aside as stale, but was
+        held. It is linked back, so a lock taken since is not replaced.
+
+        Args:
+            taken_path (Path): The path the lock file was moved to.
+        """
+        try:
+            os.link(taken_path, self.lock_path)
+        except OSError as e:
+            logging.warning(f"Unable to restore lock file: {e}")
+        taken_path.unlink(missing_ok=True)
+
+    def read_lock(self) -> Optional[str]:
+        """Reads the owner of the lock file.
+
+        Returns:
+            Optional[str]: The contents of the lock file, or None if
+                there is no lock file.
+        """
+        try:
+            return self.lock_path.read_text()
+        except FileNotFoundError:
+            return None
+
+    def get_lock_age(self, owner: str) -> float:
+        """Gets how long ago the lock was taken, from the time in the
+        lock file. A lock file whose holder has not written to it yet
+        is as old as the file.
+
+        Args:
+            owner (str): The contents of the lock file.
+
+        Returns:
+            float: The age of the lock in seconds.
+        """
+        try:
+            return time.time() - float(owner.split()[-1])
+        except (IndexError, ValueError):
+            pass
+        try:
+            return time.time() - self.lock_path.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    def read_ledger(self) -> dict:
+        """Reads the ledger of leased job numbers.
+
+        Raises:
+            ValueError: If the ledger is not valid JSON, or is not
+                shaped like a ledger.
+
+        Returns:
+            dict: The leases, keyed by job number, and the highest job
+                number ever leased.
+        """
+        if not self.ledger_path.exists():
+            return {"leases": {}, "highest": ""}
+        with open(self.ledger_path) as file:
+            ledger = json.load(file)
+        if not (
+            isinstance(ledger, dict)
+            and isinstance(ledger.get("leases"), dict)
+            and isinstance(ledger.get("highest"), str)
+        ):
+            raise ValueError(f"{self.ledger_path} is malformed.")
+        return ledger
+
+    def write_ledger(self, ledger: dict) -> None:
+        """Writes the ledger of leased job numbers. It is written to a
+        temporary file first, so a failed write keeps the old ledger.
+
+        Args:
+            ledger (dict): The ledger.
+        """
+        temporary_path = self.ledger_path.with_suffix(".tmp")
+        with open(temporary_path, "w") as file:
+            json.dump(ledger, file)
+        os.replace(temporary_path, self.ledger_path)
@@ -1,14 +1,39 @@
+import bisect
 import datetime
+import logging
+import time
+from typing import Iterable, Optional
+
 from DatabaseManager.models.access_database import AccessDB
 
 
 class JobNumberStorage:
+    EXISTING_JOBS_TABLE = "Existing Jobs"
+    ACTIVE_JOBS_TABLE = "Active Jobs"
+
+    # The cached job numbers are used without checking the database
+    # for this long after the last check.
+    STALENESS_PROBE_SECONDS = 30
+
     def __init__(self, database: AccessDB):
         self.database = database
         self.now = datetime.datetime.now()
         self.year = self.now.year % 100
         self.month = self.now.month
 
+        # Keys are the table names, and values are the cached job
+        # numbers, the row count and highest job number they were
+        # fetched at, and when the table was last probed.
+        self.job_numbers = {}
+        self.table_signatures = {}
+        self.last_probe_times = {}
+
+        # Bumped whenever any cached job numbers change, so the sorted
+        # job numbers know when to sort again.
+        self.job_numbers_version = 0
+        self.sorted_job_numbers = []
+        self.sorted_job_numbers_version = None
+
     def get_job_number_prefix(self, num_previous_months: int = 0) -> str:
         month = self.month
         if num_previous_months > 0 and month > 1:
@@ -21,18 +46,21 @@ class JobNumberStorage:
 
     @property
     def unused_job_number(self) -> str:
+        """The job number after the highest job number of the most
+        recent month with jobs, within the last 12 months, in the
+        current month. Found by binary search in the sorted current year
+        job numbers, so it runs no queries while the cache is current.
+        """
+        sorted_job_numbers = self.sorted_current_year_job_numbers
         num_previous_months = 0
         while num_previous_months < 12:
             prefix = self.get_job_number_prefix(num_previous_months)
-            job_numbers = [
-                number
-                for number in self.get_current_year_job_numbers()
-                if number.startswith(prefix)
-            ]
-            if len(job_numbers) == 0:
+            highest_existing_fn = self.get_highest_job_number(
+                sorted_job_numbers, prefix
+            )
+            if highest_existing_fn is None:
                 num_previous_months += 1
             else:
-                highest_existing_fn = max(job_numbers)
                 last_four_digits = str(int(highest_existing_fn[4:8]) + 1).zfill(
                     4
                 )
@@ -43,67 +71,238 @@ class JobNumberStorage:
 
         return new_fn
 
+    @staticmethod
+    def get_highest_job_number(
+        sorted_job_numbers: list[str], prefix: str
+    ) -> Optional[str]:
+        """Gets the highest job number that starts with the prefix.
+
+        Args:
+            sorted_job_numbers (list[str]): The job numbers, sorted.
+            prefix (str): The job number prefix.
+
+        Returns:
+            Optional[str]: The highest job number with the prefix, or
+                None if there is none.
+        """
+        # Every job number with the prefix sorts before the next prefix.
+        next_prefix = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        position = bisect.bisect_left(sorted_job_numbers, next_prefix)
+        if position and sorted_job_numbers[position - 1].startswith(prefix):
+            return sorted_job_numbers[position - 1]
+        return None
+
+    @property
+    def sorted_current_year_job_numbers(self) -> list[str]:
+        """The current year job numbers, sorted. Sorted again only when
+        the cached existing job numbers change."""
+        # Checks the cache first, which may fetch the job numbers again.
+        self.get_job_numbers(self.EXISTING_JOBS_TABLE)
+        if self.sorted_job_numbers_version != self.job_numbers_version:
+            self.sorted_job_numbers = sorted(self.current_year_job_numbers)
+            self.sorted_job_numbers_version = self.job_numbers_version
+        return self.sorted_job_numbers
+
     @property
     def current_year_job_numbers(self) -> set[str]:
-        current_year_jobs = self.database.execute_generic_query(
-            f"SELECT [Job Number] FROM [Existing Jobs] WHERE [Job Number] LIKE\
- '{self.year}%'"
-        )
-        job_numbers = [job_number[0] for job_number in current_year_jobs]
-        return set(job_numbers)
+        year_prefix = str(self.year)
+        return {
+            job_number
+            for job_number in self.existing_job_numbers
+            if job_number and job_number.startswith(year_prefix)
+        }
 
     @property
     def existing_job_numbers(self) -> set[str]:
-        existing_jobs = self.database.execute_generic_query(
-            "SELECT [Job Number] FROM [Existing Jobs]"
-        )
-        job_numbers = [job_number[0] for job_number in existing_jobs]
-        return set(job_numbers)
+        return self.get_job_numbers(self.EXISTING_JOBS_TABLE)
 
     @property
     def active_job_numbers(self) -> set[str]:
-        active_jobs = self.database.execute_generic_query(
-            "SELECT [Job Number] FROM [Active Jobs]"
+        return self.get_job_numbers(self.ACTIVE_JOBS_TABLE)
+
+    def get_job_numbers(self, table_name: str) -> set[str]:
+        """Gets the cached job numbers of the table. The table is probed
+        for changes at most once per probe interval, and the job numbers
+        are only fetched again if the probe shows that it changed.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            set[str]: Every job number in the table.
+        """
+        now = time.monotonic()
+        last_probe_time = self.last_probe_times.get(table_name)
+        if (
+            table_name in self.job_numbers
+            and last_probe_time is not None
+            and now - last_probe_time < self.STALENESS_PROBE_SECONDS
+        ):
+            return self.job_numbers[table_name]
+
+        signature = self.probe_table(table_name)
+        self.last_probe_times[table_name] = now
+        if (
+            table_name not in self.job_numbers
+            or signature != self.table_signatures.get(table_name)
+        ):
+            self.job_numbers[table_name] = self.fetch_job_numbers(table_name)
+            self.table_signatures[table_name] = signature
+            self.job_numbers_version += 1
+        return self.job_numbers[table_name]
+
+    def get_cached_job_numbers(self, table_name: str) -> Optional[set[str]]:
+        """Gets the cached job numbers of the table as they are, without
+        probing the table or fetching them.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            Optional[set[str]]: The cached job numbers, or None if the
+                table's job numbers are not cached.
+        """
+        return self.job_numbers.get(table_name)
+
+    def probe_table(self, table_name: str) -> tuple:
+        """Gets the row count and highest job number of the table, which
+        change whenever job numbers are added or removed.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            tuple: The row count and the highest job number.
+        """
+        result = self.database.execute_generic_query(
+            f"SELECT COUNT([Job Number]), MAX([Job Number]) FROM\
+ [{table_name}]"
+        )
+        return tuple(result[0])
+
+    def fetch_job_numbers(self, table_name: str) -> set[str]:
+        """Fetches every job number in the table.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            set[str]: Every job number in the table.
+        """
+        logging.info(f"Fetching the job numbers in {table_name}.")
+        jobs = self.database.execute_generic_query(
+            f"SELECT [Job Number] FROM [{table_name}]"
+        )
+        return {job_number[0] for job_number in jobs}
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """Drops the cached job numbers, so that they are fetched again
+        the next time they are used.
+
+        Args:
+            table_name (Optional[str], optional): The table to drop the
+                job numbers of. Defaults to None, which drops every
+                table's job numbers.
+        """
+        table_names = (
+            [table_name] if table_name else list(self.job_numbers.keys())
+        )
+        for name in table_names:
+            self.job_numbers.pop(name, None)
+            self.table_signatures.pop(name, None)
+            self.last_probe_times.pop(name, None)
+        self.job_numbers_version += 1
+
+    def add_to_table(self, table_name: str, job_numbers: Iterable[str]):
+        """Adds job numbers written to the table by this workstation to
+        the cache. Nothing is fetched if the table's job numbers are not
+        cached yet, since a later fetch includes the written job
+        numbers. The cached probe result is updated to match, so the
+        write alone does not make the cache look stale.
+
+        Args:
+            table_name (str): The name of the table.
+            job_numbers (Iterable[str]): The job numbers written.
+        """
+        cached_job_numbers = self.job_numbers.get(table_name)
+        if cached_job_numbers is None:
+            return
+        new_job_numbers = [
+            job_number
+            for job_number in dict.fromkeys(job_numbers)
+            if job_number not in cached_job_numbers
+        ]
+        if not new_job_numbers:
+            return
+        cached_job_numbers.update(new_job_numbers)
+        self.job_numbers_version += 1
+
+        # A removal leaves no probe result, so the next probe decides
+        # whether the cache is still current.
+        signature = self.table_signatures.get(table_name)
+        if signature is None:
+            return
+        row_count, highest_job_number = signature
+        highest_job_number = max(
+            [*new_job_numbers, highest_job_number or ""]
         )
-        job_numbers = [job_number[0] for job_number in active_jobs]
-        return set(job_numbers)
+        self.table_signatures[table_name] = (
+            row_count + len(new_job_numbers),
+            highest_job_number,
+        )
+
+    def remove_from_table(self, table_name: str, job_number: str):
+        """Removes a job number deleted from the table by this
+        workstation from the cache.
+
+        Args:
+            table_name (str): The name of the table.
+            job_number (str): The job number deleted.
+        """
+        cached_job_numbers = self.job_numbers.get(table_name)
+        if cached_job_numbers is None or job_number not in cached_job_numbers:
+            return
+        cached_job_numbers.remove(job_number)
+        self.job_numbers_version += 1
+
+        # The highest job number may have changed, so the next probe
+        # decides whether the cache is still current.
+        self.table_signatures[table_name] = None
 
     def add_job_number(self, job_number: str):
-        self.existing_job_numbers.add(job_number)
-        self.active_job_numbers.add(job_number)
+        self.add_to_table(self.EXISTING_JOBS_TABLE, [job_number])
+        self.add_to_table(self.ACTIVE_JOBS_TABLE, [job_number])
 
     def remove_job_number(self, job_number: str):
-        self.existing_job_numbers.remove(job_number)
+        self.remove_from_table(self.EXISTING_JOBS_TABLE, job_number)
 
     def add_existing_job_numbers(self, job_numbers: tuple):
         # Pulling from access database as a tuple, with job number being
         # the first element.
         job_numbers = [job_number[0] for job_number in job_numbers]
-        self.existing_job_numbers.update(job_numbers)
+        self.add_to_table(self.EXISTING_JOBS_TABLE, job_numbers)
 
     def add_active_job_numbers(self, job_numbers: tuple):
         # Pulling from access database as a tuple, with job number being
         # the first element.
         job_numbers = [job_number[0] for job_number in job_numbers]
-        self.active_job_numbers.update(job_numbers)
+        self.add_to_table(self.ACTIVE_JOBS_TABLE, job_numbers)
 
     def add_current_year_job_numbers(self, job_numbers: tuple):
-        # Pulling from access database as a tuple, with job number being
-        # the first element.
-        job_numbers = [job_number[0] for job_number in job_numbers]
-        self.current_year_job_numbers.update(job_numbers)
+        # The current year job numbers are the existing job numbers
+        # that start with the year.
+        self.add_existing_job_numbers(job_numbers)
 
     def clear_job_numbers(self):
-        self.existing_job_numbers.clear()
-        self.active_job_numbers.clear()
+        self.invalidate()
 
-    def get_existing_job_numbers(self) -> list[str]:
+    def get_existing_job_numbers(self) -> set[str]:
         return self.existing_job_numbers
 
-    def get_active_job_numbers(self) -> list[str]:
+    def get_active_job_numbers(self) -> set[str]:
         return self.active_job_numbers
 
-    def get_current_year_job_numbers(self) -> list[str]:
+    def get_current_year_job_numbers(self) -> set[str]:
         return self.current_year_job_numbers
 
     def add_unused_job_number(self, job_number: str):
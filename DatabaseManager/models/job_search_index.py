@@ -0,0 +1,183 @@
+import copy
+import logging
+
+import numpy as np
+import pandas as pd
+
+from DatabaseManager.models.fuzzy_scorer import FuzzyScorer
+from DatabaseManager.models.ngram_index import NGramIndex
+
+
+class EncodedColumn:
+    """Dictionary-encoded search key column. Every distinct value is
+    stored once, and each row holds the code of its value. Rows are
+    grouped by code so that matched values can be mapped back to their
+    rows without scanning the whole column."""
+
+    def __init__(self, values: pd.Series):
+        """Initializes the EncodedColumn class.
+
+        Args:
+            values (pd.Series): The processed search key column.
+        """
+        codes, uniques = pd.factorize(values)
+        self.uniques = pd.Series(uniques, dtype=object)
+        self.ngram_index = NGramIndex(self.uniques)
+        self.set_codes(codes)
+
+    def set_codes(self, codes: np.ndarray) -> None:
+        """Sets the code of every row, and groups the rows by code.
+
+        Args:
+            codes (np.ndarray): The code of each row's value.
+        """
+        self.codes = codes
+
+        # Row positions sorted by code, and where each code starts.
+        self.rows_by_code = np.argsort(codes, kind="stable")
+        self.code_offsets = np.searchsorted(
+            codes[self.rows_by_code], np.arange(len(self.uniques) + 1)
+        )
+
+    def updated(
+        self, values: pd.Series, positions: np.ndarray
+    ) -> "EncodedColumn":
+        """Gets a copy of the column with the values at the positions
+        replaced. Positions past the end of the column are appended, in
+        order. Only values not seen before are added to the n-gram
+        index. Values no longer held by any row are kept, but are never
+        mapped back to a row. This column is left unchanged.
+
+        Args:
+            values (pd.Series): The new processed search keys.
+            positions (np.ndarray): The row position of each new value.
+
+        Returns:
+            EncodedColumn: The updated column.
+        """
+        values = values.to_numpy(dtype=object)
+        value_codes = pd.Index(self.uniques).get_indexer(values)
+        unseen = value_codes < 0
+        new_uniques = pd.unique(values[unseen])
+        value_codes[unseen] = len(self.uniques) + pd.Index(
+            new_uniques
+        ).get_indexer(values[unseen])
+
+        size = max(len(self.codes), positions.max(initial=-1) + 1)
+        codes = np.empty(size, dtype=np.intp)
+        codes[: len(self.codes)] = self.codes
+        codes[positions] = value_codes
+
+        column = copy.copy(self)
+        column.uniques = pd.concat(
+            [self.uniques, pd.Series(new_uniques, dtype=object)],
+            ignore_index=True,
+        )
+        column.ngram_index = self.ngram_index.extended(new_uniques)
+        column.set_codes(codes)
+        return column
+
+    def rows_for_codes(self, codes: np.ndarray) -> np.ndarray:
+        """Gets the positions of every row holding one of the codes.
+
+        Args:
+            codes (np.ndarray): The codes of the matched values.
+
+        Returns:
+            np.ndarray: The sorted row positions.
+        """
+        if not len(codes):
+            return np.empty(0, dtype=np.intp)
+
+        starts = self.code_offsets[codes]
+        ends = self.code_offsets[codes + 1]
+        rows = np.concatenate(
+            [self.rows_by_code[start:end] for start, end in zip(starts, ends)]
+        )
+        rows.sort()
+        return rows
+
+
+class JobSearchIndex:
+    """In-memory search structures built alongside the job data. Each
+    searchable column is dictionary-encoded, so fuzzy scoring runs once
+    per distinct value, and an n-gram index over those values narrows a
+    search down to a small set of candidates before any scoring."""
+
+    def __init__(self, job_data: pd.DataFrame, columns: list[str]):
+        """Initializes the JobSearchIndex class.
+
+        Args:
+            job_data (pd.DataFrame): The job data to index.
+            columns (list[str]): The processed search key columns to
+                index.
+        """
+        self.job_data = job_data
+        self.encoded_columns = {
+            column: EncodedColumn(job_data[column]) for column in columns
+        }
+        for column, encoded_column in self.encoded_columns.items():
+            logging.debug(
+                f"Encoded {len(encoded_column.codes)} rows of {column} into"
+                f" {len(encoded_column.uniques)} distinct values."
+            )
+
+    def updated(
+        self, job_data: pd.DataFrame, positions: np.ndarray
+    ) -> "JobSearchIndex":
+        """Gets a copy of the index for job data that changed only at
+        the positions. Only the changed rows are encoded, and this index
+        is left unchanged, so it can still be searched while the copy is
+        made.
+
+        Args:
+            job_data (pd.DataFrame): The changed job data.
+            positions (np.ndarray): The positions of the replaced and
+                appended rows.
+
+        Returns:
+            JobSearchIndex: The updated index.
+        """
+        index = copy.copy(self)
+        index.job_data = job_data
+        index.encoded_columns = {
+            column: encoded_column.updated(
+                job_data[column].iloc[positions], positions
+            )
+            for column, encoded_column in self.encoded_columns.items()
+        }
+        return index
+
+    def search(
+        self, scorer: FuzzyScorer, column: str, keyword: str
+    ) -> np.ndarray:
+        """Searches a column of the job data for the keyword. Only the
+        distinct values picked by the n-gram index are scored, and the
+        matches are fanned back out to their rows.
+
+        Args:
+            scorer (FuzzyScorer): The scorer for the search type.
+            column (str): The processed search key column to search.
+            keyword (str): The search keyword.
+
+        Returns:
+            np.ndarray: The positions of the matching rows in the job
+                data.
+        """
+        encoded_column = self.encoded_columns[column]
+        choices = encoded_column.uniques
+        candidates = encoded_column.ngram_index.candidates(
+            scorer.process_keyword(keyword), scorer.raw_score_cutoff
+        )
+        if candidates is None:
+            matched_codes, _ = scorer.score(keyword, choices)
+        else:
+            logging.debug(
+                f"Scoring {len(candidates)} of {len(choices)} values."
+            )
+            matched_indices, _ = scorer.score(
+                keyword, choices.iloc[candidates]
+            )
+            matched_codes = candidates[matched_indices]
+
+        return encoded_column.rows_for_codes(matched_codes)
@@ -0,0 +1,178 @@
+import copy
+import math
+from collections import Counter, defaultdict
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+class NGramIndex:
+    """Character n-gram inverted index over a list of processed search
+    keys. Each n-gram maps to the sorted positions of the keys that
+    contain it, and how often they contain it, so a query only has to
+    look at the posting lists of its own n-grams instead of every key.
+
+    Candidates are picked with the q-gram count filter: a key within
+    the Indel distance allowed by the score cutoff must share a minimum
+    number of n-grams with the query, so no key that can reach the
+    cutoff is ever pruned."""
+
+    # Each Indel edit breaks at most N of a key's n-grams. A token sort
+    # ratio of 75 allows edits to about a quarter of the characters, so
+    # longer n-grams would leave no shared n-grams to require.
+    N = 2
+
+    # Scoring a subset of the keys costs more per key than scoring all
+    # of them, so a query that keeps most of the keys is fully scanned.
+    MAX_CANDIDATE_FRACTION = 0.5
+
+    def __init__(self, values: Iterable[str]):
+        """Initializes the NGramIndex class.
+
+        Args:
+            values (Iterable[str]): The processed search keys to index.
+        """
+        self.size = 0
+        self.lengths = np.empty(0, dtype=np.int32)
+        self.postings = {}
+        self.add_values(values)
+
+    def extended(self, values: Iterable[str]) -> "NGramIndex":
+        """Gets a copy of the index with more keys added after the
+        existing ones. Only the posting lists of the new keys' n-grams
+        are copied, and this index is left unchanged, so it can still be
+        searched while the copy is made.
+
+        Args:
+            values (Iterable[str]): The processed search keys to add.
+
+        Returns:
+            NGramIndex: The extended index.
+        """
+        index = copy.copy(self)
+        index.postings = dict(self.postings)
+        index.add_values(values)
+        return index
+
+    def add_values(self, values: Iterable[str]) -> None:
+        """Adds keys to the index, after the existing ones. The posting
+        lists of their n-grams are replaced rather than changed.
+
+        Args:
+            values (Iterable[str]): The processed search keys to add.
+        """
+        postings = defaultdict(list)
+        counts = defaultdict(list)
+        lengths = []
+        for position, value in enumerate(values, start=self.size):
+            key = self.sort_tokens(value)
+            for gram, count in self.ngrams(key).items():
+                postings[gram].append(position)
+                counts[gram].append(count)
+            lengths.append(len(key))
+
+        for gram, positions in postings.items():
+            new_positions = np.array(positions, dtype=np.int32)
+            new_counts = np.array(counts[gram], dtype=np.int32)
+            if gram in self.postings:
+                old_positions, old_counts = self.postings[gram]
+                new_positions = np.concatenate([old_positions, new_positions])
+                new_counts = np.concatenate([old_counts, new_counts])
+            self.postings[gram] = (new_positions, new_counts)
+
+        self.size += len(lengths)
+        self.lengths = np.concatenate(
+            [self.lengths, np.array(lengths, dtype=np.int32)]
+        )
+
+    @staticmethod
+    def sort_tokens(value: str) -> str:
+        """Sorts the whitespace separated tokens of the value, and joins
+        them with single spaces. This is the string the token sort ratio
+        compares, so the n-grams are taken from it as well.
+
+        Args:
+            value (str): The processed value.
+
+        Returns:
+            str: The value with its tokens sorted.
+        """
+        return " ".join(sorted(value.split()))
+
+    def ngrams(self, key: str) -> Counter:
+        """Counts the n-grams of the key. The key is padded with a space
+        on either side so that its first and last characters carry
+        weight.
+
+        Args:
+            key (str): The key, with its tokens sorted.
+
+        Returns:
+            Counter: The number of times each n-gram occurs in the key.
+        """
+        padded = f" {key} "
+        return Counter(
+            padded[start : start + self.N]
+            for start in range(len(padded) - self.N + 1)
+        )
+
+    def candidates(
+        self, query: str, min_score: float
+    ) -> Optional[np.ndarray]:
+        """Gets the positions of the keys that can score at least the
+        minimum score against the query.
+
+        A score of s allows an Indel distance of d = (100 - s) / 100
+        times the combined length of the key and query. Each deleted
+        character breaks at most N of the n-grams of one string, and
+        each inserted character at most N - 1, so the two share at
+        least (combined n-grams - (2N - 1) * d) / 2 of them. Keys whose
+        lengths differ by more than d are dropped as well.
+
+        Args:
+            query (str): The processed search query.
+            min_score (float): The lowest score, out of 100, that a key
+                must be able to reach to be a candidate.
+
+        Returns:
+            Optional[np.ndarray]: The sorted candidate positions, or
+                None if the query keeps too many keys to be worth
+                pruning, in which case every key has to be scored.
+        """
+        key = self.sort_tokens(query)
+        positions = []
+        shared_counts = []
+        for gram, count in self.ngrams(key).items():
+            if gram in self.postings:
+                gram_positions, gram_counts = self.postings[gram]
+                positions.append(gram_positions)
+                shared_counts.append(np.minimum(gram_counts, count))
+        if not positions:
+            return np.empty(0, dtype=np.int32)
+
+        shared = np.bincount(
+            np.concatenate(positions),
+            weights=np.concatenate(shared_counts),
+            minlength=self.size,
+        )
+
+        # Rounded up slightly, so that floating point error can only
+        # allow more edits than the score does, never fewer.
+        combined_lengths = self.lengths + len(key)
+        max_distances = np.floor(
+            combined_lengths * (100 - min_score) / 100 + 1e-9
+        )
+        combined_ngrams = combined_lengths + 2 * (3 - self.N)
+        required = np.ceil(
+            (combined_ngrams - (2 * self.N - 1) * max_distances) / 2
+        )
+        keep = (shared >= required) & (
+            np.abs(self.lengths - len(key)) <= max_distances
+        )
+
+        candidates = np.flatnonzero(keep).astype(np.int32)
+        if len(candidates) > math.floor(
+            self.MAX_CANDIDATE_FRACTION * self.size
+        ):
+            return None
+        return candidates
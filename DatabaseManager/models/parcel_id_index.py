@@ -0,0 +1,83 @@
+import copy
+import logging
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+class ParcelIdIndex:
+    """Maps each Parcel ID to the job data rows with it. The Parcel IDs
+    are kept sorted along with their rows, so the rows of a handful of
+    Parcel IDs are found with binary searches instead of a pass over
+    every job."""
+
+    def __init__(self, parcel_ids: pd.Series):
+        """Initializes the ParcelIdIndex class.
+
+        Args:
+            parcel_ids (pd.Series): The Parcel ID of every job data row.
+        """
+        self.set_entries(
+            np.arange(len(parcel_ids)), parcel_ids.to_numpy(dtype=object)
+        )
+
+    def set_entries(self, rows: np.ndarray, parcel_ids: np.ndarray) -> None:
+        """Sorts the entries by Parcel ID. Rows without a Parcel ID are
+        left out.
+
+        Args:
+            rows (np.ndarray): The job data row of each entry.
+            parcel_ids (np.ndarray): The Parcel ID of each entry.
+        """
+        parcel_ids = parcel_ids.astype(str)
+        has_parcel_id = parcel_ids != ""
+        rows = rows[has_parcel_id]
+        parcel_ids = parcel_ids[has_parcel_id]
+
+        order = np.argsort(parcel_ids, kind="stable")
+        self.rows = rows[order]
+        self.parcel_ids = parcel_ids[order]
+        logging.debug(f"Indexed {len(self.rows)} Parcel IDs.")
+
+    def updated(
+        self, parcel_ids: pd.Series, positions: np.ndarray
+    ) -> "ParcelIdIndex":
+        """Gets a copy of the index with the entries of the rows at the
+        positions replaced. This index is left unchanged.
+
+        Args:
+            parcel_ids (pd.Series): The new Parcel IDs.
+            positions (np.ndarray): The job data row of each Parcel ID.
+
+        Returns:
+            ParcelIdIndex: The updated index.
+        """
+        kept = ~np.isin(self.rows, positions)
+        index = copy.copy(self)
+        index.set_entries(
+            np.concatenate([self.rows[kept], positions]),
+            np.concatenate(
+                [self.parcel_ids[kept], parcel_ids.to_numpy(dtype=object)]
+            ),
+        )
+        return index
+
+    def search(self, parcel_ids: Iterable[str]) -> np.ndarray:
+        """Gets the rows with any of the Parcel IDs.
+
+        Args:
+            parcel_ids (Iterable[str]): The Parcel IDs to look up.
+
+        Returns:
+            np.ndarray: The positions of the matching rows in the job
+                data, in the order of the given Parcel IDs.
+        """
+        parcel_ids = np.asarray(list(parcel_ids), dtype=str)
+        starts = np.searchsorted(self.parcel_ids, parcel_ids, side="left")
+        ends = np.searchsorted(self.parcel_ids, parcel_ids, side="right")
+        counts = ends - starts
+
+        # The positions of each Parcel ID's entries, one after another.
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return self.rows[offsets + np.arange(counts.sum())]
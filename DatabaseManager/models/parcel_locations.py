@@ -0,0 +1,393 @@
+import logging
+import math
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class ParcelGridIndex:
+    """Spatial grid index over parcel centroids. The centroids are
+    projected to feet and bucketed into square cells, so a radius query
+    only has to measure the parcels in the few cells around the point.
+    """
+
+    CELL_SIZE_FEET = 500
+    FEET_PER_DEGREE_LATITUDE = 364_000
+
+    def __init__(self, locations: pd.DataFrame):
+        """Initializes the ParcelGridIndex class.
+
+        Args:
+            locations (pd.DataFrame): The parcel locations, with Parcel
+                ID, Latitude and Longitude columns.
+        """
+        self.parcel_ids = locations["Parcel ID"].to_numpy(dtype=object)
+        latitudes = locations["Latitude"].to_numpy(dtype=np.float64)
+        longitudes = locations["Longitude"].to_numpy(dtype=np.float64)
+
+        # The projection is only accurate near this latitude, which is
+        # fine for parcels from neighbouring counties.
+        self.reference_latitude = latitudes.mean() if len(latitudes) else 0.0
+        self.x, self.y = self.project(latitudes, longitudes)
+
+        cell_x, cell_y = self.cells(self.x, self.y)
+        self.order = np.lexsort((cell_y, cell_x))
+        sorted_cells = np.stack([cell_x[self.order], cell_y[self.order]])
+        boundaries = np.flatnonzero(np.any(np.diff(sorted_cells), axis=0)) + 1
+        starts = np.concatenate([[0], boundaries])
+        ends = np.concatenate([boundaries, [len(self.order)]])
+        self.cell_ranges = {
+            (sorted_cells[0, start], sorted_cells[1, start]): (start, end)
+            for start, end in zip(starts, ends)
+            if start < end
+        }
+
+    def project(
+        self, latitudes: np.ndarray, longitudes: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Projects latitudes and longitudes to feet.
+
+        Args:
+            latitudes (np.ndarray): The latitudes in degrees.
+            longitudes (np.ndarray): The longitudes in degrees.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The x and y coordinates in
+                feet.
+        """
+        feet_per_degree_longitude = self.FEET_PER_DEGREE_LATITUDE * math.cos(
+            math.radians(self.reference_latitude)
+        )
+        x = np.asarray(longitudes) * feet_per_degree_longitude
+        y = np.asarray(latitudes) * self.FEET_PER_DEGREE_LATITUDE
+        return x, y
+
+    def cells(
+        self, x: np.ndarray, y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Gets the grid cells of the projected coordinates.
+
+        Args:
+            x (np.ndarray): The x coordinates in feet.
+            y (np.ndarray): The y coordinates in feet.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The cell columns and rows.
+        """
+        cell_x = np.floor(np.asarray(x) / self.CELL_SIZE_FEET)
+        cell_y = np.floor(np.asarray(y) / self.CELL_SIZE_FEET)
+        return cell_x.astype(np.int64), cell_y.astype(np.int64)
+
+    def query_radius(
+        self, latitude: float, longitude: float, radius_feet: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Gets every parcel within the radius of the point.
+
+        Args:
+            latitude (float): The latitude of the point.
+            longitude (float): The longitude of the point.
+            radius_feet (float): The search radius in feet.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The parcel IDs and their
+                distances in feet, nearest first.
+        """
+        x, y = self.project(np.array([latitude]), np.array([longitude]))
+        cell_x, cell_y = self.cells(x, y)
+        reach = math.ceil(radius_feet / self.CELL_SIZE_FEET)
+
+        if (2 * reach + 1) ** 2 <= len(self.cell_ranges):
+            ranges = [
+                self.cell_ranges[(column, row)]
+                for column in range(cell_x[0] - reach, cell_x[0] + reach + 1)
+                for row in range(cell_y[0] - reach, cell_y[0] + reach + 1)
+                if (column, row) in self.cell_ranges
+            ]
+        else:
+            # The radius covers more cells than have parcels, so only
+            # the cells with parcels are checked.
+            ranges = [
+                cell_range
+                for (column, row), cell_range in self.cell_ranges.items()
+                if abs(column - cell_x[0]) <= reach
+                and abs(row - cell_y[0]) <= reach
+            ]
+        if not ranges:
+            return np.empty(0, dtype=object), np.empty(0)
+
+        positions = self.order[
+            np.concatenate([np.arange(start, end) for start, end in ranges])
+        ]
+        distances = np.hypot(
+            self.x[positions] - x[0], self.y[positions] - y[0]
+        )
+        within_radius = distances <= radius_feet
+        positions = positions[within_radius]
+        distances = distances[within_radius]
+
+        nearest_first = np.argsort(distances, kind="stable")
+        positions = positions[nearest_first]
+        return self.parcel_ids[positions], distances[nearest_first]
+
+
+class ParcelLocationCache:
+    """Local cache table of parcel centroids keyed by county and Parcel
+    ID. The centroids are imported from the county parcel files in the
+    parcel file directory, which are CSV files named after their county,
+    such as Sarasota.csv. A county's file is imported again whenever it
+    changes."""
+
+    # The columns of the county parcel files.
+    PARCEL_ID_COLUMN = "PARCEL_ID"
+    LATITUDE_COLUMN = "LATITUDE"
+    LONGITUDE_COLUMN = "LONGITUDE"
+
+    # Bump whenever the cache tables change. The cache can be rebuilt
+    # from the parcel files, so older tables are dropped, not migrated.
+    SCHEMA_VERSION = 2
+
+    def __init__(self, database_path: Path, parcel_file_directory: Path):
+        """Initializes the ParcelLocationCache class.
+
+        Args:
+            database_path (Path): The path to the local cache database.
+            parcel_file_directory (Path): The directory the county
+                parcel files are kept in.
+        """
+        self.parcel_file_directory = parcel_file_directory
+
+        # Parcel files are imported on a worker thread, while the cache
+        # may be read or added to from the main thread.
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            database_path, check_same_thread=False
+        )
+        (schema_version,) = self.connection.execute(
+            "PRAGMA user_version"
+        ).fetchone()
+        if schema_version != self.SCHEMA_VERSION:
+            self.connection.executescript(
+                f"""DROP TABLE IF EXISTS parcel_locations;
+                DROP TABLE IF EXISTS parcel_files;
+                PRAGMA user_version = {self.SCHEMA_VERSION};"""
+            )
+        self.connection.executescript(
+            """CREATE TABLE IF NOT EXISTS parcel_locations (
+                county TEXT NOT NULL,
+                parcel_id TEXT NOT NULL,
+                latitude REAL NOT NULL,
+                longitude REAL NOT NULL,
+                PRIMARY KEY (county, parcel_id)
+            );
+            CREATE TABLE IF NOT EXISTS parcel_files (
+                county TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                modified_time REAL NOT NULL
+            );"""
+        )
+        self.connection.commit()
+        self.load()
+
+    def load(self) -> None:
+        """Loads the cached parcel locations and builds a grid index
+        over each county's parcels."""
+        locations = pd.read_sql(
+            """SELECT county AS County, parcel_id AS [Parcel ID],
+            latitude AS Latitude, longitude AS Longitude
+            FROM parcel_locations""",
+            self.connection,
+        )
+        self.grid_indexes = {
+            county: ParcelGridIndex(county_locations)
+            for county, county_locations in locations.groupby("County")
+        }
+        self.locations = locations.set_index(["County", "Parcel ID"])
+        logging.info(f"Loaded {len(locations)} parcel locations.")
+
+    def get_location(
+        self, county: str, parcel_id: str
+    ) -> Optional[tuple[float, float]]:
+        """Gets the cached location of a parcel.
+
+        Args:
+            county (str): The county the parcel is in.
+            parcel_id (str): The parcel ID.
+
+        Returns:
+            Optional[tuple[float, float]]: The latitude and longitude
+                of the parcel, or None if it is not cached.
+        """
+        key = (county, parcel_id)
+        if key not in self.locations.index:
+            return None
+        location = self.locations.loc[key]
+        return location["Latitude"], location["Longitude"]
+
+    def add_locations(self, county: str, locations: pd.DataFrame) -> int:
+        """Adds parcel locations in a county to the cache, replacing any
+        existing location for the same Parcel ID, and rebuilds the grid
+        indexes.
+
+        Args:
+            county (str): The county the parcels are in.
+            locations (pd.DataFrame): The parcel locations, with Parcel
+                ID, Latitude and Longitude columns.
+
+        Returns:
+            int: The number of locations added.
+        """
+        with self.lock:
+            num_added = self.insert_locations(county, locations)
+            self.connection.commit()
+            self.load()
+        return num_added
+
+    def insert_locations(self, county: str, locations: pd.DataFrame) -> int:
+        """Inserts parcel locations in a county, without committing.
+        Locations with no Parcel ID or coordinates are skipped.
+
+        Args:
+            county (str): The county the parcels are in.
+            locations (pd.DataFrame): The parcel locations, with Parcel
+                ID, Latitude and Longitude columns.
+
+        Returns:
+            int: The number of locations inserted.
+        """
+        locations = locations.dropna(
+            subset=["Parcel ID", "Latitude", "Longitude"]
+        )
+        locations = locations[locations["Parcel ID"] != ""]
+        self.connection.executemany(
+            """INSERT OR REPLACE INTO parcel_locations
+            (county, parcel_id, latitude, longitude) VALUES (?, ?, ?, ?)""",
+            (
+                (county, str(parcel_id), float(latitude), float(longitude))
+                for parcel_id, latitude, longitude in locations[
+                    ["Parcel ID", "Latitude", "Longitude"]
+                ].itertuples(index=False, name=None)
+            ),
+        )
+        return len(locations)
+
+    def import_parcel_files(self, counties: list[str]) -> int:
+        """Imports the parcel file of every county whose file was added
+        or changed since it was last imported. Files not named after one
+        of the counties are skipped.
+
+        Args:
+            counties (list[str]): The county names.
+
+        Returns:
+            int: The number of locations imported.
+        """
+        if not self.parcel_file_directory.is_dir():
+            return 0
+
+        county_names = {county.casefold(): county for county in counties}
+        num_imported = 0
+        for file_path in sorted(self.parcel_file_directory.glob("*.csv")):
+            county = county_names.get(file_path.stem.casefold())
+            if county is None:
+                logging.warning(
+                    f"Skipping {file_path.name}, which is not named after"
+                    " a county."
+                )
+                continue
+            try:
+                num_imported += self.import_parcel_file(file_path, county)
+            except (OSError, ValueError) as e:
+                logging.error(f"Error importing {file_path.name}: {e}")
+        return num_imported
+
+    def import_parcel_file(self, file_path: Path, county: str) -> int:
+        """Imports a county's parcel file, replacing every cached
+        location in the county. Skipped if the file has not changed
+        since it was last imported.
+
+        Args:
+            file_path (Path): The path to the parcel file.
+            county (str): The county the parcels are in.
+
+        Returns:
+            int: The number of locations imported.
+        """
+        file_stat = file_path.stat()
+        file_signature = (file_stat.st_size, file_stat.st_mtime)
+        with self.lock:
+            imported_signature = self.connection.execute(
+                "SELECT size, modified_time FROM parcel_files WHERE"
+                " county = ?",
+                (county,),
+            ).fetchone()
+        if imported_signature == file_signature:
+            return 0
+
+        parcels = pd.read_csv(
+            file_path,
+            usecols=[
+                self.PARCEL_ID_COLUMN,
+                self.LATITUDE_COLUMN,
+                self.LONGITUDE_COLUMN,
+            ],
+            dtype={self.PARCEL_ID_COLUMN: str},
+        )
+        locations = pd.DataFrame(
+            {
+                "Parcel ID": parcels[self.PARCEL_ID_COLUMN].str.strip(),
+                "Latitude": pd.to_numeric(
+                    parcels[self.LATITUDE_COLUMN], errors="coerce"
+                ),
+                "Longitude": pd.to_numeric(
+                    parcels[self.LONGITUDE_COLUMN], errors="coerce"
+                ),
+            }
+        )
+
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM parcel_locations WHERE county = ?", (county,)
+            )
+            num_imported = self.insert_locations(county, locations)
+            self.connection.execute(
+                """INSERT OR REPLACE INTO parcel_files
+                (county, size, modified_time) VALUES (?, ?, ?)""",
+                (county, *file_signature),
+            )
+            self.connection.commit()
+            self.load()
+        logging.info(f"Imported {num_imported} parcel locations for {county}.")
+        return num_imported
+
+    def nearby_parcels(
+        self,
+        county: str,
+        latitude: float,
+        longitude: float,
+        radius_feet: float,
+    ) -> pd.Series:
+        """Gets every cached parcel in the county within the radius of a
+        point.
+
+        Args:
+            county (str): The county to search in.
+            latitude (float): The latitude of the point.
+            longitude (float): The longitude of the point.
+            radius_feet (float): The search radius in feet.
+
+        Returns:
+            pd.Series: The distances in feet, indexed by Parcel ID,
+                nearest first.
+        """
+        grid_index = self.grid_indexes.get(county)
+        if grid_index is None:
+            return pd.Series(dtype=np.float64)
+
+        parcel_ids, distances = grid_index.query_radius(
+            latitude, longitude, radius_feet
+        )
+        return pd.Series(distances, index=parcel_ids, dtype=np.float64)
@@ -0,0 +1,343 @@
+import bisect
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# The app's own code, which callers are looked for in.
+PACKAGE_DIRECTORY = os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
+
+class StatementStatistics:
+    """Running totals and a latency histogram for one statement."""
+
+    def __init__(self, num_buckets: int):
+        """Initializes the StatementStatistics class.
+
+        Args:
+            num_buckets (int): The number of histogram buckets.
+        """
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        # The driver only reports the rows affected by writes. It
+        # reports -1 for SELECT statements, whose fetched rows are
+        # reported by their callers instead.
+        self.affected_rows = 0
+        self.rows_reported = False
+        self.fetched_rows = 0
+        self.fetches_reported = False
+        self.histogram = [0] * num_buckets
+        self.callers = set()
+
+
+class QueryMonitor:
+    """Times every statement run on the engines it is attached to, with
+    the SQLAlchemy cursor execute events. Latencies are aggregated per
+    statement into histograms, and statements slower than the threshold
+    are written to the slow query log along with their caller.
+
+    The driver does not report how many rows a SELECT statement returns,
+    so the code that fetches them reports it with record_fetched_rows,
+    and a slow SELECT is only logged once its rows are reported, or the
+    next statement runs on the same thread."""
+
+    # Upper bounds, in milliseconds, of the latency histogram buckets.
+    # Slower statements go in one more bucket at the end.
+    LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+    DEFAULT_SLOW_QUERY_MS = 500
+
+    SLOW_QUERY_LOGGER_NAME = "DatabaseManager.slow_queries"
+
+    def __init__(
+        self,
+        slow_query_log_path: Optional[Path] = None,
+        slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+    ):
+        """Initializes the QueryMonitor class.
+
+        Args:
+            slow_query_log_path (Optional[Path], optional): The file to
+                write the slow statements to. Slow statements are only
+                logged to the main log if None. Defaults to None.
+            slow_query_ms (float, optional): The latency, in
+                milliseconds, above which a statement is slow. Defaults
+                to DEFAULT_SLOW_QUERY_MS.
+        """
+        self.slow_query_ms = slow_query_ms
+        self.statistics = {}
+        self.lock = threading.Lock()
+        # The last SELECT statement run on each thread, until its
+        # fetched rows are reported.
+        self.local = threading.local()
+
+        self.slow_query_logger = logging.getLogger(self.SLOW_QUERY_LOGGER_NAME)
+        if slow_query_log_path is not None:
+            handler = logging.FileHandler(slow_query_log_path)
+            handler.setFormatter(
+                logging.Formatter("%(asctime)s - %(message)s")
+            )
+            self.slow_query_logger.addHandler(handler)
+            self.slow_query_logger.setLevel(logging.INFO)
+            self.slow_query_logger.propagate = False
+
+    def attach(self, engine: Engine) -> None:
+        """Starts timing the statements run on the engine.
+
+        Args:
+            engine (Engine): The engine to monitor.
+        """
+        event.listen(engine, "before_cursor_execute", self.before_execute)
+        event.listen(engine, "after_cursor_execute", self.after_execute)
+        event.listen(engine, "handle_error", self.handle_error)
+
+    def before_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        """Records when the statement started. The start times are kept
+        on the connection, keyed by cursor, so concurrent connections do
+        not mix."""
+        self.log_pending_read()
+        conn.info.setdefault("query_start_times", {})[
+            id(cursor)
+        ] = time.perf_counter()
+
+    def after_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        """Records the statement's latency, affected rows and caller. A
+        statement that reports no affected rows is kept as this thread's
+        pending read, until its fetched rows are reported."""
+        start_time = conn.info["query_start_times"].pop(id(cursor), None)
+        if start_time is None:
+            return
+        elapsed_seconds = time.perf_counter() - start_time
+        rows = cursor.rowcount if cursor.rowcount >= 0 else None
+        caller = self.get_caller()
+        self.record(statement, elapsed_seconds, rows, caller)
+
+        if rows is None:
+            self.local.pending_read = (statement, elapsed_seconds, caller)
+        else:
+            self.log_slow_query(
+                statement, elapsed_seconds, f", {rows} affected rows", caller
+            )
+
+    def record_fetched_rows(self, rows: int) -> None:
+        """Adds the rows fetched from the last SELECT statement run on
+        this thread to its statistics, and logs the statement if it was
+        slow.
+
+        Args:
+            rows (int): The number of rows fetched.
+        """
+        pending_read = getattr(self.local, "pending_read", None)
+        if pending_read is None:
+            return
+        self.local.pending_read = None
+
+        statement, elapsed_seconds, caller = pending_read
+        with self.lock:
+            statistics = self.statistics.get(statement)
+            if statistics is not None:
+                statistics.fetched_rows += rows
+                statistics.fetches_reported = True
+        self.log_slow_query(
+            statement, elapsed_seconds, f", {rows} fetched rows", caller
+        )
+
+    def log_pending_read(self) -> None:
+        """Logs this thread's pending read if it was slow, without its
+        fetched rows, since they were never reported."""
+        pending_read = getattr(self.local, "pending_read", None)
+        if pending_read is None:
+            return
+        self.local.pending_read = None
+
+        statement, elapsed_seconds, caller = pending_read
+        self.log_slow_query(statement, elapsed_seconds, "", caller)
+
+    def log_slow_query(
+        self,
+        statement: str,
+        elapsed_seconds: float,
+        rows: str,
+        caller: str,
+    ) -> None:
+        """Writes the statement to the slow query log if it was slow.
+
+        Args:
+            statement (str): The SQL that was run.
+            elapsed_seconds (float): How long it took.
+            rows (str): The rows it affected or fetched, to add to the
+                log line.
+            caller (str): Where it was run from.
+        """
+        elapsed_ms = elapsed_seconds * 1000
+        if elapsed_ms >= self.slow_query_ms:
+            self.slow_query_logger.warning(
+                f"{elapsed_ms:.0f} ms{rows}, from {caller}:"
+                f" {' '.join(statement.split())}"
+            )
+
+    def handle_error(self, context) -> None:
+        """Drops the start time of a statement that raised, since it
+        never reaches after_execute."""
+        # The cursor is not always set on the error context, but it is
+        # on the statement's execution context.
+        cursor = getattr(context, "cursor", None) or getattr(
+            context.execution_context, "cursor", None
+        )
+        if context.connection is None or cursor is None:
+            return
+        context.connection.info.get("query_start_times", {}).pop(
+            id(cursor), None
+        )
+
+    def record(
+        self,
+        statement: str,
+        elapsed_seconds: float,
+        rows: Optional[int],
+        caller: str,
+    ) -> None:
+        """Adds a statement's run to its statistics.
+
+        Args:
+            statement (str): The SQL that was run.
+            elapsed_seconds (float): How long it took.
+            rows (Optional[int]): The number of rows it affected, or
+                None if the driver does not report it.
+            caller (str): Where it was run from.
+        """
+        bucket = bisect.bisect_left(
+            self.LATENCY_BUCKETS_MS, elapsed_seconds * 1000
+        )
+        with self.lock:
+            statistics = self.statistics.get(statement)
+            if statistics is None:
+                statistics = StatementStatistics(
+                    len(self.LATENCY_BUCKETS_MS) + 1
+                )
+                self.statistics[statement] = statistics
+            statistics.count += 1
+            statistics.total_seconds += elapsed_seconds
+            statistics.max_seconds = max(
+                statistics.max_seconds, elapsed_seconds
+            )
+            if rows is not None:
+                statistics.affected_rows += rows
+                statistics.rows_reported = True
+            statistics.histogram[bucket] += 1
+            statistics.callers.add(caller)
+
+    @staticmethod
+    def get_caller() -> str:
+        """Gets the first frame in the app's own code that led to the
+        statement, skipping SQLAlchemy, pandas and this module. The app's
+        code is the code in this package's directory.
+
+        Returns:
+            str: The file name, line number and function of the caller.
+        """
+        module_path = os.path.abspath(__file__)
+        frame = sys._getframe(1)
+        while frame is not None:
+            filename = os.path.abspath(frame.f_code.co_filename)
+            if (
+                filename.startswith(PACKAGE_DIRECTORY + os.sep)
+                and filename != module_path
+            ):
+                return (
+                    f"{Path(filename).name}:{frame.f_lineno}"
+                    f" {frame.f_code.co_name}"
+                )
+            frame = frame.f_back
+        return "unknown"
+
+    @property
+    def query_count(self) -> int:
+        """The number of statements run since the last reset."""
+        with self.lock:
+            return sum(
+                statistics.count for statistics in self.statistics.values()
+            )
+
+    @property
+    def total_seconds(self) -> float:
+        """The time spent running statements since the last reset."""
+        with self.lock:
+            return sum(
+                statistics.total_seconds
+                for statistics in self.statistics.values()
+            )
+
+    def reset(self) -> None:
+        """Clears the statistics."""
+        with self.lock:
+            self.statistics = {}
+
+    def summary(self) -> str:
+        """Summarizes the statistics, slowest statements first.
+
+        Returns:
+            str: One block per statement, with its count, total, mean
+                and max latency, affected or fetched rows, callers and
+                latency histogram.
+        """
+        with self.lock:
+            statistics = sorted(
+                self.statistics.items(),
+                key=lambda item: item[1].total_seconds,
+                reverse=True,
+            )
+
+        bucket_labels = [f"<={bound}ms" for bound in self.LATENCY_BUCKETS_MS]
+        bucket_labels.append(f">{self.LATENCY_BUCKETS_MS[-1]}ms")
+
+        lines = [f"{len(statistics)} distinct statements."]
+        for statement, statement_statistics in statistics:
+            mean_ms = (
+                statement_statistics.total_seconds
+                / statement_statistics.count
+                * 1000
+            )
+            callers = ", ".join(sorted(statement_statistics.callers))
+            if statement_statistics.rows_reported:
+                rows = f"{statement_statistics.affected_rows} affected rows"
+            elif statement_statistics.fetches_reported:
+                rows = f"{statement_statistics.fetched_rows} fetched rows"
+            else:
+                rows = "rows not reported"
+            histogram = ", ".join(
+                f"{label}: {count}"
+                for label, count in zip(
+                    bucket_labels, statement_statistics.histogram
+                )
+                if count
+            )
+            lines.extend(
+                [
+                    " ".join(statement.split()),
+                    f"    {statement_statistics.count} runs,"
+                    f" {statement_statistics.total_seconds:.2f}s total,"
+                    f" {mean_ms:.1f} ms mean,"
+                    f" {statement_statistics.max_seconds * 1000:.1f} ms max,"
+                    f" {rows}",
+                    f"    {histogram}",
+                    f"    from {callers}",
+                ]
+            )
+        return "\n".join(lines)
+
+    def log_summary(self) -> None:
+        """Writes the summary to the log."""
+        logging.info(f"Query summary:\n{self.summary()}")
@@ -0,0 +1,163 @@
+import copy
+import logging
+
+import numpy as np
+import pandas as pd
+
+
+class StreetNumberIndex:
+    """Maps each standardized street name to its house numbers, sorted,
+    along with the job data rows they came from. Finding every job
+    within a range of house numbers on the same street is then two
+    binary searches."""
+
+    def __init__(self, addresses: pd.Series, street_keys: pd.Series):
+        """Initializes the StreetNumberIndex class.
+
+        Args:
+            addresses (pd.Series): The uppercased property addresses,
+                which hold the house numbers.
+            street_keys (pd.Series): The processed, standardized
+                addresses. The house number and street suffix are
+                already stripped from these, leaving the street name.
+        """
+        rows, house_numbers, street_keys = self.parse_addresses(
+            addresses, street_keys, np.arange(len(addresses))
+        )
+        street_codes, streets = pd.factorize(street_keys)
+        self.set_entries(rows, house_numbers, street_codes, list(streets))
+
+    @staticmethod
+    def parse_addresses(
+        addresses: pd.Series, street_keys: pd.Series, rows: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Gets the house number and street of every row with both.
+
+        Args:
+            addresses (pd.Series): The uppercased property addresses.
+            street_keys (pd.Series): The processed, standardized
+                addresses.
+            rows (np.ndarray): The job data row of each address.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The rows with a
+                house number and street, their house numbers, and their
+                streets.
+        """
+        house_numbers = pd.to_numeric(
+            addresses.str.extract(r"^(\d+) ", expand=False),
+            errors="coerce",
+        ).to_numpy(dtype=float, na_value=np.nan)
+        street_keys = street_keys.to_numpy(dtype=object)
+
+        has_address = ~np.isnan(house_numbers) & (street_keys != "")
+        return (
+            rows[has_address],
+            house_numbers[has_address].astype(np.int64),
+            street_keys[has_address],
+        )
+
+    def set_entries(
+        self,
+        rows: np.ndarray,
+        house_numbers: np.ndarray,
+        street_codes: np.ndarray,
+        streets: list[str],
+    ) -> None:
+        """Sorts the entries by street, then by house number within each
+        street, and finds where each street's entries start.
+
+        Args:
+            rows (np.ndarray): The job data row of each entry.
+            house_numbers (np.ndarray): The house number of each entry.
+            street_codes (np.ndarray): The street of each entry, as a
+                position in the streets.
+            streets (list[str]): The street names.
+        """
+        order = np.lexsort((house_numbers, street_codes))
+        self.rows = rows[order]
+        self.house_numbers = house_numbers[order]
+        self.street_codes = street_codes[order]
+        self.street_names = streets
+        offsets = np.searchsorted(
+            self.street_codes, np.arange(len(streets) + 1)
+        )
+        self.streets = {
+            street: (offsets[code], offsets[code + 1])
+            for code, street in enumerate(streets)
+        }
+        logging.debug(
+            f"Indexed {len(self.rows)} house numbers on"
+            f" {len(self.streets)} streets."
+        )
+
+    def updated(
+        self,
+        addresses: pd.Series,
+        street_keys: pd.Series,
+        positions: np.ndarray,
+    ) -> "StreetNumberIndex":
+        """Gets a copy of the index with the entries of the rows at the
+        positions replaced. Only the changed addresses are parsed, and
+        this index is left unchanged.
+
+        Args:
+            addresses (pd.Series): The new uppercased property
+                addresses.
+            street_keys (pd.Series): The new processed, standardized
+                addresses.
+            positions (np.ndarray): The job data row of each address.
+
+        Returns:
+            StreetNumberIndex: The updated index.
+        """
+        new_rows, new_house_numbers, new_streets = self.parse_addresses(
+            addresses, street_keys, positions
+        )
+        new_street_codes = pd.Index(self.street_names).get_indexer(
+            new_streets
+        )
+        unseen = new_street_codes < 0
+        unseen_streets = pd.unique(new_streets[unseen])
+        new_street_codes[unseen] = len(self.street_names) + pd.Index(
+            unseen_streets
+        ).get_indexer(new_streets[unseen])
+
+        kept = ~np.isin(self.rows, positions)
+        index = copy.copy(self)
+        index.set_entries(
+            np.concatenate([self.rows[kept], new_rows]),
+            np.concatenate([self.house_numbers[kept], new_house_numbers]),
+            np.concatenate([self.street_codes[kept], new_street_codes]),
+            self.street_names + list(unseen_streets),
+        )
+        return index
+
+    def search(
+        self, street_key: str, house_number: int, house_number_range: int
+    ) -> np.ndarray:
+        """Gets the rows on the street whose house number is within the
+        range of the given house number.
+
+        Args:
+            street_key (str): The processed, standardized street name.
+            house_number (int): The house number to search around.
+            house_number_range (int): How far above and below the house
+                number to search.
+
+        Returns:
+            np.ndarray: The positions of the matching rows in the job
+                data, ordered by house number.
+        """
+        if street_key not in self.streets:
+            return np.empty(0, dtype=np.intp)
+
+        start, end = self.streets[street_key]
+        street_numbers = self.house_numbers[start:end]
+        low = np.searchsorted(
+            street_numbers, house_number - house_number_range, side="left"
+        )
+        high = np.searchsorted(
+            street_numbers, house_number + house_number_range, side="right"
+        )
+        return self.rows[start + low : start + high]
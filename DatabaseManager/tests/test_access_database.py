@@ -0,0 +1,256 @@
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from DatabaseManager.constants import ACCESS_DATABASE, QUERY_MONITOR
+from DatabaseManager.models.access_database import AccessDB, Table
+from DatabaseManager.models.fuzzy_scorer import (
+    PropertyAddressScorer,
+    SubdivisionNameScorer,
+)
+
+# pytest -s -v DatabaseManager/tests/test_access_database.py
+
+
+def test_refresh_without_changes_keeps_job_data() -> None:
+    """Testing that a refresh with nothing new keeps every job row."""
+    num_job_rows = len(ACCESS_DATABASE.all_job_data)
+
+    refreshed_job_data = ACCESS_DATABASE.refresh().result()
+
+    assert len(refreshed_job_data) >= num_job_rows
+    assert ACCESS_DATABASE.all_job_data is refreshed_job_data
+
+
+def test_refresh_replaces_job_rows(test_file_number: str) -> None:
+    """Testing that refreshing a job number replaces its rows, rather
+    than adding them again, and that the search indexes are updated
+    with the job data.
+
+    Args:
+        test_file_number (str): The test file number.
+    """
+    job_data = ACCESS_DATABASE.all_job_data
+    num_job_rows = len(job_data)
+    num_file_rows = (job_data["Job Number"] == test_file_number).sum()
+
+    ACCESS_DATABASE.refresh([test_file_number]).result()
+    job_index = ACCESS_DATABASE.job_index
+    refreshed_job_data = job_index.job_data
+
+    assert len(refreshed_job_data) == num_job_rows
+    assert (
+        refreshed_job_data["Job Number"] == test_file_number
+    ).sum() == num_file_rows
+    assert job_index.search_index.job_data is refreshed_job_data
+
+
+def test_refresh_keeps_archive_rows() -> None:
+    """Testing that refreshing a job number only replaces its Existing
+    Jobs rows, and keeps the archive rows that share the job number."""
+    job_data = ACCESS_DATABASE.all_job_data
+    existing_rows = (
+        job_data[AccessDB.SOURCE_TABLE_COLUMN] == AccessDB.EXISTING_JOBS_TABLE
+    )
+    shared_job_numbers = job_data.loc[~existing_rows, "Job Number"]
+    shared_job_numbers = shared_job_numbers[
+        shared_job_numbers.isin(job_data.loc[existing_rows, "Job Number"])
+    ]
+    if shared_job_numbers.empty:
+        pytest.skip("No archive rows share a job number with Existing Jobs.")
+    job_number = str(shared_job_numbers.iloc[0])
+    num_archive_rows = (shared_job_numbers == job_number).sum()
+
+    ACCESS_DATABASE.refresh([job_number]).result()
+    refreshed_job_data = ACCESS_DATABASE.all_job_data
+    refreshed_archive_rows = (
+        refreshed_job_data[AccessDB.SOURCE_TABLE_COLUMN]
+        != AccessDB.EXISTING_JOBS_TABLE
+    ) & (refreshed_job_data["Job Number"] == job_number)
+
+    assert len(refreshed_job_data) == len(job_data)
+    assert refreshed_archive_rows.sum() == num_archive_rows
+
+
+def test_refreshed_indexes_match_rebuilt_indexes(
+    test_file_number: str, test_address: str, test_subdivision: str
+) -> None:
+    """Testing that the search indexes updated by a refresh find the
+    same rows as indexes built from scratch over the refreshed job data.
+
+    Args:
+        test_file_number (str): The test file number.
+        test_address (str): The test address.
+        test_subdivision (str): The test subdivision.
+    """
+    ACCESS_DATABASE.refresh([test_file_number]).result()
+    job_index = ACCESS_DATABASE.job_index
+    rebuilt_job_index = ACCESS_DATABASE.build_job_index(job_index.job_data)
+
+    searches = [
+        (
+            PropertyAddressScorer(),
+            AccessDB.ADDRESS_SEARCH_KEY_COLUMN,
+            test_address,
+        ),
+        (
+            SubdivisionNameScorer(),
+            AccessDB.SUBDIVISION_SEARCH_KEY_COLUMN,
+            test_subdivision,
+        ),
+    ]
+    for scorer, column, keyword in searches:
+        rows = job_index.search_index.search(scorer, column, keyword)
+        rebuilt_rows = rebuilt_job_index.search_index.search(
+            scorer, column, keyword
+        )
+        assert list(rows) == list(rebuilt_rows)
+
+    street_key = PropertyAddressScorer().process_keyword(test_address)
+    house_number = int(test_address.split(" ")[0])
+    rows = job_index.street_index.search(street_key, house_number, 100)
+    rebuilt_rows = rebuilt_job_index.street_index.search(
+        street_key, house_number, 100
+    )
+    assert sorted(rows) == sorted(rebuilt_rows)
+
+    parcel_ids = job_index.job_data["Parcel ID"].unique()[:100]
+    assert sorted(job_index.parcel_index.search(parcel_ids)) == sorted(
+        rebuilt_job_index.parcel_index.search(parcel_ids)
+    )
+
+
+def test_job_data_uses_compact_dtypes() -> None:
+    """Testing that the job data is stored with compact dtypes, and
+    uses less than half the memory of plain object columns."""
+    job_data = ACCESS_DATABASE.all_job_data
+
+    for column in job_data.columns:
+        if column in AccessDB.CATEGORICAL_COLUMNS:
+            assert isinstance(job_data[column].dtype, pd.CategoricalDtype)
+        else:
+            assert job_data[column].dtype == AccessDB.STRING_DTYPE
+
+    compact_memory_usage = AccessDB.get_memory_usage(job_data)
+    object_memory_usage = AccessDB.get_memory_usage(job_data.astype(object))
+    assert compact_memory_usage < object_memory_usage / 2
+
+
+def test_update_query_binds_values(
+    test_file_entry_data: dict[str, str]
+) -> None:
+    """Testing that updates bind their values rather than formatting
+    them into the SQL, and that the statement is reused for updates of
+    the same columns.
+
+    Args:
+        test_file_entry_data (dict[str, str]): The test file entry data.
+    """
+    table = Table("Existing Jobs", dict(Table.EXISTING_JOBS_SCHEMA))
+    table.set_data("Job Number", test_file_entry_data["Job Number"])
+    table.set_data("Legal Description", "LOT 1 OF O'NEIL'S ADDITION")
+
+    statement = ACCESS_DATABASE.get_statement("UPDATE", table)
+    assert "O'NEIL" not in str(statement)
+    assert ":LegalDescription" in str(statement)
+
+    table.set_data("Legal Description", "LOT 2 OF O'NEIL'S ADDITION")
+    assert ACCESS_DATABASE.get_statement("UPDATE", table) is statement
+    assert ACCESS_DATABASE.run_query(table, "UPDATE", commit=False)
+    ACCESS_DATABASE.session.rollback()
+
+
+def test_bulk_update_reports_each_row(
+    test_file_entry_data: dict[str, str]
+) -> None:
+    """Testing that a bulk update reports each row, and skips the rows
+    without a Job Number.
+
+    Args:
+        test_file_entry_data (dict[str, str]): The test file entry data.
+    """
+    rows = pd.DataFrame(
+        [
+            {
+                "Job Number": test_file_entry_data["Job Number"],
+                "Fieldwork Status": "TEST",
+            },
+            {"Job Number": "", "Fieldwork Status": "TEST"},
+        ]
+    )
+
+    results = ACCESS_DATABASE.bulk_update(
+        "Active Jobs", rows, batch_size=1, commit=False
+    )
+    ACCESS_DATABASE.session.rollback()
+
+    assert results == [True, False]
+
+
+def test_unit_of_work_rolls_back_on_failure(
+    test_file_entry_data: dict[str, str]
+) -> None:
+    """Testing that a failed query in a unit of work rolls back the
+    queries run before it.
+
+    Args:
+        test_file_entry_data (dict[str, str]): The test file entry data.
+    """
+    job_number = test_file_entry_data["Job Number"]
+    existing_job_table = Table(
+        "Existing Jobs", dict(Table.EXISTING_JOBS_SCHEMA)
+    )
+    existing_job_table.set_data("Job Number", job_number)
+    existing_job_table.set_data("Additional Information", "UNIT OF WORK")
+    missing_table = Table("Missing Jobs", {"Job Number": job_number})
+
+    with pytest.raises(Exception):
+        with ACCESS_DATABASE.unit_of_work(commit=False):
+            ACCESS_DATABASE.run_query(existing_job_table, "UPDATE")
+            ACCESS_DATABASE.run_query(missing_table, "UPDATE")
+
+    rows = ACCESS_DATABASE.session.execute(
+        text(
+            "SELECT [Job Number] FROM [Existing Jobs] WHERE"
+            " [Additional Information] = :info"
+        ),
+        {"info": "UNIT OF WORK"},
+    ).fetchall()
+    assert not rows
+
+
+def test_upsert_inserts_then_updates() -> None:
+    """Testing that an upsert inserts a new row, then updates it, and
+    that out of date known keys do not change which query is run."""
+    table = Table("Existing Jobs", dict(Table.EXISTING_JOBS_SCHEMA))
+    table.set_data("Job Number", "99990001")
+    table.set_data("Entry By", "TEST")
+
+    assert ACCESS_DATABASE.upsert(table) == "INSERT"
+    assert ACCESS_DATABASE.upsert(table) == "UPDATE"
+    ACCESS_DATABASE.session.rollback()
+
+    assert ACCESS_DATABASE.upsert(table, known_keys=set()) == "INSERT"
+    assert ACCESS_DATABASE.upsert(table, known_keys=set()) == "UPDATE"
+    assert ACCESS_DATABASE.upsert(table, known_keys={"99990001"}) == "UPDATE"
+    ACCESS_DATABASE.session.rollback()
+
+    assert ACCESS_DATABASE.upsert(table, known_keys={"99990001"}) == "INSERT"
+    ACCESS_DATABASE.session.rollback()
+
+
+def test_query_monitor_times_queries(test_file_number: str) -> None:
+    """Testing that the query monitor records each statement run on the
+    database, along with its caller and the rows it fetched.
+
+    Args:
+        test_file_number (str): The test file number.
+    """
+    query_count = QUERY_MONITOR.query_count
+    ACCESS_DATABASE.key_exists("Existing Jobs", "Job Number", test_file_number)
+
+    assert QUERY_MONITOR.query_count == query_count + 1
+    summary = QUERY_MONITOR.summary()
+    assert "SELECT TOP 1 [Job Number] FROM [Existing Jobs]" in summary
+    assert "access_database.py" in summary
+    assert "fetched rows" in summary
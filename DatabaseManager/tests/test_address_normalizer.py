@@ -0,0 +1,214 @@
+import pandas as pd
+import pytest
+
+from DatabaseManager.constants import ACCESS_DATABASE
+from DatabaseManager.models.address_normalizer import (
+    standardize_address,
+    standardize_addresses,
+)
+
+# pytest -s -v DatabaseManager/tests/test_address_normalizer.py
+
+ADDRESS_CORPUS = [
+    "1234 main street",
+    "741 Emerald Harbor Drive",
+    "1234 Orange Ave",
+    "55 W Main St",
+    "800 N. Tamiami Trl, Unit 4",
+    "12 Bay Rd (Lot 5)",
+    "4107 Pelican Cir",
+    "17 Whitakers Landing Dr",
+    "5710 Lakewood Ranch Blvd",
+    "2201 S. Osprey Ave. Apt. 3",
+    "3300 E State Road 64",
+    "1010 Cortez Rd W",
+    "600 Manatee Ave E",
+    "9 N Orange St",
+    "415 Ft. Hamer Rd.",
+    "1800 Pine Valley Pl.",
+    "7301 Palmer Blvd #201",
+    "100 Cattlemen Rd - Building B",
+    "3901 Bee Ridge Rd (Section 12, Township 36, Range 18)",
+    "Lot 14 Block B Pinecrest Subdivision",
+    "123 Community Ln",
+    "56 Pilot Point Ct",
+    "2600 University Pkwy",
+    "1 Gulf Of Mexico Dr",
+    "4500 US Hwy 301 N",
+    "17 St. Armands Cir.",
+    "8210 Lakewood Main St Unit 102",
+    "N/A",
+    "None",
+    "",
+    "  3125   Clark  Rd  ",
+    "6000 Cortez Road West",
+    "920 Blvd Of The Arts",
+    "1402 W. El Camino Real",
+    "2 John's Pass Dr",
+    "75 I-75 Expy. Exit 217",
+]
+
+
+def legacy_standardize_address(address: str) -> str:
+    """The address standardization that the address normalizer
+    replaced, kept as the reference for its results.
+
+    Args:
+        address (str): The address to standardize.
+
+    Returns:
+        str: The standardized address.
+    """
+    if not address:
+        return ""
+
+    split_address = address.split(" ")
+    if len(split_address) > 1:
+        if split_address[0].isdigit():
+            address = " ".join(split_address[1:])
+
+    address = address.replace("None", "").strip()
+
+    while "(" in address:
+        starting_point = address.index("(")
+        if ")" in address:
+            ending_point = address.index(")")
+        else:
+            ending_point = len(address) - 1
+        address = address[:starting_point] + " " + address[ending_point + 1 :]
+
+    while "  " in address:
+        address = address.replace("  ", " ")
+
+    string_format_abbr = {
+        " ST ": " ",
+        " RD ": " ",
+        " DR ": " ",
+        " AVE ": " ",
+        " BLVD ": " ",
+        " LN ": " ",
+        " CT ": " ",
+        " PL ": " ",
+        " CIR ": " ",
+        " TRL ": " ",
+        " PKWY ": " ",
+        " HWY ": " ",
+        "N.": "NORTH",
+        "S.": "SOUTH",
+        "E.": "EAST",
+        "W.": "WEST",
+        " N ": "NORTH ",
+        " S ": "SOUTH ",
+        " E ": "EAST ",
+        " W ": "WEST ",
+        "ST.": "STREET",
+        "RD.": "ROAD",
+        "DR.": "DRIVE",
+        "AVE.": "AVENUE",
+        "BLVD.": "BOULEVARD",
+        "LN.": "LANE",
+        "CT.": "COURT",
+        "PL.": "PLACE",
+        "CIR.": "CIRCLE",
+        "TRL.": "TRAIL",
+        "PKWY.": "PARKWAY",
+        "HWY.": "HIGHWAY",
+        "EXPY.": "EXPRESSWAY",
+        "#": "",
+        "APT.": "APARTMENT",
+        "UNIT": "APARTMENT",
+        "LOT": "",
+        "BLOCK": "",
+        "SECTION": "",
+        "TOWNSHIP": "",
+        "RANGE": "",
+        "SUBDIVISION": "",
+        "-": "",
+        "  ": " ",
+        ".": "",
+        ",": "",
+        ":": "",
+        ";": "",
+        "'": "",
+    }
+
+    address = address.upper()
+
+    for key, value in string_format_abbr.items():
+        address = address.replace(key, value)
+
+    ending_replacements = {
+        " ST": " STREET",
+        " RD": " ROAD",
+        " DR": " DRIVE",
+        " AVE": " AVENUE",
+        " BLVD": " BOULEVARD",
+        " LN": " LANE",
+        " CT": " COURT",
+        " PL": " PLACE",
+        " CIR": " CIRCLE",
+        " TRL": " TRAIL",
+        " PKWY": " PARKWAY",
+        " HWY": " HIGHWAY",
+        " E": " EAST",
+        " W": " WEST",
+        " N": " NORTH",
+        " S": " SOUTH",
+        " STREET": "",
+        " ROAD": "",
+        " DRIVE": "",
+        " AVENUE": "",
+        " BOULEVARD": "",
+        " LANE": "",
+        " COURT": "",
+        " PLACE": "",
+        " CIRCLE": "",
+        " TRAIL": "",
+        " PARKWAY": "",
+    }
+
+    for key, value in ending_replacements.items():
+        if address.endswith(key):
+            address = address.replace(key, value)
+
+    return address.strip()
+
+
+@pytest.mark.parametrize("address", ADDRESS_CORPUS)
+def test_standardize_address_matches_legacy(address: str) -> None:
+    """Testing that the address normalizer gives the same result as
+    the legacy standardization.
+
+    Args:
+        address (str): The address to standardize.
+    """
+    for variant in (address, address.upper()):
+        assert standardize_address(variant) == legacy_standardize_address(
+            variant
+        )
+
+
+def test_standardize_addresses_matches_legacy() -> None:
+    """Testing that the column form of the address normalizer gives the
+    same results as the legacy standardization."""
+    addresses = pd.Series(ADDRESS_CORPUS * 2, index=range(10, 82))
+    standardized = standardize_addresses(addresses)
+
+    assert standardized.index.equals(addresses.index)
+    assert standardized.tolist() == [
+        legacy_standardize_address(address) for address in addresses
+    ]
+
+
+def test_standardize_addresses_matches_legacy_on_job_data() -> None:
+    """Testing the address normalizer against the legacy
+    standardization on every address in the job data."""
+    addresses = ACCESS_DATABASE.all_job_data["Property Address"].str.upper()
+    standardized = standardize_addresses(addresses)
+
+    mismatches = [
+        (address, result)
+        for address, result in zip(addresses, standardized)
+        if result != legacy_standardize_address(address)
+    ]
+    assert not mismatches, mismatches[:10]
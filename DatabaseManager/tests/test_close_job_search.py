@@ -1,12 +1,37 @@
+import time
+from concurrent.futures import wait
+from pathlib import Path
 from tkinter import TclError
 
+import pandas as pd
 import pytest
 
+from DatabaseManager.constants import ACCESS_DATABASE
+from DatabaseManager.models import close_job_search as close_job_search_model
+from DatabaseManager.models.parcel_locations import ParcelLocationCache
 from DatabaseManager.views.close_job_search import CloseJobSearchView
 
 # pytest -s -v DatabaseManager/tests/test_close_job_search.py
 
 
+def search(close_job_tab: CloseJobSearchView) -> None:
+    """Clicks the search button, and waits for the background search to
+    finish and its results to be shown.
+
+    Args:
+        close_job_tab (CloseJobSearchView): The close job tab.
+    """
+    close_job_tab.buttons["Search"]()
+    model = close_job_tab.model
+    if model.search_future is not None:
+        wait([model.search_future])
+
+    # The results are shown by a poll on the main loop, which is due
+    # within one poll interval of the search finishing.
+    time.sleep(model.SEARCH_POLL_MS / 1000)
+    close_job_tab.update()
+
+
 @pytest.fixture(scope="module")
 def setup_close_job_search_tab_by_address(
     close_job_tab: CloseJobSearchView, test_address: str
@@ -21,7 +46,7 @@ def setup_close_job_search_tab_by_address(
         CloseJobSearchView: The initialized close job tab.
     """
     close_job_tab.inputs["Search Keyword"].insert(0, test_address)
-    close_job_tab.buttons["Search"]()
+    search(close_job_tab)
     yield close_job_tab
     close_job_tab.destroy()
 
@@ -41,7 +66,7 @@ def setup_close_job_search_tab_by_subdivision(
     """
     close_job_tab.inputs["Search Keyword"].insert(0, test_subdivision)
     close_job_tab.inputs["Search Type"].set("Subdivision Name")
-    close_job_tab.buttons["Search"]()
+    search(close_job_tab)
     yield close_job_tab
     close_job_tab.destroy()
 
@@ -54,7 +79,7 @@ def test_close_job_search_tab_empty_search(
     Args:
         close_job_tab (CloseJobSearchView): The close job tab.
     """
-    close_job_tab.buttons["Search"]()
+    search(close_job_tab)
     treeview = close_job_tab.model.tree
 
     assert treeview is None
@@ -152,3 +177,158 @@ def test_close_job_search_tab_clear_button(
 
     assert close_job_tab.inputs["Search Keyword"].get() == ""
     assert treeview is None
+
+
+def test_close_job_search_tab_search_by_nearby_address(
+    close_job_tab: CloseJobSearchView, test_address: str
+) -> None:
+    """Testing functionality of the nearby address search type.
+
+    Args:
+        close_job_tab (CloseJobSearchView): The close job tab.
+        test_address (str): The test address.
+    """
+    close_job_tab.buttons["Clear"]()
+    close_job_tab.inputs["Search Type"].set("Nearby Address")
+    close_job_tab.inputs["Search Keyword"].insert(0, test_address)
+    close_job_tab.inputs["Search Range"].insert(0, "100")
+    search(close_job_tab)
+
+    treeview = close_job_tab.model.tree
+    house_number = int(test_address.split(" ")[0])
+
+    assert treeview is not None
+    for item in treeview.get_children():
+        property_address = treeview.item(item, "values")[1]
+        assert abs(int(property_address.split(" ")[0]) - house_number) <= 100
+
+
+def test_close_job_search_tab_search_by_nearby_parcel(
+    close_job_tab: CloseJobSearchView,
+    test_sarasota_parcel_id: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Testing that the nearby parcel search finds the jobs on the
+    parcels within the search range, nearest first, and only those.
+
+    Args:
+        close_job_tab (CloseJobSearchView): The close job tab.
+        test_sarasota_parcel_id (str): The test parcel id.
+        tmp_path (Path): The temporary directory.
+        monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+    """
+    job_data = ACCESS_DATABASE.all_job_data
+    parcel_ids = job_data["Parcel ID"].astype(str)
+    other_parcel_ids = parcel_ids[
+        (parcel_ids != "") & (parcel_ids != test_sarasota_parcel_id)
+    ].unique()
+    near_parcel_id, far_parcel_id = other_parcel_ids[:2]
+
+    # A degree of latitude is about 364,000 feet.
+    latitude, longitude = 27.3, -82.5
+    parcel_locations = ParcelLocationCache(
+        tmp_path / "parcel_locations.db", tmp_path
+    )
+    parcel_locations.add_locations(
+        "Sarasota",
+        pd.DataFrame(
+            {
+                "Parcel ID": [
+                    test_sarasota_parcel_id,
+                    near_parcel_id,
+                    far_parcel_id,
+                ],
+                "Latitude": [
+                    latitude,
+                    latitude + 200 / 364_000,
+                    latitude + 2_000 / 364_000,
+                ],
+                "Longitude": [longitude] * 3,
+            }
+        ),
+    )
+    monkeypatch.setattr(
+        close_job_search_model, "PARCEL_LOCATIONS", parcel_locations
+    )
+
+    close_job_tab.buttons["Clear"]()
+    close_job_tab.inputs["Search Type"].set("Nearby Parcel")
+    close_job_tab.inputs["County"].set("Sarasota")
+    close_job_tab.inputs["Search Keyword"].insert(0, test_sarasota_parcel_id)
+    close_job_tab.inputs["Search Range"].insert(0, "500")
+    search(close_job_tab)
+
+    treeview = close_job_tab.model.tree
+    assert treeview is not None
+
+    job_numbers = [str(values[0]) for values in treeview.values]
+    parcel_job_numbers = job_data.loc[
+        parcel_ids == test_sarasota_parcel_id, "Job Number"
+    ].astype(str)
+    near_job_numbers = job_data.loc[
+        parcel_ids == near_parcel_id, "Job Number"
+    ].astype(str)
+    assert set(job_numbers) == set(parcel_job_numbers) | set(
+        near_job_numbers
+    )
+
+    # The jobs on the searched parcel are nearest, so they come first.
+    num_parcel_jobs = len(set(parcel_job_numbers))
+    assert set(job_numbers[:num_parcel_jobs]) == set(parcel_job_numbers)
+
+
+def test_close_job_search_tab_caps_search_radius(
+    close_job_tab: CloseJobSearchView, test_sarasota_parcel_id: str
+) -> None:
+    """Testing that a nearby parcel search with a radius above the
+    largest one is not run.
+
+    Args:
+        close_job_tab (CloseJobSearchView): The close job tab.
+        test_sarasota_parcel_id (str): The test parcel id.
+    """
+    model = close_job_tab.model
+    max_radius = model.MAX_SEARCH_RADIUS_FEET
+
+    close_job_tab.buttons["Clear"]()
+    close_job_tab.inputs["Search Type"].set("Nearby Parcel")
+    close_job_tab.inputs["County"].set("Sarasota")
+    close_job_tab.inputs["Search Keyword"].insert(0, test_sarasota_parcel_id)
+    close_job_tab.inputs["Search Range"].insert(0, str(max_radius + 1))
+
+    assert model.prepare_search() is None
+    assert close_job_tab.info_label.cget(
+        "text"
+    ) == model.INFO_LABEL_CODES[10].format(max_range=max_radius)
+
+
+def test_close_job_search_tab_sort_by_job_number(
+    setup_close_job_search_tab_by_subdivision: CloseJobSearchView,
+) -> None:
+    """Testing that the job numbers sort numerically, and that sorting
+    the same column again reverses the order.
+
+    Args:
+        setup_close_job_search_tab_by_subdivision (CloseJobSearchView):
+            The close job tab.
+    """
+    close_job_tab = setup_close_job_search_tab_by_subdivision
+    model = close_job_tab.model
+    treeview = model.tree
+
+    model.sort_treeview(treeview, "Job Number", False)
+    job_numbers = [
+        int(treeview.item(item, "values")[0])
+        for item in treeview.get_children()
+        if str(treeview.item(item, "values")[0]).isdigit()
+    ]
+    assert job_numbers == sorted(job_numbers)
+
+    model.sort_treeview(treeview, "Job Number", True)
+    reversed_job_numbers = [
+        int(treeview.item(item, "values")[0])
+        for item in treeview.get_children()
+        if str(treeview.item(item, "values")[0]).isdigit()
+    ]
+    assert reversed_job_numbers == sorted(reversed_job_numbers, reverse=True)
@@ -3,7 +3,10 @@ from datetime import datetime
 from DatabaseManager.views.file_entry import FileEntryView
 from ttkbootstrap import Entry, Combobox, DateEntry
 from DatabaseManager.constants import ACCESS_DATABASE
-from sqlalchemy import text
+from DatabaseManager.models.access_database import Table
+from DatabaseManager.models.job_number_reservation import (
+    JobNumberReservationError,
+)
 from typing import Generator
 
 
@@ -52,7 +55,8 @@ def test_file_entry_generate_fn_button(file_entry_tab: FileEntryView) -> None:
         map(lambda x: int(strip_non_numeric(x)), current_year_job_numbers)
     )
 
-    new_job_number = job_number_storage.unused_job_number
+    job_number_reservation = file_entry_tab.model.job_number_reservation
+    new_job_number = job_number_reservation.next_job_number()
 
     assert int(new_job_number) > newest_existing_job_number
     assert len(new_job_number) == 8
@@ -63,6 +67,32 @@ def test_file_entry_generate_fn_button(file_entry_tab: FileEntryView) -> None:
     file_entry_tab.model.clear_inputs()
 
 
+def test_file_entry_generate_fn_reports_reservation_error(
+    file_entry_tab: FileEntryView, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Testing that a job number that cannot be reserved is reported,
+    rather than a number another workstation could be given.
+
+    Args:
+        file_entry_tab (FileEntryView): The file entry tab.
+        monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+    """
+    model = file_entry_tab.model
+
+    def next_job_number() -> str:
+        raise JobNumberReservationError("The lock is held.")
+
+    monkeypatch.setattr(
+        model.job_number_reservation, "next_job_number", next_job_number
+    )
+    file_entry_tab.buttons["Generate FN"]()
+
+    assert file_entry_tab.inputs["Job Number"].get() == ""
+    assert file_entry_tab.info_label.cget(
+        "text"
+    ) == model.INFO_LABEL_CODES[19].format()
+
+
 def test_file_entry_submit_button(
     file_entry_tab: FileEntryView, test_file_entry_data: dict[str, str]
 ) -> None:
@@ -91,22 +121,60 @@ def test_file_entry_submit_button(
         elif isinstance(data, DateEntry):
             assert data.entry.get() == test_file_entry_data[input]
 
+    job_number = test_file_entry_data["Job Number"]
+    job_existed = ACCESS_DATABASE.key_exists(
+        "Existing Jobs", "Job Number", job_number
+    )
+
     file_entry_tab.model.submit_job_data(commit=False)
     print(file_entry_tab.info_label.cget("text"))
 
-    # ACCESS_DATABASE.session.flush()
-    result = ACCESS_DATABASE.session.execute(
-        text(
-            f"SELECT * FROM [Existing Jobs] WHERE [Job Number] = \
-'{test_file_entry_data['Job Number']}'",
-        )
+    # The dry run writes the job, then rolls it back.
+    info_codes = file_entry_tab.model.INFO_LABEL_CODES
+    assert file_entry_tab.info_label.cget("text") in {
+        info_codes[code].format(job_number=job_number)
+        for code in (11, 14, 15)
+    }
+    assert (
+        ACCESS_DATABASE.key_exists("Existing Jobs", "Job Number", job_number)
+        == job_existed
     )
-    job = result.fetchone()
 
-    assert (
-        job is not None
-    ), f"Job Number {test_file_entry_data['Job Number']} \
-not found in the database"
+
+def test_file_entry_failed_write_rolls_back_job(
+    file_entry_tab: FileEntryView,
+    test_file_entry_data: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Testing that a job whose Active Jobs row cannot be written is not
+    committed to Existing Jobs either.
+
+    Args:
+        file_entry_tab (FileEntryView): The file entry tab.
+        test_file_entry_data (dict[str, str]): The test file entry data.
+        monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+    """
+    model = file_entry_tab.model
+    job_number = test_file_entry_data["Job Number"]
+    existing_job_table = Table(
+        "Existing Jobs", dict(Table.EXISTING_JOBS_SCHEMA)
+    )
+    existing_job_table.set_data("Job Number", job_number)
+    existing_job_table.set_data("Entry By", "TEST")
+    # A row without a job number cannot be written.
+    active_job_table = Table("Active Jobs", dict(Table.ACTIVE_JOBS_SCHEMA))
+    active_job_table.set_data("Entry By", "TEST")
+
+    commits = []
+    monkeypatch.setattr(
+        ACCESS_DATABASE.session, "commit", lambda: commits.append(True)
+    )
+    model.upsert_job(job_number, existing_job_table, active_job_table)
+
+    assert not commits
+    assert file_entry_tab.info_label.cget("text") == (
+        model.INFO_LABEL_CODES[13].format(job_number=job_number)
+    )
 
 
 def test_file_entry_gather_contacts_button(
@@ -1,4 +1,6 @@
 import pytest
+from DatabaseManager.constants import ACCESS_DATABASE, QUERY_MONITOR
+from DatabaseManager.models.access_database import Table
 from DatabaseManager.views.file_status_checker import FileStatusCheckerView
 from typing import Generator
 
@@ -80,6 +82,106 @@ def test_file_status_checker_lookup_file_button(
     )
 
 
+def test_file_status_checker_get_job_data_runs_one_query(
+    setup_file_status_checker_tab: FileStatusCheckerView,
+    test_file_data: dict[str, str],
+) -> None:
+    """Testing that looking up a job, by file number or by parcel ID,
+    gets all of its records with a single query.
+
+    Args:
+        setup_file_status_checker_tab (FileStatusCheckerView): The file
+            status checker tab.
+        test_file_data (dict[str, str]): The test file data.
+    """
+    model = setup_file_status_checker_tab.model
+
+    for file_number, parcel_id in (
+        (test_file_data["Job Number"], ""),
+        ("", test_file_data["Parcel ID"]),
+    ):
+        query_count = QUERY_MONITOR.query_count
+        _, existing_job_data, _ = model.get_job_data(
+            ACCESS_DATABASE, file_number, parcel_id
+        )
+
+        assert QUERY_MONITOR.query_count == query_count + 1
+        assert existing_job_data[0][0] == test_file_data["Job Number"]
+        assert existing_job_data[0][1] == test_file_data["Parcel ID"]
+
+
+def test_file_status_checker_batch_lookup_is_chunked(
+    setup_file_status_checker_tab: FileStatusCheckerView,
+    test_file_data: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Testing that a batch of job numbers and parcel IDs is looked up
+    with one query per chunk, and that entries that are not found are
+    reported.
+
+    Args:
+        setup_file_status_checker_tab (FileStatusCheckerView): The file
+            status checker tab.
+        test_file_data (dict[str, str]): The test file data.
+        monkeypatch (pytest.MonkeyPatch): Used to shrink the chunks.
+    """
+    model = setup_file_status_checker_tab.model
+    monkeypatch.setattr(model, "BATCH_CHUNK_SIZE", 2)
+    entries = model.parse_batch_entries(
+        f"{test_file_data['Job Number']}\n"
+        f'"{test_file_data["Parcel ID"]}",NOT A FILE\n'
+        f"{test_file_data['Job Number']}"
+    )
+    assert entries == [
+        test_file_data["Job Number"],
+        test_file_data["Parcel ID"],
+        "NOT A FILE",
+    ]
+
+    query_count = QUERY_MONITOR.query_count
+    report = model.get_batch_job_data(ACCESS_DATABASE, entries)
+    assert QUERY_MONITOR.query_count == query_count + 2
+
+    assert list(report.columns) == list(model.BATCH_COLUMNS)
+    for entry in entries:
+        found = set(report.loc[report["Entered"] == entry, "Found"])
+        assert found == ({"No"} if entry == "NOT A FILE" else {"Yes"})
+
+
+def test_file_status_checker_finds_jobs_missing_from_existing_jobs(
+    setup_file_status_checker_tab: FileStatusCheckerView,
+) -> None:
+    """Testing that a job only in Active Jobs is still found, both by
+    itself and in a batch, with empty Existing Jobs data.
+
+    Args:
+        setup_file_status_checker_tab (FileStatusCheckerView): The file
+            status checker tab.
+    """
+    model = setup_file_status_checker_tab.model
+    job_number = "99990003"
+    active_job_table = Table("Active Jobs", dict(Table.ACTIVE_JOBS_SCHEMA))
+    active_job_table.set_data("Job Number", job_number)
+    active_job_table.set_data("Fieldwork Status", "TEST")
+
+    try:
+        assert ACCESS_DATABASE.run_query(
+            active_job_table, "INSERT", commit=False
+        )
+        active_job_data, existing_job_data, _ = model.get_job_data(
+            ACCESS_DATABASE, job_number, ""
+        )
+        report = model.get_batch_job_data(ACCESS_DATABASE, [job_number])
+    finally:
+        ACCESS_DATABASE.session.rollback()
+
+    assert active_job_data[0][1] == "TEST"
+    assert not existing_job_data
+    assert list(report["Found"]) == ["Yes"]
+    assert list(report["File Number"]) == [job_number]
+    assert list(report["Active"]) == ["Yes"]
+
+
 def test_file_status_checker_clear_button(
     setup_file_status_checker_tab: FileStatusCheckerView,
 ) -> None:
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz
+
+from DatabaseManager.models.address_normalizer import standardize_addresses
+from DatabaseManager.models.fuzzy_scorer import (
+    FuzzyScorer,
+    PropertyAddressScorer,
+    SubdivisionNameScorer,
+)
+
+# pytest -s -v DatabaseManager/tests/test_fuzzy_scorer.py
+
+
+def test_process_drops_punctuation_and_accents() -> None:
+    """Testing that values are lowercased, and that punctuation and
+    accented characters are dropped before scoring."""
+    assert FuzzyScorer.process("Café-Main St.") == "caf main st"
+
+
+def test_score_keeps_only_matches_above_cutoff(
+    typo_address_corpus: list[str],
+) -> None:
+    """Testing that the scores are the rounded token sort ratios, and
+    that every candidate scoring below the cutoff is discarded.
+
+    Args:
+        typo_address_corpus (list[str]): The addresses.
+    """
+    choices = FuzzyScorer.process_choices(pd.Series(typo_address_corpus))
+    scorer = FuzzyScorer()
+    keyword = typo_address_corpus[0]
+
+    indices, scores = scorer.score(keyword, choices)
+    expected_scores = np.rint(
+        [
+            fuzz.token_sort_ratio(scorer.process(keyword), choice)
+            for choice in choices
+        ]
+    )
+    expected_indices = np.flatnonzero(
+        expected_scores >= FuzzyScorer.SCORE_CUTOFF
+    )
+
+    assert list(indices) == list(expected_indices)
+    assert list(scores) == list(expected_scores[expected_indices])
+
+
+def test_score_ignores_token_order() -> None:
+    """Testing that the tokens of the keyword can be in any order."""
+    choices = FuzzyScorer.process_choices(
+        pd.Series(["WHITAKERS LANDING", "DREAM ISLAND"])
+    )
+    indices, scores = SubdivisionNameScorer().score(
+        "landing whitakers", choices
+    )
+
+    assert list(indices) == [0]
+    assert list(scores) == [100]
+
+
+def test_property_address_scorer_standardizes_keyword() -> None:
+    """Testing that the address keyword is standardized the same way as
+    the addresses it is scored against."""
+    choices = FuzzyScorer.process_choices(
+        standardize_addresses(pd.Series(["741 Emerald Harbor Drive"]))
+    )
+    indices, scores = PropertyAddressScorer().score(
+        "741 emerald harbor dr", choices
+    )
+
+    assert list(indices) == [0]
+    assert list(scores) == [100]
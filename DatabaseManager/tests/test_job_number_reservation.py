@@ -0,0 +1,182 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from DatabaseManager.constants import ACCESS_DATABASE
+from DatabaseManager.models.job_number_reservation import (
+    JobNumberReservation,
+    JobNumberReservationError,
+)
+from DatabaseManager.models.job_number_storage import JobNumberStorage
+
+# pytest -s -v DatabaseManager/tests/test_job_number_reservation.py
+
+
+@pytest.fixture
+def job_number_storage() -> JobNumberStorage:
+    """Fixture to get a job number storage with an empty cache.
+
+    Returns:
+        JobNumberStorage: The job number storage.
+    """
+    return JobNumberStorage(ACCESS_DATABASE)
+
+
+def get_reservation(
+    tmp_path: Path, job_number_storage: JobNumberStorage, workstation: str
+) -> JobNumberReservation:
+    """Gets a reservation for a workstation, with its ledger in the
+    temporary directory.
+
+    Args:
+        tmp_path (Path): The temporary directory.
+        job_number_storage (JobNumberStorage): The job number storage.
+        workstation (str): The workstation name.
+
+    Returns:
+        JobNumberReservation: The reservation.
+    """
+    reservation = JobNumberReservation(tmp_path, job_number_storage)
+    reservation.workstation = workstation
+    return reservation
+
+
+def test_workstations_get_different_job_numbers(
+    tmp_path: Path, job_number_storage: JobNumberStorage
+) -> None:
+    """Testing that two workstations are never given the same job
+    number, and that a workstation keeps its number until it is used.
+
+    Args:
+        tmp_path (Path): The temporary directory.
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    first = get_reservation(tmp_path, job_number_storage, "FIRST")
+    second = get_reservation(tmp_path, job_number_storage, "SECOND")
+
+    first_job_number = first.next_job_number()
+    second_job_number = second.next_job_number()
+
+    assert first_job_number != second_job_number
+    assert not set(first.block) & set(second.block)
+    assert first.next_job_number() == first_job_number
+    assert first_job_number not in job_number_storage.existing_job_numbers
+    assert not first.lock_path.exists()
+
+
+def test_expired_job_numbers_are_reused(
+    tmp_path: Path, job_number_storage: JobNumberStorage
+) -> None:
+    """Testing that the unused job numbers of an expired lease are given
+    to the next workstation, and that released numbers are too.
+
+    Args:
+        tmp_path (Path): The temporary directory.
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    first = get_reservation(tmp_path, job_number_storage, "FIRST")
+    first.LEASE_SECONDS = 0
+    job_number = first.next_job_number()
+
+    second = get_reservation(tmp_path, job_number_storage, "SECOND")
+    assert second.next_job_number() == job_number
+
+    second.release()
+    third = get_reservation(tmp_path, job_number_storage, "THIRD")
+    assert third.next_job_number() == job_number
+
+
+def test_job_numbers_keep_increasing(
+    tmp_path: Path, job_number_storage: JobNumberStorage
+) -> None:
+    """Testing that an expired number below a job number used since is
+    not handed out again.
+
+    Args:
+        tmp_path (Path): The temporary directory.
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    first = get_reservation(tmp_path, job_number_storage, "FIRST")
+    first.LEASE_SECONDS = 0
+    first.next_job_number()
+    expired_job_numbers = list(first.block)
+
+    # Another workstation uses a number above the expired ones.
+    job_number_storage.add_job_number(expired_job_numbers[-1])
+
+    second = get_reservation(tmp_path, job_number_storage, "SECOND")
+    job_number = second.next_job_number()
+    assert job_number > expired_job_numbers[-1]
+    assert not set(second.block) & set(expired_job_numbers)
+
+
+def test_leased_job_numbers_are_kept_after_higher_number_used(
+    tmp_path: Path, job_number_storage: JobNumberStorage
+) -> None:
+    """Testing that a workstation keeps its leased numbers when another
+    workstation uses a higher number.
+
+    Args:
+        tmp_path (Path): The temporary directory.
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    first = get_reservation(tmp_path, job_number_storage, "FIRST")
+    second = get_reservation(tmp_path, job_number_storage, "SECOND")
+    job_number = first.next_job_number()
+    leased_job_numbers = list(first.block)
+
+    job_number_storage.add_job_number(second.next_job_number())
+
+    assert first.next_job_number() == job_number
+    assert first.block == leased_job_numbers
+
+
+def test_malformed_ledger_is_reported(
+    tmp_path: Path, job_number_storage: JobNumberStorage
+) -> None:
+    """Testing that a malformed ledger is reported as a reservation
+    error, and leaves the lock free.
+
+    Args:
+        tmp_path (Path): The temporary directory.
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    reservation = get_reservation(tmp_path, job_number_storage, "FIRST")
+    job_number = f"{job_number_storage.get_job_number_prefix()}9999"
+    for ledger in [
+        "[]",
+        '{"leases": [], "highest": ""}',
+        f'{{"leases": {{"{job_number}": {{}}}}, "highest": ""}}',
+    ]:
+        reservation.ledger_path.write_text(ledger)
+        with pytest.raises(JobNumberReservationError):
+            reservation.next_job_number()
+        assert not reservation.lock_path.exists()
+
+
+def test_stale_lock_is_removed(
+    tmp_path: Path, job_number_storage: JobNumberStorage
+) -> None:
+    """Testing that no job number is given out while another workstation
+    holds the lock, and that a lock left behind by a crashed workstation
+    is removed.
+
+    Args:
+        tmp_path (Path): The temporary directory.
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    reservation = get_reservation(tmp_path, job_number_storage, "FIRST")
+    reservation.LOCK_TIMEOUT_SECONDS = 0
+    reservation.lock_path.write_text(f"OTHER held {time.time()}")
+
+    with pytest.raises(JobNumberReservationError):
+        reservation.next_job_number()
+    assert not reservation.block
+    assert reservation.lock_path.exists()
+
+    stale_time = time.time() - reservation.STALE_LOCK_SECONDS - 1
+    reservation.lock_path.write_text(f"CRASHED stale {stale_time}")
+    assert reservation.next_job_number() in reservation.block
+    assert not reservation.lock_path.exists()
+    assert not list(tmp_path.glob(f"{reservation.LOCK_FILE_NAME}.*"))
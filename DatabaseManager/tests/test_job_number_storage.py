@@ -0,0 +1,177 @@
+import time
+
+import pytest
+
+from DatabaseManager.constants import ACCESS_DATABASE, QUERY_MONITOR
+from DatabaseManager.models.job_number_storage import JobNumberStorage
+
+# pytest -s -v DatabaseManager/tests/test_job_number_storage.py
+
+
+def legacy_unused_job_number(job_number_storage: JobNumberStorage) -> str:
+    """The job number allocation from before the job numbers were
+    cached, frozen here for the benchmark. Queries every current year
+    job number once per month it looks back.
+
+    Args:
+        job_number_storage (JobNumberStorage): The job number storage.
+
+    Returns:
+        str: The next unused job number.
+    """
+    num_previous_months = 0
+    while num_previous_months < 12:
+        prefix = job_number_storage.get_job_number_prefix(num_previous_months)
+        current_year_jobs = ACCESS_DATABASE.execute_generic_query(
+            f"SELECT [Job Number] FROM [Existing Jobs] WHERE [Job Number] LIKE\
+ '{job_number_storage.year}%'"
+        )
+        job_numbers = [
+            job_number[0]
+            for job_number in current_year_jobs
+            if job_number[0].startswith(prefix)
+        ]
+        if job_numbers:
+            highest_existing_fn = max(job_numbers)
+            last_four_digits = str(int(highest_existing_fn[4:8]) + 1)
+            return (
+                job_number_storage.get_job_number_prefix()
+                + last_four_digits.zfill(4)
+            )
+        num_previous_months += 1
+    return job_number_storage.get_job_number_prefix() + "0100"
+
+
+def measure(allocate) -> tuple[str, int, float]:
+    """Runs a job number allocation, and measures its queries.
+
+    Args:
+        allocate: The allocation to run.
+
+    Returns:
+        tuple[str, int, float]: The job number, the number of queries
+            and the elapsed time in milliseconds.
+    """
+    query_count = QUERY_MONITOR.query_count
+    start_time = time.perf_counter()
+    job_number = allocate()
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    return job_number, QUERY_MONITOR.query_count - query_count, elapsed_ms
+
+
+@pytest.fixture
+def job_number_storage() -> JobNumberStorage:
+    """Fixture to get a job number storage with an empty cache.
+
+    Returns:
+        JobNumberStorage: The job number storage.
+    """
+    return JobNumberStorage(ACCESS_DATABASE)
+
+
+def test_job_numbers_are_cached(
+    job_number_storage: JobNumberStorage, test_file_number: str
+) -> None:
+    """Testing that the job numbers are only fetched once, and that
+    membership checks after that run no queries.
+
+    Args:
+        job_number_storage (JobNumberStorage): The job number storage.
+        test_file_number (str): The test file number.
+    """
+    assert test_file_number in job_number_storage.existing_job_numbers
+
+    query_count = QUERY_MONITOR.query_count
+    for _ in range(10):
+        assert test_file_number in job_number_storage.existing_job_numbers
+    assert QUERY_MONITOR.query_count == query_count
+
+
+def test_job_numbers_are_checked_after_probe_interval(
+    job_number_storage: JobNumberStorage, test_file_number: str
+) -> None:
+    """Testing that an unchanged table is probed, but not fetched again,
+    once the probe interval has passed.
+
+    Args:
+        job_number_storage (JobNumberStorage): The job number storage.
+        test_file_number (str): The test file number.
+    """
+    job_numbers = job_number_storage.existing_job_numbers
+    job_number_storage.STALENESS_PROBE_SECONDS = 0
+
+    query_count = QUERY_MONITOR.query_count
+    assert test_file_number in job_number_storage.existing_job_numbers
+    assert QUERY_MONITOR.query_count == query_count + 1
+    assert job_number_storage.existing_job_numbers is job_numbers
+
+
+def test_add_job_number_updates_cache(
+    job_number_storage: JobNumberStorage,
+) -> None:
+    """Testing that local writes are added to the cached job numbers,
+    and that invalidating the cache drops them.
+
+    Args:
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    job_number = "99990002"
+    assert job_number not in job_number_storage.existing_job_numbers
+    assert job_number not in job_number_storage.active_job_numbers
+
+    job_number_storage.add_job_number(job_number)
+    assert job_number in job_number_storage.existing_job_numbers
+    assert job_number in job_number_storage.active_job_numbers
+
+    job_number_storage.invalidate()
+    assert job_number not in job_number_storage.existing_job_numbers
+
+
+def test_add_job_number_skips_uncached_tables(
+    job_number_storage: JobNumberStorage,
+) -> None:
+    """Testing that a local write does not fetch the job numbers of a
+    table that are not cached yet.
+
+    Args:
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    query_count = QUERY_MONITOR.query_count
+    job_number_storage.add_job_number("99990002")
+
+    assert QUERY_MONITOR.query_count == query_count
+    assert (
+        job_number_storage.get_cached_job_numbers(
+            JobNumberStorage.EXISTING_JOBS_TABLE
+        )
+        is None
+    )
+
+
+def test_unused_job_number_benchmark(
+    job_number_storage: JobNumberStorage,
+) -> None:
+    """Benchmarks the job number allocation against the legacy one, and
+    reports the query count and latency of each.
+
+    Args:
+        job_number_storage (JobNumberStorage): The job number storage.
+    """
+    legacy = measure(lambda: legacy_unused_job_number(job_number_storage))
+    cold = measure(lambda: job_number_storage.unused_job_number)
+    warm = measure(lambda: job_number_storage.unused_job_number)
+
+    for name, (job_number, num_queries, elapsed_ms) in (
+        ("legacy", legacy),
+        ("cold cache", cold),
+        ("warm cache", warm),
+    ):
+        print(
+            f"{name}: {job_number}, {num_queries} queries,"
+            f" {elapsed_ms:.1f} ms"
+        )
+
+    assert cold[0] == legacy[0]
+    assert warm[0] == legacy[0]
+    assert cold[1] <= 2
+    assert warm[1] == 0
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from DatabaseManager.models.address_normalizer import standardize_addresses
+from DatabaseManager.models.fuzzy_scorer import (
+    FuzzyScorer,
+    PropertyAddressScorer,
+)
+from DatabaseManager.models.job_search_index import JobSearchIndex
+
+# pytest -s -v DatabaseManager/tests/test_job_search_index.py
+
+SEARCH_KEY_COLUMN = "Address Search Key"
+
+
+@pytest.fixture(scope="module")
+def job_data(typo_address_corpus: list[str]) -> pd.DataFrame:
+    """Fixture to get job data built from the typo address corpus, with
+    a processed search key column.
+
+    Args:
+        typo_address_corpus (list[str]): The addresses.
+
+    Returns:
+        pd.DataFrame: The job data.
+    """
+    job_data = pd.DataFrame({"Property Address": typo_address_corpus})
+    job_data[SEARCH_KEY_COLUMN] = FuzzyScorer.process_choices(
+        standardize_addresses(job_data["Property Address"])
+    )
+    return job_data
+
+
+def test_search_matches_full_scan(
+    job_data: pd.DataFrame, typo_address_corpus: list[str]
+) -> None:
+    """Testing that a search finds the same rows as scoring every row.
+
+    Args:
+        job_data (pd.DataFrame): The job data.
+        typo_address_corpus (list[str]): The addresses.
+    """
+    search_index = JobSearchIndex(job_data, [SEARCH_KEY_COLUMN])
+    scorer = PropertyAddressScorer()
+
+    for keyword in typo_address_corpus[:100]:
+        full_scan, _ = scorer.score(keyword, job_data[SEARCH_KEY_COLUMN])
+        rows = search_index.search(scorer, SEARCH_KEY_COLUMN, keyword)
+        assert list(rows) == list(full_scan)
+
+
+def test_search_returns_every_row_of_a_matched_value() -> None:
+    """Testing that the rows sharing a matched value are all returned,
+    in order."""
+    job_data = pd.DataFrame(
+        {
+            SEARCH_KEY_COLUMN: [
+                "main st",
+                "orange ave",
+                "main st",
+                "pelican cir",
+                "main st",
+            ]
+        }
+    )
+    search_index = JobSearchIndex(job_data, [SEARCH_KEY_COLUMN])
+    encoded_column = search_index.encoded_columns[SEARCH_KEY_COLUMN]
+
+    assert len(encoded_column.uniques) == 3
+    assert list(encoded_column.rows_for_codes(np.array([0]))) == [0, 2, 4]
+
+    rows = search_index.search(FuzzyScorer(), SEARCH_KEY_COLUMN, "Main St")
+    assert list(rows) == [0, 2, 4]
+
+
+def test_updated_index_matches_rebuilt_index(
+    job_data: pd.DataFrame, typo_address_corpus: list[str]
+) -> None:
+    """Testing that updating the index for replaced and appended rows
+    finds the same rows as an index built from scratch, and leaves the
+    old index unchanged.
+
+    Args:
+        job_data (pd.DataFrame): The job data.
+        typo_address_corpus (list[str]): The addresses.
+    """
+    search_index = JobSearchIndex(job_data, [SEARCH_KEY_COLUMN])
+    changed_rows = pd.DataFrame(
+        {
+            SEARCH_KEY_COLUMN: FuzzyScorer.process_choices(
+                standardize_addresses(
+                    pd.Series(["12 Brand New Way", "40 Brand New Way"])
+                )
+            )
+        }
+    )
+    positions = np.array([5, len(job_data)])
+    updated_job_data = pd.concat(
+        [job_data[[SEARCH_KEY_COLUMN]], changed_rows.iloc[1:]],
+        ignore_index=True,
+    )
+    updated_job_data.iloc[5] = changed_rows.iloc[0]
+
+    updated_index = search_index.updated(updated_job_data, positions)
+    rebuilt_index = JobSearchIndex(updated_job_data, [SEARCH_KEY_COLUMN])
+    scorer = PropertyAddressScorer()
+    for keyword in ["brand new way", *typo_address_corpus[:20]]:
+        assert list(
+            updated_index.search(scorer, SEARCH_KEY_COLUMN, keyword)
+        ) == list(rebuilt_index.search(scorer, SEARCH_KEY_COLUMN, keyword))
+
+    rows = updated_index.search(scorer, SEARCH_KEY_COLUMN, "brand new way")
+    assert list(rows) == [5, len(job_data)]
+    rows = search_index.search(scorer, SEARCH_KEY_COLUMN, "brand new way")
+    assert not len(rows)
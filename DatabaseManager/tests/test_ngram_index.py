@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+from DatabaseManager.models.address_normalizer import standardize_addresses
+from DatabaseManager.models.fuzzy_scorer import FuzzyScorer
+from DatabaseManager.models.ngram_index import NGramIndex
+
+# pytest -s -v DatabaseManager/tests/test_ngram_index.py
+
+
+@pytest.fixture(scope="module")
+def search_keys(typo_address_corpus: list[str]) -> pd.Series:
+    """Fixture to get the distinct processed search keys of the typo
+    address corpus.
+
+    Args:
+        typo_address_corpus (list[str]): The addresses.
+
+    Returns:
+        pd.Series: The processed search keys.
+    """
+    addresses = standardize_addresses(pd.Series(typo_address_corpus))
+    search_keys = FuzzyScorer.process_choices(addresses)
+    return search_keys.drop_duplicates().reset_index(drop=True)
+
+
+def test_pruned_search_matches_full_scan(search_keys: pd.Series) -> None:
+    """Testing that scoring only the candidates finds every key that a
+    full scan finds, for queries with and without typos.
+
+    Args:
+        search_keys (pd.Series): The processed search keys.
+    """
+    ngram_index = NGramIndex(search_keys)
+    ngram_index.MAX_CANDIDATE_FRACTION = 1
+    scorer = FuzzyScorer()
+
+    for query in search_keys.iloc[:200]:
+        full_scan, _ = scorer.score(query, search_keys)
+        candidates = ngram_index.candidates(query, scorer.raw_score_cutoff)
+        matched_indices, _ = scorer.score(
+            query, search_keys.iloc[candidates]
+        )
+        assert list(candidates[matched_indices]) == list(full_scan)
+
+
+def test_candidates_skip_dissimilar_keys() -> None:
+    """Testing that keys too different from the query to reach the score
+    are not candidates."""
+    ngram_index = NGramIndex(
+        ["main st", "gulf of mexico dr", "pelican cir", "main ave"]
+    )
+    ngram_index.MAX_CANDIDATE_FRACTION = 1
+
+    candidates = ngram_index.candidates("st main", 74.5)
+    assert list(candidates) == [0, 3]
+
+
+def test_weak_query_is_fully_scanned() -> None:
+    """Testing that a query that keeps most of the keys is scored
+    against every key instead."""
+    ngram_index = NGramIndex(["main st", "main st n", "main ave"])
+    assert ngram_index.candidates("main st", 74.5) is None
+
+
+def test_ngrams_are_counted() -> None:
+    """Testing that repeated n-grams are counted, and that the tokens
+    are sorted before the n-grams are taken."""
+    ngram_index = NGramIndex([])
+    key = ngram_index.sort_tokens("st  main")
+
+    assert key == "main st"
+    assert ngram_index.ngrams("aa aa") == {
+        " a": 2,
+        "aa": 2,
+        "a ": 2,
+    }
+    assert sum(ngram_index.ngrams(key).values()) == len(key) + 1
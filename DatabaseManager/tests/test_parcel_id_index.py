@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from DatabaseManager.models.parcel_id_index import ParcelIdIndex
+
+# pytest -s -v DatabaseManager/tests/test_parcel_id_index.py
+
+PARCEL_IDS = pd.Series(
+    ["0057150069", "", "0057150070", "0057150069", "0057150071"]
+)
+
+
+def test_search_returns_rows_in_parcel_id_order() -> None:
+    """Testing that every row of each Parcel ID is found, in the order
+    of the Parcel IDs, and that rows without one are left out."""
+    parcel_index = ParcelIdIndex(PARCEL_IDS)
+
+    rows = parcel_index.search(["0057150071", "MISSING", "0057150069"])
+    assert list(rows) == [4, 0, 3]
+    assert not len(parcel_index.search([""]))
+    assert not len(parcel_index.search([]))
+
+
+def test_updated_index_matches_rebuilt_index() -> None:
+    """Testing that updating the index for replaced and appended rows
+    finds the same rows as an index built from scratch, and leaves the
+    old index unchanged."""
+    parcel_index = ParcelIdIndex(PARCEL_IDS)
+    positions = np.array([0, len(PARCEL_IDS)])
+    changed_parcel_ids = pd.Series(["0057150072", "0057150069"])
+    updated_parcel_ids = pd.concat(
+        [PARCEL_IDS, changed_parcel_ids.iloc[1:]], ignore_index=True
+    )
+    updated_parcel_ids.iloc[0] = changed_parcel_ids.iloc[0]
+
+    updated_index = parcel_index.updated(changed_parcel_ids, positions)
+    rebuilt_index = ParcelIdIndex(updated_parcel_ids)
+    parcel_ids = [*PARCEL_IDS, "0057150072"]
+    assert list(updated_index.search(parcel_ids)) == list(
+        rebuilt_index.search(parcel_ids)
+    )
+    assert list(updated_index.search(["0057150069"])) == [3, 5]
+    assert list(parcel_index.search(["0057150069"])) == [0, 3]
@@ -0,0 +1,137 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from DatabaseManager.models.parcel_locations import ParcelLocationCache
+
+# pytest -s -v DatabaseManager/tests/test_parcel_locations.py
+
+COUNTIES = ["Sarasota", "Manatee"]
+
+
+@pytest.fixture
+def parcel_locations(tmp_path: Path) -> ParcelLocationCache:
+    """Fixture to get an empty parcel location cache, with its parcel
+    file directory in the temporary directory.
+
+    Args:
+        tmp_path (Path): The temporary directory.
+
+    Returns:
+        ParcelLocationCache: The parcel location cache.
+    """
+    parcel_file_directory = tmp_path / "parcel_files"
+    parcel_file_directory.mkdir()
+    return ParcelLocationCache(
+        tmp_path / "parcel_locations.db", parcel_file_directory
+    )
+
+
+def write_parcel_file(path: Path, rows: list[str]) -> None:
+    """Writes a county parcel file.
+
+    Args:
+        path (Path): The path to the parcel file.
+        rows (list[str]): The parcel ID, latitude and longitude of each
+            parcel, comma separated.
+    """
+    path.write_text("\n".join(["PARCEL_ID,LATITUDE,LONGITUDE", *rows]))
+
+
+def test_parcel_files_are_keyed_by_county(
+    parcel_locations: ParcelLocationCache,
+) -> None:
+    """Testing that the same Parcel ID in two counties keeps both
+    locations, and that files not named after a county are skipped.
+
+    Args:
+        parcel_locations (ParcelLocationCache): The parcel location
+            cache.
+    """
+    directory = parcel_locations.parcel_file_directory
+    write_parcel_file(directory / "sarasota.csv", ["0057150069,27.3,-82.5"])
+    write_parcel_file(directory / "Manatee.csv", ["0057150069,27.5,-82.6"])
+    write_parcel_file(directory / "Parcels.csv", ["0057150069,28.0,-82.0"])
+
+    assert parcel_locations.import_parcel_files(COUNTIES) == 2
+    assert parcel_locations.get_location("Sarasota", "0057150069") == (
+        27.3,
+        -82.5,
+    )
+    assert parcel_locations.get_location("Manatee", "0057150069") == (
+        27.5,
+        -82.6,
+    )
+    assert parcel_locations.get_location("Lee", "0057150069") is None
+
+
+def test_parcel_file_is_imported_again_when_changed(
+    parcel_locations: ParcelLocationCache,
+) -> None:
+    """Testing that an unchanged parcel file is not imported again, and
+    that a changed one replaces the county's locations.
+
+    Args:
+        parcel_locations (ParcelLocationCache): The parcel location
+            cache.
+    """
+    path = parcel_locations.parcel_file_directory / "Sarasota.csv"
+    write_parcel_file(path, ["0057150069,27.3,-82.5", "0057150070,27.3,"])
+    assert parcel_locations.import_parcel_files(COUNTIES) == 1
+    assert parcel_locations.import_parcel_files(COUNTIES) == 0
+
+    write_parcel_file(path, ["0057150071,27.3001,-82.5"])
+    os.utime(path, (0, 0))
+    assert parcel_locations.import_parcel_files(COUNTIES) == 1
+    assert parcel_locations.get_location("Sarasota", "0057150069") is None
+
+
+def test_nearby_parcels_stay_in_county(
+    parcel_locations: ParcelLocationCache,
+) -> None:
+    """Testing that only the parcels in the county within the radius
+    are found, nearest first.
+
+    Args:
+        parcel_locations (ParcelLocationCache): The parcel location
+            cache.
+    """
+    directory = parcel_locations.parcel_file_directory
+    write_parcel_file(
+        directory / "Sarasota.csv",
+        [
+            "FAR,27.31,-82.5",
+            "NEAR,27.3005,-82.5",
+            "CENTER,27.3,-82.5",
+        ],
+    )
+    write_parcel_file(directory / "Manatee.csv", ["OTHER,27.3,-82.5"])
+    parcel_locations.import_parcel_files(COUNTIES)
+
+    distances = parcel_locations.nearby_parcels("Sarasota", 27.3, -82.5, 500)
+    assert list(distances.index) == ["CENTER", "NEAR"]
+    assert distances["NEAR"] == pytest.approx(182, abs=1)
+    assert parcel_locations.nearby_parcels("Lee", 27.3, -82.5, 500).empty
+
+
+def test_wide_radius_finds_every_parcel_in_range(
+    parcel_locations: ParcelLocationCache,
+) -> None:
+    """Testing that a radius covering more grid cells than have parcels
+    still finds every parcel within it, nearest first.
+
+    Args:
+        parcel_locations (ParcelLocationCache): The parcel location
+            cache.
+    """
+    write_parcel_file(
+        parcel_locations.parcel_file_directory / "Sarasota.csv",
+        ["FAR,27.31,-82.5", "CENTER,27.3,-82.5", "OUTSIDE,27.6,-82.5"],
+    )
+    parcel_locations.import_parcel_files(COUNTIES)
+
+    distances = parcel_locations.nearby_parcels(
+        "Sarasota", 27.3, -82.5, 50_000
+    )
+    assert list(distances.index) == ["CENTER", "FAR"]
@@ -0,0 +1,80 @@
+from typing import Generator
+
+import pandas as pd
+import pytest
+import ttkbootstrap as ttk
+
+from DatabaseManager.main import MainApp
+from DatabaseManager.views.virtual_treeview import VirtualTreeview
+
+# pytest -s -v DatabaseManager/tests/test_virtual_treeview.py
+
+
+@pytest.fixture
+def treeview(main_app: MainApp) -> Generator[VirtualTreeview, None, None]:
+    """Fixture to get a treeview backed by 1000 rows, in its own window.
+
+    Args:
+        main_app (MainApp): The main app.
+
+    Yields:
+        VirtualTreeview: The treeview.
+    """
+    window = ttk.Toplevel(main_app)
+    tree = VirtualTreeview(window, height=10, selectmode="extended")
+    tree["columns"] = ("Job Number",)
+    tree.pack()
+    tree.set_data(pd.DataFrame({"Job Number": [str(n) for n in range(1000)]}))
+    window.update()
+    yield tree
+    window.destroy()
+
+
+def click_row(tree: VirtualTreeview, row: int, state: int = 0) -> None:
+    """Scrolls the row to the top of the view, and clicks it.
+
+    Args:
+        tree (VirtualTreeview): The treeview.
+        row (int): The position of the row.
+        state (int, optional): The modifier keys held. Defaults to 0.
+    """
+    tree.show_rows(row)
+    tree.update()
+    x, y, _, height = tree.bbox(str(row))
+    for event in ("<ButtonPress-1>", "<ButtonRelease-1>"):
+        tree.event_generate(event, x=x + 5, y=y + height // 2, state=state)
+    tree.update()
+
+
+def test_click_replaces_selection_outside_window(
+    treeview: VirtualTreeview,
+) -> None:
+    """Testing that a plain click replaces the selection, including the
+    selected rows that have scrolled out of the window.
+
+    Args:
+        treeview (VirtualTreeview): The treeview.
+    """
+    click_row(treeview, 10)
+    treeview.show_rows(600)
+    treeview.update()
+    window_rows = treeview.order[treeview.window_start : treeview.window_end]
+    assert 10 not in window_rows
+    assert treeview.get_selected_values() == [("10",)]
+
+    click_row(treeview, 600)
+    assert treeview.get_selected_values() == [("600",)]
+
+
+def test_control_click_extends_selection_outside_window(
+    treeview: VirtualTreeview,
+) -> None:
+    """Testing that a Control click adds to the selection, and keeps the
+    selected rows that have scrolled out of the window.
+
+    Args:
+        treeview (VirtualTreeview): The treeview.
+    """
+    click_row(treeview, 10)
+    click_row(treeview, 600, state=VirtualTreeview.CONTROL_MASK)
+    assert treeview.get_selected_values() == [("10",), ("600",)]
@@ -0,0 +1,179 @@
+from pathlib import Path
+from tkinter import Text, filedialog
+
+import ttkbootstrap as ttk
+
+from DatabaseManager.constants import ACCESS_DATABASE
+from DatabaseManager.views.virtual_treeview import VirtualTreeview
+
+
+class BatchFileStatus(ttk.Toplevel):
+    """This class will be used to create a window that will allow the
+    user to look up the status of many files at once, from a pasted list
+    or a CSV file of job numbers or parcel IDs. Inherits from
+    ttk.Toplevel."""
+
+    INFO_LABEL_CODES = {
+        1: "Please paste or load job numbers or parcel IDs.",
+        2: "Found {num_found} of {num_entries} entries.",
+        3: "Error: {error}. Please try again.",
+        4: "Nothing to export. Please check files first.",
+        5: "Exported {num_rows} rows to {file_name}.",
+    }
+
+    def __init__(self, model: object):
+        super().__init__()
+        self.model = model
+        self.title("Batch File Status")
+        self.report = None
+
+        self.buttons = {
+            "Load CSV": self.load_csv,
+            "Check Files": self.check_files,
+            "Export CSV": self.export_csv,
+            "Close": self.destroy,
+        }
+
+        self.create_window_content()
+
+    def create_window_content(self) -> None:
+        """Creates the content for the batch file status window."""
+        ttk.Label(
+            self, text="Job numbers or parcel IDs, one per line:"
+        ).pack(padx=10, pady=5, anchor="w")
+        self.entries_text = Text(self, height=6, width=60)
+        self.entries_text.pack(padx=10, pady=5, fill="x")
+
+        button_frame = ttk.Frame(self)
+        for text, command in self.buttons.items():
+            ttk.Button(button_frame, text=text, command=command).pack(
+                padx=5, side="left"
+            )
+        button_frame.pack(padx=5, pady=5, fill="x")
+
+        tree_frame = ttk.Frame(self)
+        tree = VirtualTreeview(tree_frame, height=15, selectmode="extended")
+        tree["columns"] = self.model.BATCH_COLUMNS
+        tree.column("#0", width=0, stretch="NO")
+        for heading in tree["columns"]:
+            tree.column(heading, anchor="w", width=100)
+            tree.heading(
+                heading,
+                text=heading,
+                anchor="w",
+                command=lambda h=heading: self.sort_treeview(h, False),
+            )
+        tree.column("Property Address", minwidth=150)
+        tree.pack(side="left", fill="both", expand=True)
+
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+        tree.set_scrollbar(scrollbar)
+        tree_frame.pack(padx=10, pady=5, fill="both", expand=True)
+        self.tree = tree
+
+        self.info_label = ttk.Label(self, text="")
+        self.info_label.pack(pady=10, anchor="center")
+
+    def load_csv(self) -> None:
+        """Loads the job numbers and parcel IDs from a CSV file chosen by
+        the user, and checks their status."""
+        path = filedialog.askopenfilename(
+            parent=self,
+            filetypes=[
+                ("CSV files", "*.csv"),
+                ("Text files", "*.txt"),
+                ("All files", "*.*"),
+            ],
+        )
+        if not path:
+            return
+
+        try:
+            entries = self.model.read_batch_file(path)
+        except (OSError, UnicodeDecodeError) as e:
+            self.update_info_label(3, error=e)
+            return
+
+        self.entries_text.delete("1.0", "end")
+        self.entries_text.insert("1.0", "\n".join(entries))
+        self.check_files()
+
+    def check_files(self) -> None:
+        """Looks up the status of every entered job number and parcel
+        ID, and shows them in the table."""
+        entries = self.model.parse_batch_entries(
+            self.entries_text.get("1.0", "end")
+        )
+        if not entries:
+            self.update_info_label(1)
+            return
+
+        try:
+            report = self.model.get_batch_job_data(ACCESS_DATABASE, entries)
+        except Exception as e:
+            self.update_info_label(3, error=e)
+            return
+
+        self.report = report
+        self.tree.set_data(report)
+        num_found = report.loc[report["Found"] == "Yes", "Entered"].nunique()
+        self.update_info_label(
+            2, num_found=num_found, num_entries=len(entries)
+        )
+
+    def export_csv(self) -> None:
+        """Exports the table to a CSV file chosen by the user, in the
+        order it is sorted in."""
+        if self.report is None or self.report.empty:
+            self.update_info_label(4)
+            return
+
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+        )
+        if not path:
+            return
+
+        report = self.report.iloc[self.tree.order]
+        try:
+            self.model.export_batch_report(report, path)
+        except OSError as e:
+            self.update_info_label(3, error=e)
+            return
+        self.update_info_label(
+            5, num_rows=len(report), file_name=Path(path).name
+        )
+
+    def sort_treeview(self, col: str, reverse: bool) -> None:
+        """Sorts the table when the user clicks on a column heading.
+
+        Args:
+            col (str): The column to sort.
+            reverse (bool): Whether to sort in reverse order.
+        """
+        self.tree.sort_by(col, reverse)
+
+        # Reverse sort next time
+        self.tree.heading(
+            col, command=lambda: self.sort_treeview(col, not reverse)
+        )
+
+    def update_info_label(self, code: int, **kwargs) -> None:
+        """Updates the info label with the text from the
+        INFO_LABEL_CODES dictionary.
+
+        Args:
+            code (int): The code for the text to be displayed in the
+                info label.
+            **kwargs: The format arguments.
+        """
+        text = self.INFO_LABEL_CODES[code].format(**kwargs)
+        self.info_label.config(text=text)
+
+    def destroy(self) -> None:
+        """Destroys the batch file status window."""
+        self.model.reset_batch_window()
+        return super().destroy()
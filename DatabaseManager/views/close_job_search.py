@@ -1,5 +1,6 @@
 import ttkbootstrap as ttk
 
+from DatabaseManager.constants import PARCEL_DATA_COUNTIES
 from DatabaseManager.models.close_job_search import CloseJobSearchModel
 from DatabaseManager.views.base_view import BaseView
 
@@ -19,17 +20,29 @@ class CloseJobSearchView(BaseView):
         self.create_header("Close Job Search")
 
         # Input values will be populated in the create_fields method.
-        self.inputs = {"Search Type": None, "Search Keyword": None}
+        self.inputs = {
+            "Search Type": None,
+            "Search Keyword": None,
+            "Search Range": None,
+            "County": None,
+        }
 
         # Dropdown values are used to determine if an input field should
         # be a dropdown or a text field.
         self.dropdowns = {
-            "Search Type": ["Property Address", "Subdivision Name"]
+            "Search Type": [
+                "Property Address",
+                "Subdivision Name",
+                "Nearby Address",
+                "Nearby Parcel",
+            ],
+            "County": PARCEL_DATA_COUNTIES,
         }
         self.create_fields()
 
         # Sets the default value for the dropdown to 'Property Address'.
         self.inputs["Search Type"].current(0)
+        self.inputs["County"].current(0)
 
         # Used to display any info or error messages to the user.
         self.info_label = self.create_status_info_label()
@@ -65,5 +65,6 @@ class FileStatusCheckerView(BaseView):
         self.buttons = {
             "Lookup File": self.model.lookup_file,
             "Clear": self.model.clear_inputs,
+            "Batch Lookup": self.model.create_batch_window,
         }
         self.create_buttons()
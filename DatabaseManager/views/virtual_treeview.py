@@ -0,0 +1,289 @@
+from tkinter import Event
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import ttkbootstrap as ttk
+
+
+class VirtualTreeview(ttk.Treeview):
+    """Treeview backed by a DataFrame. Only the rows around the visible
+    part of the view are inserted as items, and the window of inserted
+    rows follows the view as the user scrolls. The item IDs are the row
+    positions in the backing data, so selections can be mapped back to
+    the data. Inherits from ttk.Treeview."""
+
+    # Number of rows inserted above and below the visible rows.
+    MARGIN = 50
+
+    # Event state bits of the keys that extend a selection on click.
+    SHIFT_MASK = 0x0001
+    CONTROL_MASK = 0x0004
+
+    def __init__(self, master: ttk.Frame, height: int = 15, **kwargs):
+        """Initializes the VirtualTreeview class.
+
+        Args:
+            master (ttk.Frame): The parent widget.
+            height (int, optional): The number of visible rows.
+                Defaults to 15.
+        """
+        super().__init__(master, height=height, **kwargs)
+        self.visible_rows = height
+        self.values = np.empty((0, 0), dtype=object)
+        self.order = np.empty(0, dtype=np.intp)
+        self.window_start = 0
+        self.window_end = 0
+        self.top_row = 0
+        self.sort_orders = {}
+        self.selected_rows = set()
+        self.scrollbar = None
+        self.config(yscrollcommand=self.on_view_scroll)
+        self.bind("<ButtonPress-1>", self.on_click)
+        self.bind("<<TreeviewSelect>>", self.on_select)
+
+    @staticmethod
+    def clean_values(data: pd.DataFrame) -> pd.DataFrame:
+        """Cleans every value for display in one vectorized pass. Runs
+        of spaces are collapsed, the values are stripped and uppercased,
+        and "NONE" is removed.
+
+        Args:
+            data (pd.DataFrame): The values to clean.
+
+        Returns:
+            pd.DataFrame: The cleaned values.
+        """
+        return data.apply(
+            lambda column: column.astype(str)
+            .str.replace(r" {2,}", " ", regex=True)
+            .str.strip()
+            .str.upper()
+            .str.replace("NONE", "", regex=False)
+        )
+
+    def set_scrollbar(self, scrollbar: ttk.Scrollbar) -> None:
+        """Connects the scrollbar to the full backing data, rather than
+        to the inserted rows.
+
+        Args:
+            scrollbar (ttk.Scrollbar): The vertical scrollbar.
+        """
+        self.scrollbar = scrollbar
+        scrollbar.config(command=self.on_scrollbar)
+        self.update_scrollbar()
+
+    def set_data(self, data: pd.DataFrame) -> None:
+        """Replaces the backing data, and shows it from the top. The
+        data must have one column per treeview column.
+
+        Args:
+            data (pd.DataFrame): The rows to show.
+        """
+        self.values = self.clean_values(data[list(self["columns"])]).to_numpy(
+            dtype=object
+        )
+        self.order = np.arange(len(self.values))
+        self.sort_orders = {}
+        self.selection_set(())
+        self.selected_rows = set()
+        self.show_rows(0, reinsert=True)
+
+    @staticmethod
+    def natural_sort_order(column_values: np.ndarray) -> np.ndarray:
+        """Gets the order that sorts the values naturally. Values are
+        sorted by their leading number, as a number, and then by the
+        rest of the value, so job numbers, lots and house numbers sort
+        numerically. Values without a leading number sort last.
+
+        Args:
+            column_values (np.ndarray): The values to sort.
+
+        Returns:
+            np.ndarray: The positions of the values in sorted order.
+        """
+        column_values = pd.Series(column_values, dtype=object)
+        leading_numbers = pd.to_numeric(
+            column_values.str.extract(r"^(\d+)", expand=False),
+            errors="coerce",
+        ).fillna(np.inf)
+        remainders = column_values.str.replace(r"^\d+", "", regex=True)
+        remainder_codes, _ = pd.factorize(remainders, sort=True)
+        return np.lexsort((remainder_codes, leading_numbers.to_numpy()))
+
+    def sort_by(self, column: str, reverse: bool) -> None:
+        """Sorts the backing data by the column, and shows it from the
+        top. The sorted order of each column is cached, so sorting the
+        same column again only reverses it.
+
+        Args:
+            column (str): The column to sort by.
+            reverse (bool): Whether to sort in reverse order.
+        """
+        if column not in self.sort_orders:
+            column_index = list(self["columns"]).index(column)
+            self.sort_orders[column] = self.natural_sort_order(
+                self.values[:, column_index]
+            )
+        self.order = self.sort_orders[column]
+        if reverse:
+            self.order = self.order[::-1]
+        self.show_rows(0, reinsert=True)
+
+    def show_rows(self, top_row: int, reinsert: bool = False) -> None:
+        """Scrolls the view so that the row is at the top, moving the
+        window of inserted rows if it does not cover the view.
+
+        Args:
+            top_row (int): The position of the row in the sorted order.
+            reinsert (bool, optional): Whether to insert the window
+                again even if it covers the view, because the data or
+                its order changed. Defaults to False.
+        """
+        num_rows = len(self.order)
+        top_row = max(0, min(top_row, num_rows - self.visible_rows))
+        window_start = max(0, top_row - self.MARGIN)
+        window_end = min(num_rows, top_row + self.visible_rows + self.MARGIN)
+
+        covers_view = (
+            self.window_start <= window_start and window_end <= self.window_end
+        )
+        if reinsert or not covers_view:
+            self.insert_window(window_start, window_end)
+
+        window_size = max(self.window_end - self.window_start, 1)
+        self.yview_moveto((top_row - self.window_start) / window_size)
+
+    def insert_window(self, window_start: int, window_end: int) -> None:
+        """Replaces the inserted rows with the rows in the window. The
+        selection of the rows that are removed is remembered.
+
+        Args:
+            window_start (int): The first row of the window.
+            window_end (int): The row after the last row of the window.
+        """
+        self.selected_rows = self.get_selected_row_positions()
+        self.delete(*self.get_children())
+
+        self.window_start = window_start
+        self.window_end = window_end
+        for row in self.order[window_start:window_end]:
+            self.insert(
+                "", "end", iid=int(row), values=tuple(self.values[row])
+            )
+
+        selected_in_window = [
+            row
+            for row in self.order[window_start:window_end]
+            if row in self.selected_rows
+        ]
+        if selected_in_window:
+            self.selection_set(selected_in_window)
+
+    def on_view_scroll(self, first: str, last: str) -> None:
+        """Called by the treeview whenever its view changes. Keeps the
+        scrollbar in sync with the full data, and moves the window of
+        inserted rows once the view gets close to its edge.
+
+        Args:
+            first (str): The fraction of the inserted rows above the
+                view.
+            last (str): The fraction of the inserted rows above the
+                bottom of the view.
+        """
+        window_size = self.window_end - self.window_start
+        self.top_row = self.window_start + round(float(first) * window_size)
+        bottom_row = self.window_start + round(float(last) * window_size)
+        self.visible_rows = max(bottom_row - self.top_row, 1)
+        self.update_scrollbar()
+
+        near_window_start = (
+            self.window_start > 0
+            and self.top_row - self.window_start < self.MARGIN // 2
+        )
+        near_window_end = (
+            self.window_end < len(self.order)
+            and self.window_end - bottom_row < self.MARGIN // 2
+        )
+        if near_window_start or near_window_end:
+            self.insert_window(
+                max(0, self.top_row - self.MARGIN),
+                min(len(self.order), bottom_row + self.MARGIN),
+            )
+            window_size = max(self.window_end - self.window_start, 1)
+            self.yview_moveto((self.top_row - self.window_start) / window_size)
+
+    def on_scrollbar(self, action: str, amount: str, unit: str = "") -> None:
+        """Called by the scrollbar when the user drags or clicks it.
+
+        Args:
+            action (str): Either "moveto" or "scroll".
+            amount (str): The fraction to move to, or the number of
+                units or pages to scroll.
+            unit (str, optional): Either "units" or "pages" when
+                scrolling. Defaults to "".
+        """
+        if action == "moveto":
+            top_row = round(float(amount) * len(self.order))
+        elif unit == "pages":
+            top_row = self.top_row + int(amount) * self.visible_rows
+        else:
+            top_row = self.top_row + int(amount)
+        self.show_rows(top_row)
+
+    def update_scrollbar(self) -> None:
+        """Sets the scrollbar to the position of the view in the full
+        data."""
+        if not self.scrollbar:
+            return
+        num_rows = max(len(self.order), 1)
+        first = self.top_row / num_rows
+        last = min(self.top_row + self.visible_rows, num_rows) / num_rows
+        self.scrollbar.set(first, last)
+
+    def on_click(self, event: Event) -> None:
+        """Called before a click selects rows. A click on a row without
+        Shift or Control held replaces the selection, so the selected
+        rows outside the window are dropped.
+
+        Args:
+            event (Event): The click event.
+        """
+        if event.state & (self.SHIFT_MASK | self.CONTROL_MASK):
+            return
+        if self.identify_region(event.x, event.y) in ("tree", "cell"):
+            self.selected_rows = set()
+
+    def on_select(self, _event: Event) -> None:
+        """Called whenever the selection of the inserted rows changes.
+        Keeps the selected rows in step with it.
+
+        Args:
+            _event (Event): The event that triggered this function.
+                Not used.
+        """
+        self.selected_rows = self.get_selected_row_positions()
+
+    def get_selected_row_positions(self) -> set[int]:
+        """Gets the positions of the selected rows in the backing data,
+        including the selected rows that are not currently inserted.
+
+        Returns:
+            set[int]: The positions of the selected rows.
+        """
+        window_rows = set(self.order[self.window_start : self.window_end])
+        selected_outside_window = self.selected_rows - window_rows
+        return selected_outside_window | {int(row) for row in self.selection()}
+
+    def get_selected_values(self) -> Optional[list[tuple]]:
+        """Gets the values of the selected rows, in display order.
+
+        Returns:
+            Optional[list[tuple]]: The values of the selected rows, or
+                None if no rows are selected.
+        """
+        selected_rows = self.get_selected_row_positions()
+        if not selected_rows:
+            return None
+        selected_order = self.order[np.isin(self.order, list(selected_rows))]
+        return [tuple(self.values[row]) for row in selected_order]